@@ -213,6 +213,8 @@ class VispyBaseLayer(ABC):
         """Called whenever the canvas is drawn.
         """
         self.layer.scale_factor = self.scale_factor
+        if self.layer._refresh_pending:
+            self.layer._refresh_view()
 
 
 @lru_cache()
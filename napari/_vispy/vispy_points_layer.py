@@ -67,6 +67,14 @@ class VispyPointsLayer(VispyBaseLayer):
             data = self.layer._view_data
             size = self.layer._view_size
 
+        # Only send the decimated points to the canvas
+        lod_view = self.layer._lod_view
+        if lod_view is not None:
+            data = data[lod_view]
+            size = size[lod_view]
+            edge_color = edge_color[lod_view]
+            face_color = face_color[lod_view]
+
         set_data = self.node._subvisuals[0].set_data
 
         set_data(
@@ -120,3 +128,22 @@ class VispyPointsLayer(VispyBaseLayer):
             )
 
         self.node.update()
+
+    def on_draw(self, event):
+        """Called whenever the canvas is drawn, which happens whenever new
+        data is sent to the canvas or the camera is moved.
+        """
+        super().on_draw(event)
+        if (
+            self.layer.lod_threshold is None
+            or self.layer.dims.ndisplay != 2
+            or self.node.canvas is None
+        ):
+            return
+
+        # Find the data coordinates of the corners of the canvas, offset so
+        # that pixel centers are at 0, and convert to NumPy axis ordering
+        transform = self.node.canvas.scene.node_transform(self.node)
+        corners = transform.map([[0, 0], list(self.node.canvas.size)])
+        corners = corners[:, :2][:, ::-1] - 0.5
+        self.layer._set_lod(self.scale_factor, corners)
@@ -31,6 +31,10 @@ class VispySurfaceLayer(VispyBaseLayer):
             vertices = None
             faces = None
             vertex_values = np.array([0])
+        elif self.layer._lod_view is not None:
+            vertices, faces, vertex_values = self.layer._lod_view
+            # Offseting so pixels now centered
+            vertices = vertices[:, ::-1] + 0.5
         else:
             # Offseting so pixels now centered
             vertices = self.layer._data_view[:, ::-1] + 0.5
@@ -66,6 +70,19 @@ class VispySurfaceLayer(VispyBaseLayer):
     def _on_gamma_change(self, event=None):
         self._on_colormap_change()
 
+    def on_draw(self, event):
+        """Called whenever the canvas is drawn, which happens whenever new
+        data is sent to the canvas or the camera is moved.
+        """
+        super().on_draw(event)
+        if (
+            self.layer.lod_threshold is None
+            or self.layer.dims.ndisplay != 2
+            or self.node.canvas is None
+        ):
+            return
+        self.layer._set_lod(self.scale_factor)
+
     def reset(self, event=None):
         self._reset_base()
         self._on_colormap_change()
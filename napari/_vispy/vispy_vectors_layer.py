@@ -30,3 +30,12 @@ class VispyVectorsLayer(VispyBaseLayer):
             vertices=vertices, faces=faces, color=self.layer.edge_color
         )
         self.node.update()
+
+    def on_draw(self, event):
+        """Called whenever the canvas is drawn, which happens whenever new
+        data is sent to the canvas or the camera is moved.
+        """
+        super().on_draw(event)
+        # Subsample image-like data according to the zoom level in 2D
+        if self.layer.dims.ndisplay == 2:
+            self.layer._set_grid_stride(self.scale_factor)
@@ -125,6 +125,26 @@ def test_contrast_limits():
         assert viewer.layers[i].contrast_limits == clims[i]
 
 
+def test_channels_are_views():
+    """Test channels share memory with the data and get their own ranges."""
+    viewer = ViewerModel()
+    data = np.zeros((15, 10, 3))
+    for i in range(3):
+        data[..., i] = np.linspace(0, i + 1, 150).reshape(15, 10)
+    viewer.add_image(data, channel_axis=-1)
+    for i in range(data.shape[-1]):
+        assert np.shares_memory(viewer.layers[i].data, data)
+        assert viewer.layers[i].contrast_limits == [0, i + 1]
+
+    viewer = ViewerModel()
+    shapes = [(40, 20, 3), (20, 10, 3), (10, 5, 3)]
+    pyramid = [np.random.random(s) for s in shapes]
+    viewer.add_image(pyramid, channel_axis=-1, is_pyramid=True)
+    for i in range(3):
+        for level, d in zip(viewer.layers[i].data, pyramid):
+            assert np.shares_memory(level, d)
+
+
 def test_gamma():
     """Test adding multichannel image with custom gamma."""
     viewer = ViewerModel()
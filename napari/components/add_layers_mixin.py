@@ -1,7 +1,15 @@
 import itertools
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from .. import layers
+from ..layers.image.image_utils import (
+    should_be_pyramid,
+    split_channels,
+    trim_pyramid,
+)
+from ..layers.layer_utils import calc_data_range
 from ..utils import colormaps, io
 from ..utils.misc import ensure_iterable, is_iterable
 
@@ -176,10 +184,17 @@ class AddLayersMixin:
             self.add_layer(layer)
             return layer
         else:
+            # Channels are views of the data, so splitting does not copy it
             if is_pyramid:
-                n_channels = data[0].shape[channel_axis]
+                images = [
+                    list(levels)
+                    for levels in zip(
+                        *[split_channels(d, channel_axis) for d in data]
+                    )
+                ]
             else:
-                n_channels = data.shape[channel_axis]
+                images = split_channels(data, channel_axis)
+            n_channels = len(images)
 
             name = ensure_iterable(name)
 
@@ -194,11 +209,12 @@ class AddLayersMixin:
             else:
                 colormap = ensure_iterable(colormap)
 
-            # If one pair of clim values is passed then need to iterate them to
-            # all layers.
-            if contrast_limits is not None and not is_iterable(
-                contrast_limits[0]
-            ):
+            # If no clim values are passed then estimate them for all channels
+            # in parallel. If one pair of clim values is passed then need to
+            # iterate them to all layers.
+            if contrast_limits is None:
+                contrast_limits = _channel_ranges(images, is_pyramid)
+            elif not is_iterable(contrast_limits[0]):
                 contrast_limits = itertools.repeat(contrast_limits)
             else:
                 contrast_limits = ensure_iterable(contrast_limits)
@@ -206,17 +222,8 @@ class AddLayersMixin:
             gamma = ensure_iterable(gamma)
 
             layer_list = []
-            zipped_args = zip(
-                range(n_channels), colormap, contrast_limits, gamma, name
-            )
-            for i, cmap, clims, _gamma, name in zipped_args:
-                if is_pyramid:
-                    image = [
-                        np.take(data[j], i, axis=channel_axis)
-                        for j in range(len(data))
-                    ]
-                else:
-                    image = np.take(data, i, axis=channel_axis)
+            zipped_args = zip(images, colormap, contrast_limits, gamma, name)
+            for image, cmap, clims, _gamma, name in zipped_args:
                 layer = layers.Image(
                     image,
                     rgb=rgb,
@@ -254,6 +261,7 @@ class AddLayersMixin:
         face_colormap='viridis',
         face_contrast_limits=None,
         n_dimensional=False,
+        lod_threshold=None,
         name=None,
         metadata=None,
         scale=None,
@@ -310,6 +318,12 @@ class AddLayersMixin:
         n_dimensional : bool
             If True, renders points not just in central plane but also in all
             n-dimensions according to specified point marker size.
+        lod_threshold : int, optional
+            Maximum number of points in the current slice that are sent to the
+            canvas. If more points are in the slice they are deterministically
+            decimated according to the current zoom level and field of view, and
+            full detail is restored as the view narrows. If None, all points in
+            the slice are displayed.
         name : str
             Name of the layer.
         metadata : dict
@@ -356,6 +370,7 @@ class AddLayersMixin:
             face_colormap=face_colormap,
             face_contrast_limits=face_contrast_limits,
             n_dimensional=n_dimensional,
+            lod_threshold=lod_threshold,
             name=name,
             metadata=metadata,
             scale=scale,
@@ -555,6 +570,7 @@ class AddLayersMixin:
         colormap='gray',
         contrast_limits=None,
         gamma=1,
+        lod_threshold=None,
         name=None,
         metadata=None,
         scale=None,
@@ -586,6 +602,10 @@ class AddLayersMixin:
             the image.
         gamma : float
             Gamma correction for determining colormap linearity. Defaults to 1.
+        lod_threshold : int, optional
+            Maximum number of faces in the current slice that are sent to the
+            canvas. If more faces are in the slice a decimated mesh is
+            displayed. If None, the full mesh is displayed.
         name : str
             Name of the layer.
         metadata : dict
@@ -613,6 +633,7 @@ class AddLayersMixin:
             colormap=colormap,
             contrast_limits=contrast_limits,
             gamma=gamma,
+            lod_threshold=lod_threshold,
             name=name,
             metadata=metadata,
             scale=scale,
@@ -760,3 +781,34 @@ class AddLayersMixin:
                     "_add_layer_from_data received an unexpected keyword "
                     f"argument ({bad_key}) for layer type {layer_type}"
                 ) from exc
+
+
+def _channel_ranges(images, is_pyramid):
+    """Estimate the contrast limits of the channels of an image in parallel.
+
+    The limits are estimated from the same data the image layer would use,
+    which is the smallest level of a pyramid.
+
+    Parameters
+    ----------
+    images : list of array or list of list of array
+        Data of each channel, or pyramid levels of each channel.
+    is_pyramid : bool
+        Whether the data of each channel is a pyramid.
+
+    Returns
+    -------
+    contrast_limits : list
+        Range of values of each channel, or None for channels that the
+        image layer turns into a pyramid, whose range is left to the layer.
+    """
+
+    def channel_range(image):
+        if is_pyramid:
+            return calc_data_range(trim_pyramid(image)[-1])
+        elif np.any(should_be_pyramid(image.shape)):
+            return None
+        return calc_data_range(image)
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(channel_range, images))
@@ -3,9 +3,14 @@ import pytest
 from dask import array as da
 
 from ..layer_utils import (
+    RowBuffer,
     calc_data_range,
     increment_unnamed_colormap,
+    ranges_to_indices,
+    rasterize_segments,
+    rasterize_triangles,
     segment_normal,
+    subsample_indices,
 )
 
 
@@ -102,3 +107,104 @@ def test_increment_unnamed_colormap():
     # test that named colormaps are not incremented
     named_colormap = 'perfect_colormap'
     assert increment_unnamed_colormap(named_colormap, names) == named_colormap
+
+
+def test_ranges_to_indices():
+    indices = ranges_to_indices([5, 0, 9], [2, 3, 0])
+    np.testing.assert_equal(indices, [5, 6, 0, 1, 2])
+    assert ranges_to_indices([], []).shape == (0,)
+    assert ranges_to_indices([4], [0]).shape == (0,)
+
+
+def test_subsample_indices():
+    np.testing.assert_equal(subsample_indices(5), np.arange(5))
+    np.testing.assert_equal(subsample_indices(5, 10), np.arange(5))
+    indices = subsample_indices(1000, 10)
+    np.testing.assert_equal(indices, np.arange(0, 1000, 100))
+    np.testing.assert_equal(subsample_indices(1000, 10), indices)
+
+
+def test_rasterize_segments():
+    starts = np.array([[1, 1], [0, 7]])
+    ends = np.array([[1, 5], [20, 7]])
+    mask = rasterize_segments(starts, ends, (8, 8))
+    expected = np.zeros((8, 8), dtype=bool)
+    expected[1, 1:6] = True
+    # Segments are clipped to the mask
+    expected[:, 7] = True
+    np.testing.assert_equal(mask, expected)
+
+    mask = rasterize_segments(starts, ends, (8, 8), max_segments=1)
+    np.testing.assert_equal(mask[:, 7], False)
+
+    mask = rasterize_segments(np.empty((0, 2)), np.empty((0, 2)), (8, 8))
+    assert not mask.any()
+
+
+def test_rasterize_triangles():
+    vertices = np.array([[0, 0], [0, 4], [4, 0], [6.2, 6.2], [6.4, 6.3]])
+    # A triangle covering the top left corner and a tiny triangle
+    triangles = np.array([[0, 1, 2], [3, 4, 3]])
+    values = np.array([1, 1, 1, 4, 7])
+    mask, image = rasterize_triangles(vertices, triangles, (8, 8), values)
+    expected = np.zeros((8, 8), dtype=bool)
+    for i in range(4):
+        expected[i, : 4 - i] = True
+    expected[6, 6] = True
+    np.testing.assert_equal(mask, expected)
+    np.testing.assert_equal(image[:4, 0], 1)
+    np.testing.assert_equal(image[6, 6], 5)
+
+    # Vertices are transformed into pixels of the mask
+    mask, _ = rasterize_triangles(
+        vertices + 10, triangles[:1], (16, 16), offset=10, scale=2
+    )
+    assert mask[:8, 0].all()
+    assert not mask[8:].any()
+
+    mask, _ = rasterize_triangles(vertices, triangles, (8, 8), max_triangles=1)
+    assert not mask[6, 6]
+
+
+def test_row_buffer():
+    buffer = RowBuffer(np.zeros((2, 3)))
+    array = buffer.extend(np.ones((3, 3)))
+    assert buffer.holds(array)
+    assert not buffer.holds(array.copy())
+    np.testing.assert_equal(array, [[0] * 3] * 2 + [[1] * 3] * 3)
+
+    # Growing past the allocated rows keeps the data
+    rows = np.arange(300).reshape(100, 3)
+    array = buffer.extend(rows)
+    assert len(array) == 105
+    np.testing.assert_equal(array[5:], rows)
+
+    # Dropping from the front and appending again compacts the buffer
+    for i in range(50):
+        buffer.drop(10)
+        array = buffer.extend(np.full((10, 3), i))
+    assert len(array) == 105
+    np.testing.assert_equal(array[-10:], 49)
+    np.testing.assert_equal(array[-20:-10], 48)
+
+    # Appending a wider dtype recasts the buffer
+    buffer = RowBuffer(np.array(['a', 'b']))
+    array = buffer.extend(np.array(['ccc']))
+    np.testing.assert_equal(array, ['a', 'b', 'ccc'])
+
+
+def test_row_buffer_keeps_views():
+    """Test views handed out by the buffer are not modified later."""
+    buffer = RowBuffer(np.arange(16)[:, np.newaxis])
+    held = buffer.extend(np.arange(16, 28)[:, np.newaxis])
+    expected = held.copy()
+
+    buffer.drop(26)
+    array = buffer.extend(np.arange(28, 33)[:, np.newaxis])
+    np.testing.assert_equal(held, expected)
+    np.testing.assert_equal(array[:, 0], np.arange(26, 33))
+
+    for _ in range(10):
+        buffer.drop(5)
+        buffer.extend(np.full((5, 1), -1))
+    np.testing.assert_equal(held, expected)
@@ -1,4 +1,5 @@
 import os
+import time
 import warnings
 
 from abc import ABC, abstractmethod
@@ -14,6 +15,7 @@ from ...utils.keybindings import KeymapMixin
 from ...utils.misc import ROOT_DIR
 from ...utils.naming import magic_name
 from ...utils.status_messages import status_format, format_float
+from ..layer_utils import RowBuffer
 from ..transforms import ScaleTranslate
 
 
@@ -106,6 +108,9 @@ class Layer(KeymapMixin, ABC):
         * `_basename()`: base/default name of the layer
     """
 
+    # Minimum time in seconds between refreshes of streamed data
+    _min_refresh_interval = 1 / 60
+
     def __init__(
         self,
         data,
@@ -137,6 +142,10 @@ class Layer(KeymapMixin, ABC):
         self._interactive = True
         self._value = None
         self.scale_factor = 1
+        self._refresh_pending = False
+        self._last_refresh = 0
+        # Growth buffers of arrays that data is streamed into
+        self._buffers = {}
 
         self.dims = Dims(ndim)
 
@@ -599,10 +608,99 @@ class Layer(KeymapMixin, ABC):
         """
         if self.visible:
             self._set_view_slice()
-            self.events.set_data()
-            self._update_thumbnail()
-            self._update_coordinates()
-            self._set_highlight(force=True)
+            self._refresh_view()
+
+    def _refresh_view(self):
+        """Send the current view slice to the visual and update the
+        thumbnail, coordinates and highlights.
+        """
+        self._refresh_pending = False
+        self._last_refresh = time.perf_counter()
+        self.events.set_data()
+        self._update_thumbnail()
+        self._update_coordinates()
+        self._set_highlight(force=True)
+
+    def _schedule_refresh(self):
+        """Refresh the view at most once every `_min_refresh_interval` seconds.
+
+        Used when data is streamed into the layer and the view slice has
+        already been updated. If the last refresh happened less than
+        `_min_refresh_interval` seconds ago, the refresh is deferred until the
+        next time the canvas is drawn. Without a canvas a deferred refresh is
+        only sent on the next call to `refresh`.
+        """
+        if not self.visible:
+            return
+        elapsed = time.perf_counter() - self._last_refresh
+        if elapsed >= self._min_refresh_interval:
+            self._refresh_view()
+        else:
+            self._refresh_pending = True
+            self.events.refresh()
+
+    def _extend_buffer(self, key, array, rows):
+        """Append rows to a layer array using an amortized growth buffer.
+
+        Parameters
+        ----------
+        key : hashable
+            Name of the buffer.
+        array : np.ndarray
+            Current value of the layer array. If it is not the array last
+            returned for this buffer, the buffer is rebuilt from it.
+        rows : np.ndarray
+            Rows to append.
+
+        Returns
+        -------
+        array : np.ndarray
+            New value of the layer array.
+        """
+        buffer = self._buffers.get(key)
+        if buffer is None or not buffer.holds(array):
+            buffer = RowBuffer(array)
+            self._buffers[key] = buffer
+        return buffer.extend(rows)
+
+    def _drop_buffer(self, key, array, n):
+        """Remove the first n rows of a layer array.
+
+        Parameters
+        ----------
+        key : hashable
+            Name of the buffer.
+        array : np.ndarray
+            Current value of the layer array.
+        n : int
+            Number of rows to remove.
+
+        Returns
+        -------
+        array : np.ndarray
+            New value of the layer array.
+        """
+        buffer = self._buffers.get(key)
+        if buffer is None or not buffer.holds(array):
+            return array[n:]
+        return buffer.drop(n)
+
+    def _extend_range(self, extent, reset=False):
+        """Grow the range of the dims to include the extent of new data.
+
+        Parameters
+        ----------
+        extent : list of tuple
+            Minimum, maximum and step of the new data along each dimension.
+        reset : bool
+            If True, the range is set to the extent instead of grown.
+        """
+        for i, (e, s) in enumerate(zip(extent, self.scale)):
+            r = (s * e[0], s * e[1], s)
+            if not reset:
+                old = self.dims.range[i]
+                r = (min(old[0], r[0]), max(old[1], r[1]), s)
+            self.dims.set_range(i, r)
 
     def _update_coordinates(self):
         """Insert the cursor position into the correct position in the
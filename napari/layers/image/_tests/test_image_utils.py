@@ -8,6 +8,7 @@ from napari.layers.image.image_utils import (
     guess_pyramid,
     guess_rgb,
     should_be_pyramid,
+    split_channels,
     trim_pyramid,
 )
 
@@ -208,3 +209,38 @@ def test_fast_pyramid():
         ]
     )
     assert len(pyramid) == 7
+
+
+class _ArrayLike:
+    """Array-like that is not a numpy or dask array."""
+
+    def __init__(self, data):
+        self.data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.ndim = data.ndim
+
+    def __getitem__(self, key):
+        return self.data[key]
+
+
+def test_split_channels():
+    data = np.random.random((10, 3, 15))
+    channels = split_channels(data, 1)
+    assert len(channels) == 3
+    for i, channel in enumerate(channels):
+        assert np.shares_memory(channel, data)
+        np.testing.assert_equal(channel, data[:, i])
+
+    channels = split_channels(data, -1)
+    assert len(channels) == 15
+    np.testing.assert_equal(channels[4], data[..., 4])
+
+    channels = split_channels(da.from_array(data), 0)
+    assert all(isinstance(c, da.Array) for c in channels)
+    np.testing.assert_equal(channels[2].compute(), data[2])
+
+    # Other arrays are only read when the channels are
+    channels = split_channels(_ArrayLike(data), 1)
+    assert all(isinstance(c, da.Array) for c in channels)
+    np.testing.assert_equal(np.asarray(channels[1]), data[:, 1])
@@ -1,3 +1,4 @@
+import dask.array as da
 import numpy as np
 from scipy import ndimage as ndi
 
@@ -48,6 +49,36 @@ def trim_pyramid(pyramid):
         return pyramid[:2]
 
 
+def split_channels(data, channel_axis):
+    """Split an array into its channels without copying it.
+
+    Numpy arrays are split into strided views and dask arrays into lazy
+    arrays, so that splitting takes constant time and memory. Other arrays,
+    such as zarr arrays, are wrapped in dask arrays so that they are only
+    read when sliced.
+
+    Parameters
+    ----------
+    data : array
+        Data to split.
+    channel_axis : int
+        Axis of the channels, negative values count from the end.
+
+    Returns
+    -------
+    channels : list of array
+        Data of each channel, with the channel axis removed.
+    """
+    if not isinstance(data, (np.ndarray, da.Array)):
+        chunks = getattr(data, 'chunks', None) or 'auto'
+        data = da.from_array(data, chunks=chunks)
+    axis = channel_axis % data.ndim
+    return [
+        data[(slice(None),) * axis + (i,)]
+        for i in range(data.shape[channel_axis])
+    ]
+
+
 def should_be_pyramid(shape):
     """Check if any data axes needs to be pyramidified
 
@@ -105,3 +105,310 @@ def segment_normal(a, b, p=(0, 0, 1)):
     unit_norm = normal / norm
 
     return unit_norm
+
+
+def ranges_to_indices(starts, counts):
+    """Concatenate a set of integer ranges into a single index array.
+
+    Parameters
+    ----------
+    starts : (N,) array
+        First index of each range.
+    counts : (N,) array
+        Number of indices in each range.
+
+    Returns
+    -------
+    indices : (M,) array
+        Indices of all the ranges in order, where M is the sum of counts.
+    """
+    starts = np.asarray(starts, dtype=int)
+    counts = np.asarray(counts, dtype=int)
+    ends = np.cumsum(counts)
+    if len(ends) == 0 or ends[-1] == 0:
+        return np.empty(0, dtype=int)
+    # Shift the running count within each range onto the range start
+    shifts = np.repeat(starts - (ends - counts), counts)
+    return np.arange(ends[-1]) + shifts
+
+
+def subsample_indices(n, max_n=None):
+    """Evenly spaced indices of at most `max_n` items out of `n`.
+
+    The subsample is deterministic, so that repeated calls on the same data
+    keep the same items.
+
+    Parameters
+    ----------
+    n : int
+        Number of items.
+    max_n : int, optional
+        Maximum number of items to keep. If None all items are kept.
+
+    Returns
+    -------
+    indices : (M,) array
+        Sorted indices of the items kept.
+    """
+    if max_n is None or n <= max_n:
+        return np.arange(n)
+    return (np.arange(max_n) * n) // max_n
+
+
+def rasterize_segments(starts, ends, shape, max_segments=None):
+    """Draw line segments into a small boolean mask.
+
+    Each segment is sampled once per pixel along its longest axis, and the
+    pixels containing the samples are set.
+
+    Parameters
+    ----------
+    starts : (N, 2) array
+        Start points of the segments, in pixels of the mask.
+    ends : (N, 2) array
+        End points of the segments, in pixels of the mask.
+    shape : 2-tuple of int
+        Shape of the mask.
+    max_segments : int, optional
+        Maximum number of segments drawn. If more segments are given an
+        evenly spaced subsample of them is drawn.
+
+    Returns
+    -------
+    mask : array of bool
+        Mask of the pixels covered by the segments.
+    """
+    mask = np.zeros(shape, dtype=bool)
+    keep = subsample_indices(len(starts), max_segments)
+    if len(keep) == 0:
+        return mask
+    upper = np.subtract(shape, 1)
+    starts = np.clip(np.asarray(starts, dtype=float)[keep], 0, upper)
+    ends = np.clip(np.asarray(ends, dtype=float)[keep], 0, upper)
+
+    counts = np.ceil(np.abs(ends - starts).max(axis=1)).astype(int) + 1
+    segments = np.repeat(np.arange(len(keep)), counts)
+    steps = ranges_to_indices(np.zeros(len(keep)), counts)
+    fractions = steps / np.maximum(counts - 1, 1)[segments]
+    points = (
+        starts[segments] + fractions[:, np.newaxis] * (ends - starts)[segments]
+    )
+    points = points.astype(int)
+    mask[points[:, 0], points[:, 1]] = True
+    return mask
+
+
+# Average number of pixel centers tested per pixel of the mask when drawing
+# triangles
+_MAX_TESTS_PER_PIXEL = 16
+
+
+def rasterize_triangles(
+    vertices,
+    triangles,
+    shape,
+    values=None,
+    offset=0,
+    scale=1,
+    max_triangles=None,
+):
+    """Draw triangles into a small mask and image of triangle values.
+
+    A pixel is covered by a triangle when its center lies in the triangle.
+    The pixel containing the centroid of each triangle is also covered, so
+    that triangles smaller than a pixel are not lost. Later triangles are
+    drawn over earlier ones. When the triangles are too large to be filled
+    quickly, only an evenly spaced subsample of them is filled.
+
+    Parameters
+    ----------
+    vertices : (N, 2) array
+        Vertices of the triangles. Pixels of the mask are at
+        `(vertices - offset) * scale`.
+    triangles : (M, 3) array of int
+        Indices of the vertices of each triangle.
+    shape : 2-tuple of int
+        Shape of the mask.
+    values : (N,) array, optional
+        Value of each vertex. Each triangle is drawn with the mean value of
+        its vertices.
+    offset : float or (2,) array
+        Coordinates of the vertices at the corner of the mask.
+    scale : float or (2,) array
+        Size of a vertex coordinate unit in pixels of the mask.
+    max_triangles : int, optional
+        Maximum number of triangles drawn. If more triangles are given an
+        evenly spaced subsample of them is drawn.
+
+    Returns
+    -------
+    mask : array of bool
+        Mask of the pixels covered by the triangles.
+    image : array of float
+        Value of the triangle drawn at each pixel, 0 where no triangle is
+        drawn or if `values` is None.
+    """
+    mask = np.zeros(shape, dtype=bool)
+    image = np.zeros(shape)
+    keep = subsample_indices(len(triangles), max_triangles)
+    if len(keep) == 0:
+        return mask, image
+    triangles = np.asarray(triangles, dtype=int)[keep]
+    # Only the vertices of the triangles drawn are transformed
+    corners = (np.asarray(vertices)[triangles] - offset) * scale
+    if values is None:
+        triangle_values = np.zeros(len(triangles))
+    else:
+        triangle_values = np.asarray(values)[triangles].mean(axis=1)
+
+    # Pixels whose centers are in the bounding box of each triangle
+    lower = np.clip(np.ceil(corners.min(axis=1) - 0.5), 0, shape)
+    upper = np.clip(np.floor(corners.max(axis=1) - 0.5) + 1, 0, shape)
+    sizes = np.maximum(upper - lower, 0).astype(int)
+    counts = sizes[:, 0] * sizes[:, 1]
+    # Bound the number of pixels tested by only filling an evenly spaced
+    # subsample of large triangles, the others are drawn at their centroid
+    stride = int(np.ceil(counts.sum() / (_MAX_TESTS_PER_PIXEL * mask.size)))
+    if stride > 1:
+        counts[np.arange(len(counts)) % stride > 0] = 0
+    ids = np.repeat(np.arange(len(triangles)), counts)
+    steps = ranges_to_indices(np.zeros(len(triangles)), counts)
+    pixels = lower[ids].astype(int)
+    pixels[:, 0] += steps // sizes[ids, 1]
+    pixels[:, 1] += steps % sizes[ids, 1]
+
+    # Keep the centers on the same side of the three triangle edges
+    centers = pixels + 0.5
+    a, b, c = (corners[ids, i] for i in range(3))
+    sides = np.stack(
+        [_edge_side(p, q, centers) for p, q in [(a, b), (b, c), (c, a)]],
+        axis=1,
+    )
+    inside = np.all(sides >= 0, axis=1) | np.all(sides <= 0, axis=1)
+    pixels, ids = pixels[inside], ids[inside]
+
+    # Add the pixels of the centroids, drawing them first
+    centroids = np.clip(corners.mean(axis=1), 0, np.subtract(shape, 1)).astype(
+        int
+    )
+    pixels = np.concatenate([centroids, pixels])
+    ids = np.concatenate([np.arange(len(triangles)), ids])
+    order = np.argsort(ids, kind='stable')
+    pixels, ids = pixels[order], ids[order]
+
+    mask[pixels[:, 0], pixels[:, 1]] = True
+    image[pixels[:, 0], pixels[:, 1]] = triangle_values[ids]
+    return mask, image
+
+
+def _edge_side(a, b, points):
+    """Signed area telling which side of the lines a-b the points are on."""
+    return (b[:, 0] - a[:, 0]) * (points[:, 1] - a[:, 1]) - (
+        b[:, 1] - a[:, 1]
+    ) * (points[:, 0] - a[:, 0])
+
+
+class RowBuffer:
+    """Array of rows supporting amortized appends and removals from the front.
+
+    Rows are stored in a preallocated buffer that grows geometrically, so that
+    appending M rows costs O(M) amortized instead of copying the whole array.
+    When rows are removed from the front the start of the view is moved, and
+    the live rows are only copied to a new buffer once the buffer is full.
+    Rows that have been handed out are never overwritten, so views returned
+    by earlier calls stay valid.
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Initial rows of the buffer. They are copied into the buffer.
+
+    Attributes
+    ----------
+    array : np.ndarray
+        View of the live rows of the buffer. It is replaced after every
+        append or removal.
+    """
+
+    # Minimum number of rows allocated for a buffer
+    _min_rows = 16
+
+    def __init__(self, array):
+        array = np.asarray(array)
+        self._buffer = np.empty(
+            (max(2 * len(array), self._min_rows),) + array.shape[1:],
+            dtype=array.dtype,
+        )
+        self._buffer[: len(array)] = array
+        self._start = 0
+        self._stop = len(array)
+        self.array = self._buffer[self._start : self._stop]
+
+    def holds(self, array):
+        """Whether `array` is the current view of the live rows.
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Array to check.
+
+        Returns
+        -------
+        holds : bool
+            False if the array has been replaced since the last update, in
+            which case the buffer is out of date.
+        """
+        return array is self.array
+
+    def extend(self, rows):
+        """Append rows to the end of the buffer.
+
+        Parameters
+        ----------
+        rows : np.ndarray
+            Rows to append. Their trailing shape must match the buffer.
+
+        Returns
+        -------
+        array : np.ndarray
+            View of the live rows.
+        """
+        rows = np.asarray(rows)
+        dtype = np.result_type(self._buffer.dtype, rows.dtype)
+        nlive = self._stop - self._start
+        nrows = nlive + len(rows)
+        if dtype != self._buffer.dtype or self._stop + len(rows) > len(
+            self._buffer
+        ):
+            # Copy the live rows to the front of a new buffer with room for
+            # as many rows again, so that copies stay infrequent. The old
+            # buffer is never written to, as views of it may still be in use.
+            buffer = np.empty(
+                (max(2 * nrows, self._min_rows),) + self._buffer.shape[1:],
+                dtype=dtype,
+            )
+            buffer[:nlive] = self.array
+            self._buffer = buffer
+            self._start = 0
+            self._stop = nlive
+        self._buffer[self._stop : self._stop + len(rows)] = rows
+        self._stop += len(rows)
+        self.array = self._buffer[self._start : self._stop]
+        return self.array
+
+    def drop(self, n):
+        """Remove the first n rows of the buffer.
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to remove.
+
+        Returns
+        -------
+        array : np.ndarray
+            View of the live rows.
+        """
+        self._start = min(self._start + n, self._stop)
+        self.array = self._buffer[self._start : self._stop]
+        return self.array
@@ -359,6 +359,70 @@ def test_properties():
     assert np.all(layer.properties['point_type'] == paste_annotations)
 
 
+def _n_dimensional_slice(data, size, plane):
+    """Brute-force slice of n-dimensional points on the first axis."""
+    distances = np.abs(data[:, 0] - plane)
+    return np.where(distances <= size[:, 0] / 2)[0]
+
+
+def test_n_dimensional_slice_index():
+    """Test n-dimensional slicing with the index matches a full scan."""
+    np.random.seed(0)
+    data = 20 * np.random.random((100, 3))
+    size = 6 * np.random.random((100, 3))
+    layer = Points(data.copy(), size=size, n_dimensional=True)
+    for plane in [0, 4, 11, 19]:
+        layer.dims.set_point(0, plane)
+        np.testing.assert_equal(
+            layer._indices_view, _n_dimensional_slice(data, size, plane)
+        )
+        scale = np.prod(
+            1
+            - np.abs(data[layer._indices_view, 0] - plane)
+            / (size[layer._indices_view, 0] / 2),
+        )
+        np.testing.assert_allclose(
+            np.prod(layer._view_size_scale.astype(float)), scale
+        )
+
+    # The index is rebuilt when the sizes change
+    layer.size = 1
+    np.testing.assert_equal(
+        layer._indices_view, _n_dimensional_slice(data, np.ones((100, 3)), 19),
+    )
+
+    # Moving points along the sliced axis updates the slice
+    layer.dims.order = (1, 0, 2)
+    layer.dims.set_point(1, 0)
+    layer._move(list(range(100)), [0, 10, 0])
+    layer._move(list(range(100)), [5, 10, 0])
+    np.testing.assert_allclose(layer.data[:, 0], data[:, 0] + 5)
+    layer.dims.order = (0, 1, 2)
+    np.testing.assert_equal(
+        layer._indices_view, _n_dimensional_slice(layer.data, layer.size, 19),
+    )
+
+
+def test_where():
+    """Test querying points by their properties."""
+    data = np.random.random((6, 2))
+    properties = {
+        'score': np.array([0.1, 0.9, 0.5, 0.95, 0.3, 0.85]),
+        'label': np.array(['A', 'B'] * 3),
+    }
+    layer = Points(data, properties=properties)
+    np.testing.assert_equal(layer.where('score > 0.8'), [1, 3, 5])
+    np.testing.assert_equal(layer.where("(score > 0.9) & (label == 'B')"), [3])
+
+    layer.selected_data = layer.where("label == 'B'")
+    assert layer.selected_data == [1, 3, 5]
+
+    layer = Points()
+    assert len(layer.where('True')) == 0
+    with pytest.raises(ValueError):
+        layer.where('score > 0.8')
+
+
 def test_properties_dataframe():
     """test if properties can be provided as a DataFrame"""
     shape = (10, 2)
@@ -478,6 +542,194 @@ def test_n_dimensional():
     assert layer.n_dimensional is True
 
 
+def test_extend():
+    """Test appending points matches setting the data directly."""
+    np.random.seed(0)
+    data = np.random.randint(0, 4, (10, 3))
+    new_data = np.random.randint(0, 4, (6, 3))
+    properties = {'label': np.arange(10)}
+    layer = Points(data, properties=properties, face_color='label')
+    expected = Points(data, properties=properties, face_color='label')
+    layer.dims.set_point(0, 1)
+    expected.dims.set_point(0, 1)
+
+    layer.extend(new_data[:2])
+    layer.extend(new_data[2:5])
+    layer.append(new_data[5])
+    layer.refresh()
+    expected.data = np.concatenate((data, new_data), axis=0)
+    expected.selected_data = []
+
+    np.testing.assert_equal(layer.data, expected.data)
+    np.testing.assert_equal(layer._indices_view, expected._indices_view)
+    np.testing.assert_equal(layer._view_data, expected._view_data)
+    np.testing.assert_equal(layer._view_size, expected._view_size)
+    np.testing.assert_equal(layer.size, expected.size)
+    np.testing.assert_equal(layer.edge_color, expected.edge_color)
+    np.testing.assert_equal(layer.face_color, expected.face_color)
+    np.testing.assert_equal(layer.properties, expected.properties)
+    assert layer.dims.range == expected.dims.range
+    assert layer.selected_data == []
+
+
+def test_extend_n_dimensional():
+    """Test appending points matches setting the data in n_dimensional mode."""
+    np.random.seed(0)
+    data = 4 * np.random.random((10, 3))
+    new_data = 4 * np.random.random((5, 3))
+    layer = Points(data, size=2, n_dimensional=True)
+    layer.dims.set_point(0, 2)
+    layer.extend(new_data)
+
+    expected = Points(
+        np.concatenate((data, new_data), axis=0), size=2, n_dimensional=True
+    )
+    expected.dims.set_point(0, 2)
+    np.testing.assert_equal(layer._indices_view, expected._indices_view)
+    np.testing.assert_allclose(
+        layer._view_size.astype(float), expected._view_size.astype(float)
+    )
+
+
+def test_extend_then_set_data():
+    """Test setting data after appending points releases the buffers."""
+    layer = Points(np.zeros((4, 2)))
+    layer.extend(np.ones((3, 2)))
+    assert len(layer._buffers) > 0
+    held = layer.data
+
+    layer.data = np.zeros((2, 2))
+    assert len(layer._buffers) == 0
+    np.testing.assert_equal(held, [[0, 0]] * 4 + [[1, 1]] * 3)
+
+    layer.extend(np.ones((1, 2)))
+    np.testing.assert_equal(layer.data, [[0, 0], [0, 0], [1, 1]])
+    assert len(layer.size) == 3
+
+
+def test_adding_points_through_data():
+    """Test adding points by setting data broadcasts the new sizes."""
+    layer = Points(np.zeros((2, 3)), size=[1, 2, 3])
+    layer.current_size = 5
+    layer.data = np.zeros((4, 3))
+    np.testing.assert_equal(layer.size[:2], [[1, 2, 3]] * 2)
+    np.testing.assert_equal(layer.size[2:], [[1, 5, 5]] * 2)
+    assert layer.selected_data == [2, 3]
+
+
+def test_extend_capacity():
+    """Test dropping the oldest points when appending beyond capacity."""
+    data = np.array([[0, 0], [1, 1], [2, 2], [3, 3]])
+    properties = {'label': np.array([0, 1, 2, 3])}
+    layer = Points(data, properties=properties)
+    layer.selected_data = [0, 2, 3]
+    layer.current_properties = {'label': np.array([4])}
+
+    layer.extend([[4, 4], [5, 5]], capacity=4)
+    np.testing.assert_equal(layer.data, [[2, 2], [3, 3], [4, 4], [5, 5]])
+    np.testing.assert_equal(layer.properties['label'], [2, 3, 4, 4])
+    assert len(layer.size) == 4
+    assert len(layer.edge_color) == 4
+    assert len(layer.face_color) == 4
+    assert layer.selected_data == [0, 1]
+    np.testing.assert_equal(layer._indices_view, [0, 1, 2, 3])
+
+    # Points appended beyond capacity in one batch are dropped too
+    layer.extend([[6, 6], [7, 7], [8, 8], [9, 9], [10, 10]], capacity=3)
+    np.testing.assert_equal(layer.data, [[8, 8], [9, 9], [10, 10]])
+    np.testing.assert_equal(layer._indices_view, [0, 1, 2])
+    assert layer.selected_data == []
+
+    with pytest.raises(ValueError):
+        layer.extend([[0, 0]], capacity=0)
+
+
+def test_extend_coalesces_refresh():
+    """Test refreshes of streamed points are deferred within an interval."""
+    layer = Points(np.zeros((1, 2)))
+    layer._min_refresh_interval = 1000
+    layer.refresh()
+    layer.extend([[1, 1]])
+    assert layer._refresh_pending
+    # The view slice is updated even if the refresh is deferred
+    np.testing.assert_equal(layer._indices_view, [0, 1])
+
+    layer.refresh()
+    assert not layer._refresh_pending
+
+    layer._min_refresh_interval = 0
+    layer.extend([[2, 2]])
+    assert not layer._refresh_pending
+
+
+def test_lod_threshold():
+    """Test decimating points in view above the lod threshold."""
+    np.random.seed(0)
+    data = 100 * np.random.random((1000, 2))
+    layer = Points(data)
+    assert layer.lod_threshold is None
+    assert len(layer._indices_view) == 1000
+    assert layer._lod_view is None
+
+    layer.lod_threshold = 100
+    assert layer.lod_threshold == 100
+    assert len(layer._lod_view) == 100
+    # The full slice is kept for selection and picking
+    assert len(layer._indices_view) == 1000
+    assert len(layer._view_data) == 1000
+    assert len(layer._view_face_color) == 1000
+
+    # Selected points are always kept in view
+    layer.selected_data = [1, 3]
+    layer.refresh()
+    assert 1 in layer._indices_view[layer._lod_view]
+    assert 3 in layer._indices_view[layer._lod_view]
+
+    # Zooming in on a small field of view restores full detail
+    layer._set_lod(1 / 64, np.array([[0, 0], [2, 2]]))
+    in_view = np.all(
+        (data >= layer._lod_corners[0]) & (data <= layer._lod_corners[1]),
+        axis=1,
+    )
+    in_view[[1, 3]] = True
+    np.testing.assert_equal(
+        layer._indices_view[layer._lod_view], np.where(in_view)[0]
+    )
+
+    # Selecting and copying act on all points in view
+    layer.mode = 'select'
+    layer.selected_data = list(layer._indices_view)
+    assert len(layer.selected_data) == 1000
+    layer._copy_data()
+    assert len(layer._clipboard['data']) == 1000
+
+    # Appended points are decimated with the rest of the slice
+    layer.extend(100 * np.random.random((10, 2)))
+    assert len(layer._indices_view) == 1010
+    assert layer._lod_view is not None
+
+    layer = Points(data, lod_threshold=2000)
+    assert len(layer._indices_view) == 1000
+    assert layer._lod_view is None
+
+
+@pytest.mark.parametrize('lod_threshold', [0, -5, 2.5, True, '100'])
+def test_invalid_lod_threshold(lod_threshold):
+    """Test that the lod threshold must be None or a positive integer."""
+    data = 20 * np.random.random((10, 2))
+    with pytest.raises(ValueError):
+        Points(data, lod_threshold=lod_threshold)
+
+    layer = Points(data, lod_threshold=np.int64(5))
+    assert layer.lod_threshold == 5
+    with pytest.raises(ValueError):
+        layer.lod_threshold = lod_threshold
+    assert layer.lod_threshold == 5
+
+    layer.lod_threshold = None
+    assert layer.lod_threshold is None
+
+
 def test_edge_color_direct():
     """Test setting edge color."""
     shape = (10, 2)
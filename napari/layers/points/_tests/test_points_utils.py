@@ -1,9 +1,13 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from napari.layers.points.points_utils import (
     dataframe_to_properties,
+    decimate_points,
     guess_continuous,
+    query_properties,
+    SliceIndex,
 )
 
 
@@ -23,3 +27,108 @@ def test_guess_continuous():
 
     categorical_annotation_2 = np.array([1, 2, 3], dtype=np.int)
     assert not guess_continuous(categorical_annotation_2)
+
+
+def test_decimate_points():
+    points = np.array([[0, 0], [0.2, 0.2], [0.5, 0.1], [3, 3], [10, 10]])
+    np.testing.assert_equal(decimate_points(points, 5), [0, 1, 2, 3, 4])
+
+    # Only one point is kept per cell
+    keep = decimate_points(points, 4, cell_size=1)
+    np.testing.assert_equal(keep, [0, 3, 4])
+
+    # Points outside of the field of view are dropped
+    keep = decimate_points(points, 4, corners=np.array([[0, 0], [5, 5]]))
+    np.testing.assert_equal(keep, [0, 1, 2, 3])
+
+    # Excess points are removed by keeping evenly spaced points
+    keep = decimate_points(points, 2)
+    np.testing.assert_equal(keep, [0, 4])
+
+    # Just above the threshold only the excess points are removed
+    keep = decimate_points(points, 4)
+    np.testing.assert_equal(keep, [0, 1, 2, 4])
+    keep = decimate_points(np.random.random((101, 2)), 100)
+    assert len(keep) == 100
+    assert len(np.unique(keep)) == 100
+
+
+def test_query_properties():
+    properties = {
+        'score': np.array([0.1, 0.9, 0.5, 0.95]),
+        'label': np.array(['cell', 'nucleus', 'cell', 'debris']),
+        'flagged': np.array([False, False, True, True]),
+    }
+    np.testing.assert_equal(
+        query_properties(properties, 'score > 0.8', 4), [1, 3]
+    )
+    np.testing.assert_equal(
+        query_properties(properties, "label == 'cell'", 4), [0, 2]
+    )
+    np.testing.assert_equal(
+        query_properties(properties, "label in ['cell', 'nucleus']", 4),
+        [0, 1, 2],
+    )
+    np.testing.assert_equal(
+        query_properties(properties, "label not in ('cell',)", 4), [1, 3]
+    )
+    np.testing.assert_equal(
+        query_properties(properties, '0.2 < score <= 0.9', 4), [1, 2]
+    )
+    np.testing.assert_equal(
+        query_properties(properties, '(score > 0.4) & ~flagged', 4), [1]
+    )
+    np.testing.assert_equal(
+        query_properties(properties, 'score * 2 > 1 and not flagged', 4), [1]
+    )
+    np.testing.assert_equal(
+        query_properties(properties, 'flagged or score < 0.2', 4), [0, 2, 3]
+    )
+    np.testing.assert_equal(
+        query_properties(properties, 'True', 4), [0, 1, 2, 3]
+    )
+
+    for expression in [
+        'area > 1',
+        'score >',
+        '__import__("os")',
+        'score.max() > 0',
+        'score + 1',
+        "label in 'cell'",
+    ]:
+        with pytest.raises(ValueError):
+            query_properties(properties, expression, 4)
+
+
+def test_slice_index():
+    np.random.seed(0)
+    data = 20 * np.random.random((200, 3))
+    size = 4 * np.random.random((200, 3))
+    index = SliceIndex(data, size)
+    assert index.holds(data, size)
+    assert not index.holds(data.copy(), size)
+
+    for plane in [0, 3.5, 10, 19.9, 25]:
+        candidates = index.query([0], [plane])
+        overlap = np.where(np.abs(data[:, 0] - plane) <= size[:, 0] / 2)[0]
+        assert np.all(np.isin(overlap, candidates))
+        assert np.all(np.diff(candidates) > 0)
+
+    candidates = index.query([0, 1], [10, 5])
+    overlap = np.where(
+        np.all(np.abs(data[:, :2] - [10, 5]) <= size[:, :2] / 2, axis=1)
+    )[0]
+    assert np.all(np.isin(overlap, candidates))
+
+    # Points on the boundary of their extent are found
+    index = SliceIndex(np.array([[0.0], [1.0]]), np.array([[2.0], [0.0]]))
+    np.testing.assert_equal(index.query([0], [1.0]), [0, 1])
+    np.testing.assert_equal(index.query([0], [-1.0]), [0])
+
+    # Changed axes are reindexed
+    data = np.array([[0.0], [5.0]])
+    index = SliceIndex(data, np.ones((2, 1)))
+    np.testing.assert_equal(index.query([0], [5]), [1])
+    data[0, 0] = 5
+    index.invalidate([0])
+    np.testing.assert_equal(index.query([0], [5]), [0, 1])
@@ -26,8 +26,11 @@ from ..utils.color_transformations import (
 )
 from .points_utils import (
     dataframe_to_properties,
+    decimate_points,
     guess_continuous,
     map_property,
+    query_properties,
+    SliceIndex,
 )
 
 
@@ -83,6 +86,12 @@ class Points(Layer):
     n_dimensional : bool
         If True, renders points not just in central plane but also in all
         n-dimensions according to specified point marker size.
+    lod_threshold : int, optional
+        Maximum number of points in the current slice that are sent to the
+        canvas. If more points are in the slice they are deterministically
+        decimated according to the current zoom level and field of view, and
+        full detail is restored as the view narrows. If None, all points in
+        the slice are displayed.
     name : str
         Name of the layer.
     metadata : dict
@@ -152,6 +161,9 @@ class Points(Layer):
     n_dimensional : bool
         If True, renders points not just in central plane but also in all
         n-dimensions according to specified point marker size.
+    lod_threshold : int or None
+        Maximum number of points in the current slice that are sent to the
+        canvas before level-of-detail decimation is applied.
     selected_data : list
         Integer indices of any selected points.
     mode : str
@@ -198,12 +210,31 @@ class Points(Layer):
     _drag_start : list or None
         Coordinates of first cursor click during a drag action. Gets reset to
         None after dragging is done.
+    _lod_level : int or None
+        Log2 of the size of a canvas pixel in data coordinates, used as the
+        cell size when decimating points for display.
+    _lod_corners : array (2, D) or None
+        Minimum and maximum coordinates of the displayed dimensions visible on
+        the canvas, padded and rounded to whole tiles.
+    _lod_active : bool
+        Whether the current slice has more points than `lod_threshold`.
+    _lod_view : array (K, ) or None
+        Positions within `_indices_view` of the points sent to the canvas when
+        the slice is decimated, or None if all points in view are displayed.
+    _slice_index : SliceIndex or None
+        Index of the extent of the points along each axis, used to slice
+        points in `n_dimensional` mode. Rebuilt when `data` or `size` are
+        replaced.
     """
 
     # The max number of points that will ever be used to render the thumbnail
     # If more points are present then they are randomly subsampled
     _max_points_thumbnail = 1024
 
+    # Size in canvas pixels of the tiles the field of view is rounded to when
+    # decimating points, so that small pans do not trigger a new slice
+    _lod_tile_size = 256
+
     def __init__(
         self,
         data=None,
@@ -221,6 +252,7 @@ class Points(Layer):
         face_colormap='viridis',
         face_contrast_limits=None,
         n_dimensional=False,
+        lod_threshold=None,
         name=None,
         metadata=None,
         scale=None,
@@ -280,6 +312,13 @@ class Points(Layer):
         self._n_dimensional = n_dimensional
         self.edge_width = edge_width
 
+        # Level of detail parameters, updated by the visual on each draw
+        self._lod_threshold = self._validate_lod_threshold(lod_threshold)
+        self._lod_level = None
+        self._lod_corners = None
+        self._lod_active = False
+        self._lod_view = None
+
         # The following point properties are for the new points that will
         # be added. For any given property, if a list is passed to the
         # constructor so each point gets its own value then the default
@@ -307,6 +346,7 @@ class Points(Layer):
         self._drag_start = None
 
         # initialize view data
+        self._slice_index = None
         self._indices_view = []
         self._view_size_scale = []
 
@@ -354,6 +394,8 @@ class Points(Layer):
     def data(self, data: np.ndarray):
         cur_npoints = len(self._data)
         self._data = data
+        # Release any buffers used for streaming the replaced data
+        self._buffers.clear()
 
         # Adjust the size array when the number of points has changed
         if len(data) < cur_npoints:
@@ -371,87 +413,106 @@ class Points(Layer):
             # If there are now more points, add the size and colors of the
             # new ones
             with self.events.set_data.blocker():
-                adding = len(data) - cur_npoints
-                if len(self._size) > 0:
-                    new_size = copy(self._size[-1])
-                    for i in self.dims.displayed:
-                        new_size[i] = self.current_size
-                else:
-                    # Add the default size, with a value for each dimension
-                    new_size = np.repeat(
-                        self.current_size, self._size.shape[1]
-                    )
-                size = np.repeat([new_size], adding, axis=0)
-
-                for k in self.properties:
-                    new_property = np.repeat(
-                        self.current_properties[k], adding, axis=0
-                    )
+                (
+                    size,
+                    properties,
+                    edge_color,
+                    face_color,
+                ) = self._new_point_attributes(len(data) - cur_npoints)
+                for k in properties:
                     self.properties[k] = np.concatenate(
-                        (self.properties[k], new_property), axis=0
+                        (self.properties[k], properties[k]), axis=0
                     )
+                self._edge_color = np.vstack((self.edge_color, edge_color))
+                self._face_color = np.vstack((self.face_color, face_color))
+                self.size = np.concatenate((self._size, size), axis=0)
+                self.selected_data = list(np.arange(cur_npoints, len(data)))
 
-                # add new edge colors
-                if self._edge_color_mode == ColorMode.DIRECT:
-                    new_edge_colors = np.tile(
-                        self._current_edge_color, (adding, 1)
-                    )
-                elif self._edge_color_mode == ColorMode.CYCLE:
-                    edge_color_property = self.current_properties[
-                        self._edge_color_property
-                    ][0]
-                    new_edge_colors = np.tile(
-                        self.edge_color_cycle_map[edge_color_property],
-                        (adding, 1),
-                    )
-                elif self._edge_color_mode == ColorMode.COLORMAP:
-                    edge_color_property_value = self.current_properties[
-                        self._edge_color_property
-                    ][0]
+        self._update_dims()
+        self.events.data()
 
-                    ec, _ = map_property(
-                        prop=edge_color_property_value,
-                        colormap=self.edge_colormap[1],
-                        contrast_limits=self._edge_contrast_limits,
-                    )
-                    new_edge_colors = np.tile(ec, (adding, 1))
-                self._edge_color = np.vstack(
-                    (self.edge_color, new_edge_colors)
-                )
+    def _new_point_attributes(self, adding):
+        """Get the size, properties and colors of points about to be added.
 
-                # add new face colors
-                if self._face_color_mode == ColorMode.DIRECT:
-                    new_face_colors = np.tile(
-                        self._current_face_color, (adding, 1)
-                    )
-                elif self._face_color_mode == ColorMode.CYCLE:
-                    face_color_property_value = self.current_properties[
-                        self._face_color_property
-                    ][0]
-                    new_face_colors = np.tile(
-                        self.face_color_cycle_map[face_color_property_value],
-                        (adding, 1),
-                    )
-                elif self._face_color_mode == ColorMode.COLORMAP:
-                    face_color_property_value = self.current_properties[
-                        self._face_color_property
-                    ][0]
+        New points get the current size, properties and colors, mapped
+        through the current color cycle or colormap when in use.
 
-                    fc, _ = map_property(
-                        prop=face_color_property_value,
-                        colormap=self.face_colormap[1],
-                        contrast_limits=self._face_contrast_limits,
-                    )
-                    new_face_colors = np.tile(fc, (adding, 1))
-                self._face_color = np.vstack(
-                    (self.face_color, new_face_colors)
-                )
+        Parameters
+        ----------
+        adding : int
+            Number of points being added to the end of the `data` array.
 
-                self.size = np.concatenate((self._size, size), axis=0)
-                self.selected_data = list(np.arange(cur_npoints, len(data)))
+        Returns
+        -------
+        size : array (adding, D)
+            Sizes of the new points.
+        properties : dict {str: array (adding,)}
+            Properties of the new points.
+        edge_color : array (adding, 4)
+            Edge colors of the new points.
+        face_color : array (adding, 4)
+            Face colors of the new points.
+        """
+        if len(self._size) > 0:
+            new_size = copy(self._size[-1])
+            for i in self.dims.displayed:
+                new_size[i] = self.current_size
+        else:
+            # Add the default size, with a value for each dimension
+            new_size = np.repeat(self.current_size, self._size.shape[1])
+        size = np.repeat([new_size], adding, axis=0)
 
-        self._update_dims()
-        self.events.data()
+        properties = {
+            k: np.repeat(self.current_properties[k], adding, axis=0)
+            for k in self.properties
+        }
+
+        # add new edge colors
+        if self._edge_color_mode == ColorMode.DIRECT:
+            new_edge_colors = np.tile(self._current_edge_color, (adding, 1))
+        elif self._edge_color_mode == ColorMode.CYCLE:
+            edge_color_property = self.current_properties[
+                self._edge_color_property
+            ][0]
+            new_edge_colors = np.tile(
+                self.edge_color_cycle_map[edge_color_property], (adding, 1),
+            )
+        elif self._edge_color_mode == ColorMode.COLORMAP:
+            edge_color_property_value = self.current_properties[
+                self._edge_color_property
+            ][0]
+
+            ec, _ = map_property(
+                prop=edge_color_property_value,
+                colormap=self.edge_colormap[1],
+                contrast_limits=self._edge_contrast_limits,
+            )
+            new_edge_colors = np.tile(ec, (adding, 1))
+
+        # add new face colors
+        if self._face_color_mode == ColorMode.DIRECT:
+            new_face_colors = np.tile(self._current_face_color, (adding, 1))
+        elif self._face_color_mode == ColorMode.CYCLE:
+            face_color_property_value = self.current_properties[
+                self._face_color_property
+            ][0]
+            new_face_colors = np.tile(
+                self.face_color_cycle_map[face_color_property_value],
+                (adding, 1),
+            )
+        elif self._face_color_mode == ColorMode.COLORMAP:
+            face_color_property_value = self.current_properties[
+                self._face_color_property
+            ][0]
+
+            fc, _ = map_property(
+                prop=face_color_property_value,
+                colormap=self.face_colormap[1],
+                contrast_limits=self._face_contrast_limits,
+            )
+            new_face_colors = np.tile(fc, (adding, 1))
+
+        return size, properties, new_edge_colors, new_face_colors
 
     @property
     def properties(self):
@@ -469,6 +530,28 @@ class Points(Layer):
             self._face_color_property = ''
             warnings.warn('property used for face_color dropped')
 
+    def where(self, expression: str) -> np.ndarray:
+        """Find the points whose properties match a query expression.
+
+        The query is evaluated column-wise over `properties`, so it is fast
+        even for millions of points. The result can be used directly for
+        selection, e.g. ``layer.selected_data = layer.where('score > 0.8')``.
+
+        Parameters
+        ----------
+        expression : str
+            Python expression over property names made of comparisons,
+            arithmetic, `and` / `or` / `not`, `&` / `|` / `~` and `in` /
+            `not in` tests against literal lists, for example
+            ``"(score > 0.8) & (label in ['cell', 'nucleus'])"``.
+
+        Returns
+        -------
+        indices : (M,) array
+            Sorted indices of the matching points.
+        """
+        return query_properties(self.properties, expression, len(self.data))
+
     def _validate_properties(self, properties: Dict[str, np.ndarray]):
         """Validates the type and size of the properties"""
         for v in properties.values():
@@ -505,6 +588,71 @@ class Points(Layer):
         self.events.n_dimensional()
         self.refresh()
 
+    @property
+    def lod_threshold(self) -> Union[None, int]:
+        """int or None: max number of points displayed before decimating."""
+        return self._lod_threshold
+
+    @lod_threshold.setter
+    def lod_threshold(self, lod_threshold: Union[None, int]) -> None:
+        self._lod_threshold = self._validate_lod_threshold(lod_threshold)
+        self.refresh()
+
+    def _validate_lod_threshold(self, lod_threshold):
+        """Validates that the LOD threshold is None or a positive integer"""
+        if lod_threshold is None:
+            return None
+        if (
+            isinstance(lod_threshold, (bool, np.bool_))
+            or not isinstance(lod_threshold, (int, np.integer))
+            or lod_threshold < 1
+        ):
+            raise ValueError(
+                'lod_threshold must be None or an integer of at least 1, '
+                f'got {lod_threshold!r}'
+            )
+        return int(lod_threshold)
+
+    def _set_lod(self, scale_factor, corners=None):
+        """Update the level of detail for the current zoom and field of view.
+
+        The displayed points are only recomputed when the layer is being
+        decimated and either the zoom level crosses a power of two or the
+        field of view moves into a new tile.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Size of a canvas pixel in data coordinates.
+        corners : array (2, D) or None
+            Minimum and maximum data coordinates of the displayed dimensions
+            visible on the canvas.
+        """
+        level = int(np.floor(np.log2(scale_factor)))
+        if corners is not None:
+            tile = 2.0 ** level * self._lod_tile_size
+            corners = (
+                np.array(
+                    [
+                        np.floor(np.min(corners, axis=0) / tile) - 1,
+                        np.ceil(np.max(corners, axis=0) / tile) + 1,
+                    ]
+                )
+                * tile
+            )
+
+        if level == self._lod_level and np.array_equal(
+            corners, self._lod_corners
+        ):
+            return
+
+        self._lod_level = level
+        self._lod_corners = corners
+        if self._lod_active:
+            # Only the decimation depends on the view, not the slice
+            self._set_lod_view()
+            self.events.set_data()
+
     @property
     def symbol(self) -> str:
         """str: symbol used for all point markers."""
@@ -556,6 +704,8 @@ class Points(Layer):
         ):
             for i in self.selected_data:
                 self.size[i, :] = (self.size[i, :] > 0) * size
+            if self._slice_index is not None:
+                self._slice_index.invalidate()
             self.refresh()
             self.events.size()
         self.status = format_float(self.current_size)
@@ -992,6 +1142,7 @@ class Points(Layer):
                 'edge_contrast_limits': self.edge_contrast_limits,
                 'properties': self.properties,
                 'n_dimensional': self.n_dimensional,
+                'lod_threshold': self.lod_threshold,
                 'size': self.size,
                 'data': self.data,
             }
@@ -1201,13 +1352,16 @@ class Points(Layer):
         if not self.editable:
             self.mode = Mode.PAN_ZOOM
 
-    def _slice_data(self, dims_indices):
+    def _slice_data(self, dims_indices, start=0):
         """Determines the slice of points given the indices.
 
         Parameters
         ----------
         dims_indices : sequence of int or slice
             Indices to slice with.
+        start : int
+            Index of the first point to consider. Points before it are
+            ignored, which allows only newly added points to be sliced.
 
         Returns
         ----------
@@ -1221,26 +1375,48 @@ class Points(Layer):
         # Get a list of the data for the points in this slice
         not_disp = list(self.dims.not_displayed)
         indices = np.array(dims_indices)
-        if len(self.data) > 0:
+        if len(self.data) > start:
             if self.n_dimensional is True and self.ndim > 2:
-                distances = abs(self.data[:, not_disp] - indices[not_disp])
-                sizes = self.size[:, not_disp] / 2
+                if start == 0:
+                    # Only check the points whose extent may reach the slice
+                    candidates = self._get_slice_index().query(
+                        not_disp, indices[not_disp].astype(float)
+                    )
+                else:
+                    candidates = np.arange(start, len(self.data))
+                distances = abs(
+                    self.data[np.ix_(candidates, not_disp)] - indices[not_disp]
+                )
+                sizes = self.size[np.ix_(candidates, not_disp)] / 2
                 matches = np.all(distances <= sizes, axis=1)
                 size_match = sizes[matches]
                 size_match[size_match == 0] = 1
                 scale_per_dim = (size_match - distances[matches]) / size_match
                 scale_per_dim[size_match == 0] = 1
                 scale = np.prod(scale_per_dim, axis=1)
-                slice_indices = np.where(matches)[0].astype(int)
+                slice_indices = candidates[matches]
                 return slice_indices, scale
             else:
-                data = self.data[:, not_disp].astype('int')
+                data = self.data[start:, not_disp].astype('int')
                 matches = np.all(data == indices[not_disp], axis=1)
-                slice_indices = np.where(matches)[0].astype(int)
+                slice_indices = start + np.where(matches)[0].astype(int)
                 return slice_indices, 1
         else:
             return [], []
 
+    def _get_slice_index(self):
+        """Get the index of the point extents, rebuilding it if needed.
+
+        Returns
+        ----------
+        slice_index : SliceIndex
+            Index of the current `data` and `size` arrays.
+        """
+        index = self._slice_index
+        if index is None or not index.holds(self.data, self.size):
+            self._slice_index = SliceIndex(self.data, self.size)
+        return self._slice_index
+
     def _get_value(self):
         """Determine if points at current coordinates.
 
@@ -1283,9 +1459,44 @@ class Points(Layer):
                 ind = list(self._indices_view).index(c)
                 selected.append(ind)
         self._selected_view = selected
+        self._set_lod_view()
         with self.events.highlight.blocker():
             self._set_highlight(force=True)
 
+    def _set_lod_view(self):
+        """Decimate the points in view that are sent to the canvas.
+
+        The full slice is kept in `_indices_view` so that selection, picking
+        and copying act on all points in view, and only the positions of the
+        displayed points are stored in `_lod_view`.
+        """
+        indices = self._indices_view
+        self._lod_active = (
+            self._lod_threshold is not None
+            and len(indices) > self._lod_threshold
+        )
+        if not self._lod_active:
+            self._lod_view = None
+            return
+
+        if self._lod_level is None or self.dims.ndisplay == 3:
+            cell_size = None
+            corners = None
+        else:
+            cell_size = 2.0 ** self._lod_level
+            corners = self._lod_corners
+        keep = decimate_points(
+            self.data[np.ix_(indices, self.dims.displayed)],
+            self._lod_threshold,
+            cell_size=cell_size,
+            corners=corners,
+        )
+        # Selected points are always displayed so they can be edited
+        mask = np.zeros(len(indices), dtype=bool)
+        mask[keep] = True
+        mask[self._selected_view] = True
+        self._lod_view = np.where(mask)[0]
+
     def _set_highlight(self, force=False):
         """Render highlights of shapes including boundaries, vertices,
         interaction boxes, and the drag selection box when appropriate.
@@ -1399,6 +1610,145 @@ class Points(Layer):
         """
         self.data = np.append(self.data, np.atleast_2d(coord), axis=0)
 
+    def extend(self, data, capacity=None):
+        """Append points to the layer, for example from a live acquisition.
+
+        Unlike setting `data`, the new points are not selected, the layer
+        arrays grow in amortized constant time per point, only the new points
+        are sliced, and the view is refreshed at most once every
+        `_min_refresh_interval` seconds, so that points can be streamed into
+        the layer at a high rate. A deferred refresh is sent on the next draw
+        of the canvas, or on the next call to `refresh` when no canvas is
+        attached. New points get the current size, properties and colors.
+
+        The range of the dims is grown to include the new points but is not
+        shrunk when old points are dropped.
+
+        Parameters
+        ----------
+        data : array (M, D)
+            Coordinates for M new points in D dimensions.
+        capacity : int, optional
+            Maximum number of points to keep. If exceeded, the oldest points
+            are removed so that the layer acts as a ring buffer.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        data = np.atleast_2d(data)
+        if len(data) == 0:
+            return
+
+        cur_npoints = len(self._data)
+        size, properties, edge_color, face_color = self._new_point_attributes(
+            len(data)
+        )
+        self._data = self._extend_buffer('data', self._data, data)
+        self._size = self._extend_buffer('size', self._size, size)
+        self._edge_color = self._extend_buffer(
+            'edge_color', self._edge_color, edge_color
+        )
+        self._face_color = self._extend_buffer(
+            'face_color', self._face_color, face_color
+        )
+        for k in properties:
+            self.properties[k] = self._extend_buffer(
+                ('properties', k), self.properties[k], properties[k]
+            )
+
+        if capacity is not None and len(self._data) > capacity:
+            n_drop = len(self._data) - capacity
+            self._remove_oldest(n_drop)
+        else:
+            n_drop = 0
+        start = max(cur_npoints - n_drop, 0)
+
+        self._extend_view_slice(start, n_drop)
+
+        new_data = self._data[start:]
+        extent = [
+            (min, max, 1)
+            for min, max in zip(new_data.min(axis=0), new_data.max(axis=0))
+        ]
+        self._extend_range(extent, reset=start == 0)
+        self._schedule_refresh()
+        self.events.data()
+
+    def append(self, coord):
+        """Append a single point to the layer without selecting it.
+
+        Parameters
+        ----------
+        coord : sequence of float
+            Coordinates of the new point.
+        """
+        self.extend(np.atleast_2d(coord))
+
+    def _remove_oldest(self, n):
+        """Remove the first n points and all their attributes.
+
+        Parameters
+        ----------
+        n : int
+            Number of points to remove from the start of the `data` array.
+        """
+        self._data = self._drop_buffer('data', self._data, n)
+        self._size = self._drop_buffer('size', self._size, n)
+        self._edge_color = self._drop_buffer('edge_color', self._edge_color, n)
+        self._face_color = self._drop_buffer('face_color', self._face_color, n)
+        for k in self.properties:
+            self.properties[k] = self._drop_buffer(
+                ('properties', k), self.properties[k], n
+            )
+        self._selected_data = [i - n for i in self._selected_data if i >= n]
+        if self._value is not None:
+            self._value = self._value - n if self._value >= n else None
+
+    def _extend_view_slice(self, start, n_drop):
+        """Update the view slice after points were appended and dropped.
+
+        Only the points from `start` onwards are sliced. Points already in
+        view are shifted by the number of dropped points.
+
+        Parameters
+        ----------
+        start : int
+            Index of the first appended point still in the layer.
+        n_drop : int
+            Number of points removed from the start of the `data` array.
+        """
+        old_indices = np.asarray(self._indices_view, dtype=int)
+        old_scale = self._view_size_scale
+        if np.isscalar(old_scale) or len(old_scale) != len(old_indices):
+            old_scale = np.ones(len(old_indices))
+
+        # Slice indices are sorted, so dropped points are at the start
+        n_removed = np.searchsorted(old_indices, n_drop)
+        indices = self._drop_buffer('indices_view', old_indices, n_removed)
+        if n_drop > 0:
+            indices -= n_drop
+
+        new_indices, scale = self._slice_data(self.dims.indices, start=start)
+        self._indices_view = self._extend_buffer(
+            'indices_view', indices, np.asarray(new_indices, dtype=int)
+        )
+        if np.isscalar(scale):
+            self._view_size_scale = scale
+        else:
+            old_scale = self._drop_buffer(
+                'view_size_scale', old_scale, n_removed
+            )
+            self._view_size_scale = self._extend_buffer(
+                'view_size_scale', old_scale, scale
+            )
+
+        if len(self._selected_data) > 0:
+            self._selected_view = list(
+                np.where(np.isin(self._indices_view, self._selected_data))[0]
+            )
+        else:
+            self._selected_view = []
+        self._set_lod_view()
+
     def remove_selected(self):
         """Removes selected points if any."""
         index = copy(self.selected_data)
@@ -1436,6 +1786,8 @@ class Points(Layer):
             self.data[np.ix_(index, disp)] = (
                 self.data[np.ix_(index, disp)] + shift
             )
+            if self._slice_index is not None:
+                self._slice_index.invalidate(disp)
             self.refresh()
 
     def _paste_data(self):
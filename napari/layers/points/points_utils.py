@@ -1,3 +1,5 @@
+import ast
+import operator
 from typing import Dict, Tuple, Union
 
 import numpy as np
@@ -23,6 +25,271 @@ def dataframe_to_properties(dataframe) -> Dict[str, np.ndarray]:
     return properties
 
 
+def decimate_points(
+    points: np.ndarray,
+    max_points: int,
+    cell_size: Union[None, float] = None,
+    corners: Union[None, np.ndarray] = None,
+) -> np.ndarray:
+    """Deterministically subsample points for display at the current zoom.
+
+    Points outside of the field of view are dropped first. If more than
+    `max_points` remain then only the first point falling in each cell of a
+    grid with spacing `cell_size` is kept, so that points collapsing onto the
+    same screen pixel are drawn once. If there are still too many points then
+    `max_points` evenly spaced points are kept.
+
+    Parameters
+    ----------
+    points : (N, D) array
+        Coordinates of the points in the displayed dimensions.
+    max_points : int
+        Maximum number of points to keep.
+    cell_size : float, optional
+        Size of a screen pixel in data coordinates. If None no grid
+        decimation is done.
+    corners : (2, D) array, optional
+        Minimum and maximum coordinates of the field of view. If None all
+        points are considered in view.
+
+    Returns
+    -------
+    keep : (M,) array
+        Sorted integer indices of the points to display.
+    """
+    keep = np.arange(len(points))
+    if corners is not None:
+        inside = np.all(
+            (points >= corners[0]) & (points <= corners[1]), axis=1
+        )
+        keep = keep[inside]
+
+    if len(keep) > max_points and cell_size is not None:
+        cells = np.floor(points[keep] / cell_size).astype(np.int64)
+        _, first = np.unique(cells, axis=0, return_index=True)
+        keep = keep[np.sort(first)]
+
+    if len(keep) > max_points:
+        keep = keep[np.linspace(0, len(keep) - 1, max_points).astype(int)]
+
+    return keep
+
+
+_QUERY_OPERATORS = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.BitAnd: operator.and_,
+    ast.BitOr: operator.or_,
+    ast.BitXor: operator.xor,
+    ast.USub: operator.neg,
+    ast.Invert: operator.invert,
+}
+
+# Literal nodes, which are all parsed as ast.Constant from Python 3.8
+_QUERY_CONSTANTS = tuple(
+    getattr(ast, name)
+    for name in ('Constant', 'Num', 'Str', 'Bytes', 'NameConstant')
+    if hasattr(ast, name)
+)
+
+
+def query_properties(
+    properties: Dict[str, np.ndarray], expression: str, n: int
+) -> np.ndarray:
+    """Find the rows of a properties dictionary matching an expression.
+
+    The expression is evaluated column-wise with NumPy, so its cost is
+    proportional to the number of rows times the number of columns used.
+    Only comparisons, arithmetic, boolean operators and `in` / `not in`
+    tests against literal sequences are supported, for example
+    ``"(score > 0.8) & (label in ['cell', 'nucleus'])"`` or
+    ``"0.2 < area <= 10 and not flagged"``.
+
+    Parameters
+    ----------
+    properties : dict {str: array (N,)}
+        Columns that can be referred to by name in the expression.
+    expression : str
+        Python expression over the column names evaluating to a boolean
+        value per row.
+    n : int
+        Number of rows, used when the expression does not depend on any
+        column.
+
+    Returns
+    -------
+    indices : (M,) array
+        Sorted integer indices of the matching rows.
+    """
+    try:
+        tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e:
+        raise ValueError(f'invalid query {expression!r}: {e.msg}')
+    mask = np.broadcast_to(_evaluate_query(tree.body, properties), (n,))
+    if mask.dtype != bool:
+        raise ValueError(f'query {expression!r} does not evaluate to a mask')
+    return np.flatnonzero(mask)
+
+
+def _evaluate_query(node, properties):
+    """Recursively evaluate a node of a parsed property query."""
+    if isinstance(node, ast.Name):
+        if node.id not in properties:
+            raise ValueError(f'unknown property {node.id!r} in query')
+        return np.asarray(properties[node.id])
+    if isinstance(node, _QUERY_CONSTANTS):
+        return ast.literal_eval(node)
+    if isinstance(node, (ast.List, ast.Tuple, ast.Set)):
+        return [_evaluate_query(elt, properties) for elt in node.elts]
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return np.logical_not(_evaluate_query(node.operand, properties))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _QUERY_OPERATORS:
+        operand = _evaluate_query(node.operand, properties)
+        return _QUERY_OPERATORS[type(node.op)](operand)
+    if isinstance(node, ast.BinOp) and type(node.op) in _QUERY_OPERATORS:
+        left = _evaluate_query(node.left, properties)
+        right = _evaluate_query(node.right, properties)
+        return _QUERY_OPERATORS[type(node.op)](left, right)
+    if isinstance(node, ast.BoolOp):
+        combine = (
+            np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        )
+        result = _evaluate_query(node.values[0], properties)
+        for value in node.values[1:]:
+            result = combine(result, _evaluate_query(value, properties))
+        return result
+    if isinstance(node, ast.Compare):
+        result = True
+        left = _evaluate_query(node.left, properties)
+        for op, comparator in zip(node.ops, node.comparators):
+            right = _evaluate_query(comparator, properties)
+            if isinstance(op, (ast.In, ast.NotIn)):
+                if not isinstance(right, list):
+                    raise ValueError('`in` requires a literal sequence')
+                match = np.isin(left, right)
+                if isinstance(op, ast.NotIn):
+                    match = np.logical_not(match)
+            elif type(op) in _QUERY_OPERATORS:
+                match = _QUERY_OPERATORS[type(op)](left, right)
+            else:
+                raise ValueError(
+                    f'unsupported comparison {type(op).__name__} in query'
+                )
+            result = np.logical_and(result, match)
+            left = right
+        return result
+    raise ValueError(f'unsupported expression {type(node).__name__} in query')
+
+
+class SliceIndex:
+    """Index of the extent of points along each axis for fast slicing.
+
+    For each axis the point coordinates are sorted once, together with the
+    largest half size of the points along that axis. Points whose extent
+    along an axis can contain a plane are then found by binary search, in
+    logarithmic time plus the number of candidates. Axes are indexed lazily
+    on their first query.
+
+    Parameters
+    ----------
+    data : array (N, D)
+        Coordinates of the points.
+    size : array (N, D)
+        Size of the points along each axis.
+    """
+
+    def __init__(self, data, size):
+        self._data = data
+        self._size = size
+        self._axes = {}
+
+    def holds(self, data, size):
+        """Whether the index was built for the given arrays.
+
+        Parameters
+        ----------
+        data : array (N, D)
+            Coordinates of the points.
+        size : array (N, D)
+            Size of the points along each axis.
+
+        Returns
+        -------
+        holds : bool
+            False if either array has been replaced, in which case the index
+            is out of date.
+        """
+        return data is self._data and size is self._size
+
+    def invalidate(self, axes=None):
+        """Drop the index of axes whose coordinates or sizes changed.
+
+        Parameters
+        ----------
+        axes : sequence of int, optional
+            Axes to drop. If None all axes are dropped.
+        """
+        if axes is None:
+            self._axes = {}
+        else:
+            for axis in axes:
+                self._axes.pop(axis, None)
+
+    def _index(self, axis):
+        """Get the sorting order, sorted coordinates and max half size."""
+        if axis not in self._axes:
+            coords = self._data[:, axis]
+            order = np.argsort(coords, kind='stable')
+            if len(coords) > 0:
+                max_half = np.max(np.abs(self._size[:, axis])) / 2
+            else:
+                max_half = 0
+            self._axes[axis] = (order, coords[order], max_half)
+        return self._axes[axis]
+
+    def query(self, axes, values):
+        """Find the points whose extent may contain the given planes.
+
+        Parameters
+        ----------
+        axes : sequence of int
+            Axes of the planes.
+        values : sequence of float
+            Coordinate of the plane along each axis.
+
+        Returns
+        -------
+        candidates : (M,) array
+            Sorted indices of the points whose extent along the most
+            selective axis contains its plane. The exact overlap along all
+            axes still needs to be checked.
+        """
+        best = None
+        for axis, value in zip(axes, values):
+            order, coords, max_half = self._index(axis)
+            # Pad the window so that rounding cannot drop boundary points
+            pad = max_half + 4 * np.spacing(abs(value) + max_half)
+            start = np.searchsorted(coords, value - pad, side='left')
+            stop = np.searchsorted(coords, value + pad, side='right')
+            if best is None or stop - start < best[2] - best[1]:
+                best = (order, start, stop)
+        if best is None:
+            return np.arange(len(self._data))
+        order, start, stop = best
+        return np.sort(order[start:stop])
+
+
 def guess_continuous(property: np.ndarray) -> bool:
     """Guess if the property is continuous (return True) or categorical (return False)"""
     # if the property is a floating type, guess continuous
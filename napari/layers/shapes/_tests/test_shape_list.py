@@ -1,6 +1,34 @@
 import numpy as np
 from napari.layers.shapes.shape_list import ShapeList
-from napari.layers.shapes.shape_models import Rectangle, Polygon, Path
+from napari.layers.shapes.shape_models import (
+    Ellipse,
+    Path,
+    Polygon,
+    Rectangle,
+)
+from napari.layers.shapes.shape_utils import (
+    inside_triangles,
+    triangles_intersect_box,
+)
+
+
+def _mesh_arrays(shape_list):
+    """Return all the vertex and mesh arrays of a ShapeList."""
+    names = [
+        'vertices',
+        'vertices_centers',
+        'vertices_offsets',
+        'vertices_index',
+        'triangles',
+        'triangles_index',
+        'triangles_colors',
+        'displayed_triangles',
+        'displayed_triangles_index',
+        'displayed_triangles_colors',
+    ]
+    arrays = [shape_list._vertices, shape_list._index, shape_list._z_index]
+    arrays += [shape_list._z_order]
+    return arrays + [getattr(shape_list._mesh, name) for name in names]
 
 
 def test_empty_shape_list():
@@ -45,3 +73,293 @@ def test_nD_shapes():
     shape_list.ndisplay = 3
     assert shape_list._vertices.shape[1] == 3
     assert shape_list._mesh.vertices.shape[1] == 3
+
+
+def test_add_many_matches_add():
+    """Test adding shapes in bulk builds the same mesh as adding singly."""
+    np.random.seed(0)
+    shapes = [
+        Rectangle(20 * np.random.random((4, 2)), z_index=z) for z in [2, 0, 1]
+    ]
+    shapes += [Polygon(20 * np.random.random((6, 2)), z_index=-1)]
+    shapes += [Path(20 * np.random.random((5, 2)), z_index=3)]
+
+    single = ShapeList()
+    for shape in shapes:
+        single.add(shape)
+    bulk = ShapeList()
+    bulk.add_many(shapes)
+
+    assert bulk.shapes == shapes
+    for bulk_array, single_array in zip(
+        _mesh_arrays(bulk), _mesh_arrays(single)
+    ):
+        np.testing.assert_equal(bulk_array, single_array)
+
+
+def test_add_many_appends():
+    """Test bulk adding to a ShapeList that already holds shapes."""
+    np.random.seed(0)
+    shape_list = ShapeList([Rectangle(20 * np.random.random((4, 2)))])
+    shape_list.add_many([])
+    assert len(shape_list.shapes) == 1
+
+    new_shapes = [Path(20 * np.random.random((5, 2))) for i in range(3)]
+    shape_list.add_many(new_shapes)
+    assert shape_list.shapes[1:] == new_shapes
+    assert np.all(
+        np.unique(shape_list._mesh.triangles_index[:, 0]) == range(4)
+    )
+    assert shape_list._mesh.triangles.max() < len(shape_list._mesh.vertices)
+
+
+def test_remove_many_matches_remove():
+    """Test removing shapes in bulk matches removing them one at a time."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(8):
+        shape_cls = [Rectangle, Polygon, Path][i % 3]
+        shapes.append(shape_cls(20 * np.random.random((4, 2)), z_index=-i))
+
+    single = ShapeList(shapes)
+    for index in [6, 3, 0]:
+        single.remove(index)
+    bulk = ShapeList(shapes)
+    bulk.remove_many([3, 0, 6])
+
+    assert bulk.shapes == single.shapes
+    for bulk_array, single_array in zip(
+        _mesh_arrays(bulk), _mesh_arrays(single)
+    ):
+        np.testing.assert_equal(bulk_array, single_array)
+
+    bulk.remove_many([])
+    assert len(bulk.shapes) == 5
+    bulk.remove_many(range(5))
+    assert len(bulk.shapes) == 0
+    assert len(bulk._mesh.triangles) == 0
+
+
+def test_displayed_per_slice():
+    """Test the displayed shapes are found and cached for each slice."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(12):
+        data = 20 * np.random.random((4, 3))
+        data[:, 0] = i % 3
+        shape_cls = [Rectangle, Polygon, Path][i % 2]
+        shapes.append(shape_cls(data, z_index=(5 * i) % 7))
+    shape_list = ShapeList(shapes)
+
+    for plane in [2, 0, 1, 3]:
+        shape_list.slice_key = [plane]
+        expected = [shape.slice_key[0, 0] == plane for shape in shapes]
+        np.testing.assert_equal(shape_list._displayed, expected)
+        displayed = shape_list._mesh.displayed_triangles_index[:, 0]
+        assert set(displayed) == set(np.where(expected)[0])
+        # Triangles are drawn shape by shape following the z order
+        z_order = shape_list._z_order.tolist()
+        ranks = [z_order.index(index) for index in displayed]
+        assert np.all(np.diff(ranks) >= 0)
+        assert (plane,) in shape_list._displayed_cache
+
+    # Changing the shapes invalidates the cached slices
+    data = 20 * np.random.random((4, 3))
+    data[:, 0] = 2
+    shape_list.add(Polygon(data))
+    assert list(shape_list._displayed_cache) == [(3,)]
+    shape_list.slice_key = [2]
+    assert shape_list._displayed[-1]
+    assert np.sum(shape_list.displayed_index == 12) == 4
+
+
+def test_hit_testing_matches_all_triangles():
+    """Test hit testing with bounding boxes matches testing all triangles."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(30):
+        corner = 80 * np.random.random(2)
+        data = corner + 15 * np.random.random((4, 2))
+        shape_cls = [Rectangle, Polygon, Path][i % 3]
+        shapes.append(shape_cls(data, z_index=np.random.randint(10)))
+    shape_list = ShapeList(shapes)
+    # Moving shapes after the bounding boxes are built updates them in place
+    shape_list.inside([0, 0])
+    shape_list.shift(3, [40, -20])
+    shape_list.rotate(7, 30)
+    assert shape_list._boxes is not None
+
+    triangles = shape_list._mesh.vertices[shape_list._mesh.triangles]
+    shape_index = shape_list._mesh.triangles_index[:, 0]
+    z_list = shape_list._z_order.tolist()
+    for coord in 100 * np.random.random((50, 2)):
+        hits = shape_index[inside_triangles(triangles - coord)]
+        if len(hits) == 0:
+            assert shape_list.inside(coord) is None
+        else:
+            expected = min(hits, key=z_list.index)
+            assert shape_list.inside(coord) == expected
+
+    for i in range(20):
+        corners = 100 * np.random.random((2, 2))
+        hits = shape_index[triangles_intersect_box(triangles, corners)]
+        expected = np.unique(hits).tolist()
+        assert shape_list.shapes_in_box(corners) == expected
+
+
+def test_group_transforms_match_rebuild():
+    """Test transforming several shapes at once matches rebuilding them."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(12):
+        corner = 80 * np.random.random(2)
+        data = corner + 15 * np.random.random((4, 2))
+        shape_cls = [Rectangle, Polygon, Path, Ellipse][i % 4]
+        shapes.append(shape_cls(data, edge_width=i % 3 + 1))
+    shape_list = ShapeList(shapes)
+    shape_list._get_boxes()
+
+    selected = [1, 2, 3, 6, 7, 11]
+    shape_list.shift(selected, [5, -3])
+    shape_list.rotate(selected, 30, center=np.array([10, 20]))
+    shape_list.flip(selected, 0)
+    shape_list.scale(selected, [4, 0.5], center=np.array([0, 5]))
+    shape_list.transform(selected, np.array([[1, 0.3], [0, 1]]))
+    shape_list._get_boxes()
+    shape_list.shift(0, [1, 1])
+    shape_list.rotate([0, 4], 45)
+    assert shape_list._boxes is not None
+
+    # Shapes whose triangulation changed are appended at the end of the mesh
+    expected = ShapeList(shape_list.shapes)
+    for i in range(len(shapes)):
+        for sl in [shape_list, expected]:
+            mesh = sl._mesh
+            mesh_vertices = mesh.vertices_index[:, 0] == i
+            arrays = [
+                sl._vertices[sl._index == i],
+                mesh.vertices[mesh_vertices],
+                mesh.vertices_offsets[mesh_vertices],
+                mesh.vertices[mesh.triangles[mesh.triangles_index[:, 0] == i]],
+            ]
+            if sl is shape_list:
+                result = arrays
+        for x, y in zip(result, arrays):
+            np.testing.assert_allclose(x, y)
+    np.testing.assert_allclose(shape_list._boxes, expected._get_boxes())
+
+
+def test_outline():
+    """Test outlines gather the edge meshes and follow shape changes."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(8):
+        data = 80 * np.random.random(2) + 15 * np.random.random((4, 2))
+        shape_cls = [Rectangle, Polygon, Path, Ellipse][i % 4]
+        shapes.append(shape_cls(data))
+    shape_list = ShapeList(shapes)
+
+    indices = [1, 2, 6]
+    centers, offsets, triangles = shape_list.outline(indices)
+    assert shape_list.outline(indices)[0] is centers
+    mesh = shape_list._mesh
+    expected = []
+    for i in indices:
+        edge = np.all(mesh.vertices_index == [i, 1], axis=1)
+        edge_triangles = np.all(mesh.triangles_index == [i, 1], axis=1)
+        expected.append(mesh.vertices_centers[mesh.triangles[edge_triangles]])
+        np.testing.assert_allclose(
+            shape_list.outline(i)[0], mesh.vertices_centers[edge]
+        )
+    np.testing.assert_allclose(centers[triangles], np.concatenate(expected))
+    assert len(offsets) == len(centers)
+
+    shape_list.shift(indices, [1, 2])
+    np.testing.assert_allclose(
+        shape_list.outline(indices)[0], centers + [1, 2]
+    )
+
+
+def test_rasterizing_into_shared_buffers():
+    """Test labels and colors are painted from the masks in z order."""
+    np.random.seed(0)
+    shapes = []
+    for i in range(12):
+        corner = 30 * np.random.random(2) - 5
+        data = corner + 20 * np.random.random((4, 2))
+        shape_cls = [Rectangle, Polygon, Path][i % 3]
+        shapes.append(
+            shape_cls(data, z_index=np.random.randint(5), face_color='red')
+        )
+    shape_list = ShapeList(shapes)
+    mask_shape = (40, 35)
+
+    masks = shape_list.to_masks(mask_shape)
+    expected = [shape.to_mask(mask_shape) for shape in shapes]
+    np.testing.assert_equal(masks, expected)
+
+    labels = shape_list.to_labels(mask_shape)
+    colors = shape_list.to_colors(mask_shape, zoom_factor=0.5, offset=[2, 1])
+    expected_labels = np.zeros(mask_shape, dtype=int)
+    expected_colors = np.zeros(mask_shape + (4,))
+    expected_colors[..., 3] = 1
+    for index in shape_list._z_order[::-1]:
+        expected_labels[masks[index]] = index + 1
+        mask = shapes[index].to_mask(
+            mask_shape, zoom_factor=0.5, offset=[2, 1]
+        )
+        if isinstance(shapes[index], Path):
+            expected_colors[mask] = shapes[index].edge_color.rgba
+        else:
+            expected_colors[mask] = shapes[index].face_color.rgba
+    np.testing.assert_equal(labels, expected_labels)
+    np.testing.assert_equal(colors, expected_colors)
+
+
+def test_property_columns():
+    """Test per-shape properties are kept in arrays in sync with shapes."""
+    np.random.seed(0)
+    shapes = [
+        Rectangle(20 * np.random.random((4, 2)), edge_width=i, opacity=i / 10)
+        for i in range(5)
+    ]
+    shape_list = ShapeList(shapes)
+    shape_list.update_edge_width(1, 7)
+    shape_list.update_opacity(2, 0.9)
+    shape_list.update_z_index(3, 4)
+    shape_list.remove(0)
+    shape_list.edit(0, 20 * np.random.random((4, 2)), new_type='ellipse')
+
+    assert shape_list.edge_widths == [s.edge_width for s in shape_list.shapes]
+    assert shape_list.opacities == [s.opacity for s in shape_list.shapes]
+    assert shape_list.z_indices == [s.z_index for s in shape_list.shapes]
+    assert shape_list.edge_widths == [7, 2, 3, 4]
+    assert shape_list.opacities == [0.1, 0.9, 0.3, 0.4]
+    assert shape_list.z_indices == [0, 0, 4, 0]
+    # Shapes store their attributes in slots
+    assert not any(hasattr(s, '__dict__') for s in shape_list.shapes)
+
+
+def test_update_z_index_incrementally():
+    """Test z order updates keep the meshes and match a full sort."""
+    np.random.seed(0)
+    shapes = [
+        Polygon(20 * np.random.random((5, 2)), z_index=np.random.randint(4))
+        for i in range(20)
+    ]
+    shape_list = ShapeList(shapes)
+    ranges = shape_list._get_ranges()
+
+    for i in range(30):
+        shape_list.update_z_index(np.random.randint(20), np.random.randint(6))
+        expected = np.argsort(shape_list._z_index, kind='stable')
+        np.testing.assert_equal(shape_list._z_order, expected)
+    shape_list.update_z_index([3, 5, 8], -1)
+    assert shape_list._z_order[:3].tolist() == [3, 5, 8]
+    assert shape_list.z_indices == [s.z_index for s in shape_list.shapes]
+
+    # Only the drawing order of the displayed triangles changed
+    assert shape_list._get_ranges() is ranges
+    displayed = shape_list._mesh.displayed_triangles_index[:, 0]
+    ranks = [shape_list._z_order.tolist().index(i) for i in displayed]
+    assert np.all(np.diff(ranks) >= 0)
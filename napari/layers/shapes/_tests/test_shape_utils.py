@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from napari.layers.shapes.shape_utils import (
+    center_radii_to_corners,
+    ellipse_segments,
+    grid_points_in_poly,
+    path_to_mask,
+    points_in_poly,
+    poly_to_mask,
+    triangulate_ellipse,
+)
+
+
+def _path_to_mask_by_segment(mask_shape, vertices):
+    """Rasterize a path one point at a time."""
+    mask = np.zeros(mask_shape, dtype=bool)
+    vertices = np.round(
+        np.clip(vertices, 0, np.subtract(mask_shape, 1))
+    ).astype(int)
+    for start, stop in zip(vertices[:-1], vertices[1:]):
+        step = np.max(abs(stop - start))
+        x_vals = np.linspace(start[0], stop[0], step)
+        y_vals = np.linspace(start[1], stop[1], step)
+        for x, y in zip(x_vals, y_vals):
+            mask[int(x), int(y)] = 1
+    return mask
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_grid_points_in_poly(seed):
+    """Test the scanline fill matches ray casting every grid point."""
+    np.random.seed(seed)
+    shape = (23, 31)
+    for i in range(40):
+        vertices = 35 * np.random.random((np.random.randint(3, 12), 2)) - 3
+        if i % 2:
+            # Vertices on grid points exercise the half open crossing rule
+            vertices = np.round(vertices)
+        points = np.stack(np.indices(shape), axis=-1).reshape(-1, 2)
+        expected = points_in_poly(points, vertices).reshape(shape)
+        np.testing.assert_equal(grid_points_in_poly(shape, vertices), expected)
+
+
+def test_poly_to_mask():
+    """Test a polygon mask is placed at its bounding box."""
+    vertices = np.array([[2, 3], [2, 8], [6, 8], [6, 3]])
+    mask = poly_to_mask((10, 10), vertices)
+    expected = np.zeros((10, 10), dtype=bool)
+    expected[2:6, 3:8] = True
+    np.testing.assert_equal(mask, expected)
+
+    # Polygons outside the mask are clipped
+    assert not np.any(poly_to_mask((10, 10), vertices + 20))
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_path_to_mask(seed):
+    """Test rasterizing all path segments at once."""
+    np.random.seed(seed)
+    for i in range(20):
+        vertices = 40 * np.random.random((np.random.randint(1, 8), 2)) - 5
+        mask = path_to_mask((30, 25), vertices)
+        expected = _path_to_mask_by_segment((30, 25), vertices)
+        np.testing.assert_equal(mask, expected)
+
+
+@pytest.mark.parametrize('radius', [0.05, 1, 5, 20, 100, 1000])
+def test_triangulate_ellipse_adaptive(radius):
+    """Test the boundary stays within tolerance with size based segments."""
+    corners = center_radii_to_corners(np.array([3, 4]), np.array([radius] * 2))
+    num_segments = ellipse_segments(corners)
+    vertices, triangles = triangulate_ellipse(corners)
+    assert len(vertices) == num_segments + 1
+    assert len(triangles) == num_segments
+    assert num_segments <= 100
+    if num_segments < 100:
+        # midpoint of each chord lies within the tolerance of the circle
+        boundary = vertices[1:] - [3, 4]
+        mid = (boundary + np.roll(boundary, -1, axis=0)) / 2
+        assert np.all(radius - np.linalg.norm(mid, axis=1) < 0.1 + 1e-4)
+
+
+def test_ellipse_segments_grow_with_size():
+    """Test larger ellipses never use fewer segments."""
+    counts = [
+        ellipse_segments(
+            center_radii_to_corners(np.zeros(2), np.array([r, r]))
+        )
+        for r in [0.5, 2, 8, 32, 128, 512]
+    ]
+    assert counts == sorted(counts)
+    assert counts[0] < counts[-1] == 100
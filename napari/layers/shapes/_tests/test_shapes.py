@@ -1,4 +1,6 @@
 import numpy as np
+import pytest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from xml.etree.ElementTree import Element
 from napari.layers import Shapes
 
@@ -347,6 +349,37 @@ def test_adding_shapes():
     assert np.all([s == so for s, so in zip(layer.shape_type, all_shape_type)])
 
 
+@pytest.mark.parametrize(
+    'executor_cls', [ThreadPoolExecutor, ProcessPoolExecutor]
+)
+def test_adding_shapes_with_executor(executor_cls):
+    """Test adding shapes triangulated in batches by an executor."""
+    np.random.seed(0)
+    data = [
+        20 * np.random.random((np.random.randint(3, 12), 2)) for i in range(15)
+    ] + list(20 * np.random.random((10, 4, 2)))
+    shape_type = ['polygon'] * 10 + ['path'] * 5 + ['rectangle', 'ellipse'] * 5
+    expected = Shapes(data, shape_type=shape_type)
+
+    layer = Shapes()
+    layer._triangulation_batch_size = 4
+    messages = []
+    layer.events.status.connect(lambda e: messages.append(e.status))
+    with executor_cls(max_workers=2) as executor:
+        layer.add(data, shape_type=shape_type, executor=executor)
+    assert layer.nshapes == len(data)
+    assert layer.shape_type == expected.shape_type
+    progress = [f'added {n} of 25 shapes' for n in [4, 8, 12, 16, 20, 24, 25]]
+    assert messages[: len(progress)] == progress
+    assert np.all([np.all(ld == d) for ld, d in zip(layer.data, data)])
+    np.testing.assert_equal(
+        layer._data_view._mesh.triangles, expected._data_view._mesh.triangles
+    )
+    np.testing.assert_equal(
+        layer._data_view._mesh.vertices, expected._data_view._mesh.vertices
+    )
+
+
 def test_adding_shapes_to_empty():
     """Test adding shapes to empty."""
     data = np.empty((0, 0, 2))
@@ -902,6 +935,30 @@ def test_thumbnail():
     assert layer.thumbnail.shape == layer._thumbnail_shape
 
 
+def test_thumbnail_while_moving():
+    """Test the thumbnail is throttled while moving and follows the data."""
+    np.random.seed(0)
+    data = 20 * np.random.random((10, 4, 2))
+    layer = Shapes(data)
+    layer._update_thumbnail()
+    thumbnail = layer.thumbnail
+
+    layer._is_moving = True
+    layer._data_view.shift(list(range(5)), [3, 3])
+    layer._update_thumbnail()
+    np.testing.assert_array_equal(layer.thumbnail, thumbnail)
+
+    layer._is_moving = False
+    layer._update_thumbnail()
+    assert not np.array_equal(layer.thumbnail, thumbnail)
+    # Cached masks give the same thumbnail as rasterizing every shape
+    thumbnail = layer.thumbnail
+    for shape in layer._data_view.shapes:
+        shape._mask_cache = None
+    layer._update_thumbnail()
+    np.testing.assert_array_equal(layer.thumbnail, thumbnail)
+
+
 def test_to_masks():
     """Test the mask generation."""
     shape = (10, 4, 2)
@@ -38,9 +38,6 @@ class Mesh:
         corresponds and the mesh type (0, 1) for face or edge.
     triangles_colors : np.ndarray
         Px4 array of the rgba color of each triangle
-    triangles_z_order : np.ndarray
-        Length P array of the z order of each triangle. Must be a permutation
-        of (0, ..., P-1)
 
     Extended Summary
     ----------
@@ -66,7 +63,6 @@ class Mesh:
         self.triangles = np.empty((0, 3), dtype=np.uint32)
         self.triangles_index = np.empty((0, 2), dtype=int)
         self.triangles_colors = np.empty((0, 4))
-        self.triangles_z_order = np.empty((0), dtype=int)
 
         self.displayed_triangles = np.empty((0, 3), dtype=np.uint32)
         self.displayed_triangles_index = np.empty((0, 2), dtype=int)
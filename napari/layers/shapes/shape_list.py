@@ -1,5 +1,6 @@
 import numpy as np
 from .shape_models import Shape, Line, Path
+from ..layer_utils import ranges_to_indices
 from .shape_utils import inside_triangles, triangles_intersect_box
 from .mesh import Mesh
 from ._constants import shape_classes, ShapeType
@@ -51,12 +52,33 @@ class ShapeList:
         vertex corresponds to
     _z_index : np.ndarray
         Length N array with z_index of each shape
+    _edge_width : np.ndarray
+        Length N array with edge width of each shape
+    _opacity : np.ndarray
+        Length N array with opacity of each shape
     _z_order : np.ndarray
         Length N array with z_order of each shape. This must be a permutation
         of (0, ..., N-1).
     _mesh : Mesh
         Mesh object containing all the mesh information that will ultimately
         be rendered.
+    _ranges : dict | None
+        Start and count of the vertices and triangles of each shape, which
+        are always contiguous in their arrays. None if out of date.
+    _slice_index : dict | None
+        Map from a slice key to the indices of the shapes displayed in that
+        slice. None if out of date.
+    _boxes : (N, 2, D) array | None
+        Min and max corner of the axis aligned bounding box of the mesh of
+        each shape, used to find candidate shapes for hit testing before
+        testing their triangles. None if out of date.
+    _displayed_cache : dict
+        Map from a slice key to the displayed shapes, displayed triangle
+        positions in z order and displayed vertex positions of that slice.
+        Cleared whenever the shapes or their z order change.
+    _outline : tuple | None
+        Indices of the last outlined shapes and their outline centers,
+        offsets and triangles. None if out of date.
     """
 
     def __init__(self, data=[], ndisplay=2):
@@ -70,12 +92,18 @@ class ShapeList:
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
         self._z_index = np.empty((0), dtype=int)
+        self._edge_width = np.empty((0))
+        self._opacity = np.empty((0))
         self._z_order = np.empty((0), dtype=int)
+        self._ranges = None
+        self._slice_index = None
+        self._boxes = None
+        self._displayed_cache = {}
+        self._outline = None
 
         self._mesh = Mesh(ndisplay=self.ndisplay)
 
-        for d in data:
-            self.add(d)
+        self.add_many(data)
 
     @property
     def data(self):
@@ -96,11 +124,11 @@ class ShapeList:
         self._mesh.ndisplay = self.ndisplay
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
-        for index in range(len(self.shapes)):
-            shape = self.shapes[index]
+        # Shapes keep the meshes of previous displays, so switching back and
+        # forth only rebuilds the combined mesh
+        for shape in self.shapes:
             shape.ndisplay = self.ndisplay
-            self.remove(index, renumber=False)
-            self.add(shape, shape_index=index)
+        self._append_meshes(self.shapes, range(len(self.shapes)))
         self._update_z_order()
 
     @property
@@ -126,17 +154,17 @@ class ShapeList:
     @property
     def edge_widths(self):
         """list of float: edge width for each shape."""
-        return [s.edge_width for s in self.shapes]
+        return self._edge_width.tolist()
 
     @property
     def opacities(self):
         """list of float: opacity for each shape."""
-        return [s.opacity for s in self.shapes]
+        return self._opacity.tolist()
 
     @property
     def z_indices(self):
         """list of int: z-index for each shape."""
-        return [s.z_index for s in self.shapes]
+        return self._z_index.tolist()
 
     @property
     def slice_key(self):
@@ -152,35 +180,229 @@ class ShapeList:
 
     def _update_displayed(self):
         """Update the displayed data based on the slice key."""
-        # The list slice key is repeated to check against both the min and
-        # max values stored in the shapes slice key.
-        slice_key = np.array([self.slice_key, self.slice_key])
-
-        # Slice key must exactly match mins and maxs of shape as then the
-        # shape is entirely contained within the current slice.
-        if len(self.shapes) > 0:
-            self._displayed = np.all(self.slice_keys == slice_key, axis=(1, 2))
-        else:
-            self._displayed = []
-        disp_indices = np.where(self._displayed)[0]
+        key = tuple(self.slice_key)
+        if key not in self._displayed_cache:
+            self._displayed_cache[key] = self._find_displayed(key)
+        displayed, triangles, vertices = self._displayed_cache[key]
 
-        z_order = self._mesh.triangles_z_order
-        disp_tri = np.isin(
-            self._mesh.triangles_index[z_order, 0], disp_indices
-        )
-        self._mesh.displayed_triangles = self._mesh.triangles[z_order][
-            disp_tri
-        ]
+        self._displayed = displayed
+        self._mesh.displayed_triangles = self._mesh.triangles[triangles]
         self._mesh.displayed_triangles_index = self._mesh.triangles_index[
-            z_order
-        ][disp_tri]
+            triangles
+        ]
         self._mesh.displayed_triangles_colors = self._mesh.triangles_colors[
-            z_order
-        ][disp_tri]
+            triangles
+        ]
+        self.displayed_vertices = self._vertices[vertices]
+        self.displayed_index = self._index[vertices]
+
+    def _find_displayed(self, key):
+        """Find the shapes, triangles and vertices displayed in a slice.
+
+        Parameters
+        ----------
+        key : tuple
+            Slice key of the non-displayed dimensions.
+
+        Returns
+        -------
+        displayed : (N,) array | list
+            Bool for each shape that is True if the shape is displayed.
+        triangles : (P,) array
+            Positions of the displayed triangles in the mesh, in z order.
+        vertices : (M,) array
+            Positions of the displayed vertices.
+        """
+        nshapes = len(self.shapes)
+        if nshapes == 0:
+            empty = np.empty(0, dtype=int)
+            return [], empty, empty
+
+        if len(key) == np.shape(self.shapes[0].slice_key)[-1]:
+            disp_indices = self._get_slice_index().get(
+                key, np.empty(0, dtype=int)
+            )
+        else:
+            # Slice key must exactly match mins and maxs of shape as then the
+            # shape is entirely contained within the current slice.
+            slice_key = np.array([key, key])
+            matches = np.all(self.slice_keys == slice_key, axis=(1, 2))
+            disp_indices = np.where(matches)[0]
+
+        displayed = np.zeros(nshapes, dtype=bool)
+        displayed[disp_indices] = True
+
+        ranges = self._get_ranges()
+        z_rank = self._z_rank()
+        in_z_order = disp_indices[np.argsort(z_rank[disp_indices])]
+        triangles = ranges_to_indices(
+            ranges['triangles_start'][in_z_order],
+            ranges['triangles_count'][in_z_order],
+        )
+        in_place = disp_indices[
+            np.argsort(ranges['vertices_start'][disp_indices])
+        ]
+        vertices = ranges_to_indices(
+            ranges['vertices_start'][in_place],
+            ranges['vertices_count'][in_place],
+        )
+        return displayed, triangles, vertices
+
+    def _z_rank(self):
+        """(N,) array: position of each shape in the z order."""
+        z_rank = np.empty(len(self.shapes), dtype=int)
+        z_rank[self._z_order] = np.arange(len(self.shapes))
+        return z_rank
+
+    def _get_slice_index(self):
+        """dict: map from slice key to the indices of the shapes in it."""
+        if self._slice_index is None:
+            slice_keys = self.slice_keys
+            # Only shapes whose mins and maxs are equal lie within one slice
+            planar = np.where(
+                np.all(slice_keys[:, 0] == slice_keys[:, 1], axis=1)
+            )[0]
+            keys, inverse = np.unique(
+                slice_keys[planar, 0], axis=0, return_inverse=True
+            )
+            order = np.argsort(inverse, kind='stable')
+            groups = np.split(
+                planar[order], np.cumsum(np.bincount(inverse))[:-1]
+            )
+            self._slice_index = {
+                tuple(k): g for k, g in zip(keys.tolist(), groups)
+            }
+        return self._slice_index
+
+    def _get_ranges(self):
+        """dict: start and count of the vertices, mesh vertices and triangles
+        of each shape."""
+        if self._ranges is None:
+            nshapes = len(self.shapes)
+            self._ranges = {}
+            for name, index in [
+                ('vertices', self._index),
+                ('mesh_vertices', self._mesh.vertices_index[:, 0]),
+                ('triangles', self._mesh.triangles_index[:, 0]),
+            ]:
+                shape_ids, starts = np.unique(index, return_index=True)
+                self._ranges[name + '_start'] = np.zeros(nshapes, dtype=int)
+                self._ranges[name + '_start'][shape_ids] = starts
+                self._ranges[name + '_count'] = np.bincount(
+                    index, minlength=nshapes
+                )
+            # The face mesh of each shape comes before its edge mesh
+            for name, index in [
+                ('mesh_vertices', self._mesh.vertices_index),
+                ('triangles', self._mesh.triangles_index),
+            ]:
+                self._ranges[name + '_face_count'] = np.bincount(
+                    index[index[:, 1] == 0, 0], minlength=nshapes
+                )
+        return self._ranges
+
+    def _get_boxes(self):
+        """(N, 2, D) array: bounding box of the mesh of each shape."""
+        if self._boxes is None:
+            nshapes = len(self.shapes)
+            ranges = self._get_ranges()
+            starts = ranges['mesh_vertices_start']
+            counts = ranges['mesh_vertices_count']
+            self._boxes = np.empty((nshapes, 2, self._mesh.vertices.shape[1]))
+            self._boxes[:, 0] = np.inf
+            self._boxes[:, 1] = -np.inf
+            # The mesh vertices of each shape are contiguous, so in order of
+            # their starts the shapes split the vertices into segments
+            nonempty = np.where(counts > 0)[0]
+            nonempty = nonempty[np.argsort(starts[nonempty])]
+            if len(nonempty) > 0:
+                vertices = self._mesh.vertices
+                self._boxes[nonempty, 0] = np.minimum.reduceat(
+                    vertices, starts[nonempty], axis=0
+                )
+                self._boxes[nonempty, 1] = np.maximum.reduceat(
+                    vertices, starts[nonempty], axis=0
+                )
+        return self._boxes
+
+    def _update_box(self, index):
+        """Recompute the bounding boxes of shapes if boxes are cached.
+
+        Parameters
+        ----------
+        index : int | list
+            Location in list of the shape that changed. If list must be a
+            list of int.
+        """
+        if self._boxes is None:
+            return
+        ranges = self._get_ranges()
+        indices = np.atleast_1d(np.asarray(index, dtype=int))
+        counts = ranges['mesh_vertices_count'][indices]
+        indices = indices[counts > 0]
+        counts = counts[counts > 0]
+        if len(indices) == 0:
+            return
+        vertices = self._mesh.vertices[
+            ranges_to_indices(ranges['mesh_vertices_start'][indices], counts)
+        ]
+        bounds = np.cumsum(counts) - counts
+        self._boxes[indices, 0] = np.minimum.reduceat(vertices, bounds, axis=0)
+        self._boxes[indices, 1] = np.maximum.reduceat(vertices, bounds, axis=0)
+
+    def _displayed_in_bounds(self, corners):
+        """Find displayed shapes whose bounding boxes overlap a box.
+
+        Parameters
+        ----------
+        corners : (2, D) array
+            Two corners of an axis aligned box. May be equal to query a point.
 
-        disp_vert = np.isin(self._index, disp_indices)
-        self.displayed_vertices = self._vertices[disp_vert]
-        self.displayed_index = self._index[disp_vert]
+        Returns
+        -------
+        candidates : (M,) array
+            Indices of displayed shapes whose bounding box overlaps the box.
+        inside : (M,) array
+            Bool for each candidate that is True if its bounding box lies
+            entirely inside the box.
+        """
+        corners = np.asarray(corners, dtype=float)
+        ndim = corners.shape[1]
+        candidates = np.where(self._displayed)[0]
+        boxes = self._get_boxes()[candidates][:, :, -ndim:]
+        low = corners.min(axis=0)
+        high = corners.max(axis=0)
+        overlap = np.all((boxes[:, 0] <= high) & (boxes[:, 1] >= low), axis=1)
+        inside = np.all((boxes[:, 0] >= low) & (boxes[:, 1] <= high), axis=1)
+        return candidates[overlap], inside[overlap]
+
+    def _shape_triangles(self, indices):
+        """Positions in the mesh of the triangles of a set of shapes.
+
+        Parameters
+        ----------
+        indices : (M,) array
+            Locations in list of the shapes.
+
+        Returns
+        -------
+        triangles : (P,) array
+            Positions of the triangles of the shapes in the mesh.
+        """
+        ranges = self._get_ranges()
+        return ranges_to_indices(
+            ranges['triangles_start'][indices],
+            ranges['triangles_count'][indices],
+        )
+
+    def _reset_indices(self):
+        """Mark the cached ranges, slice index, displayed sets and outline
+        stale."""
+        self._ranges = None
+        self._slice_index = None
+        self._boxes = None
+        self._displayed_cache = {}
+        self._outline = None
 
     def add(self, shape, shape_index=None):
         """Adds a single Shape object
@@ -195,94 +417,132 @@ class ShapeList:
             conjunction with `remove` when renumber is `False`. If None, then
             appends a new shape to end of shapes list
         """
+        if shape_index is None:
+            self.add_many([shape])
+            return
+
         if not issubclass(type(shape), Shape):
             raise ValueError('shape must be subclass of Shape')
 
-        if shape_index is None:
-            z_refresh = True
-            shape_index = len(self.shapes)
-            self.shapes.append(shape)
-            self._z_index = np.append(self._z_index, shape.z_index)
-        else:
-            z_refresh = False
-            self.shapes[shape_index] = shape
-            self._z_index[shape_index] = shape.z_index
+        self.shapes[shape_index] = shape
+        self._z_index[shape_index] = shape.z_index
+        self._edge_width[shape_index] = shape.edge_width
+        self._opacity[shape_index] = shape.opacity
+        self._append_meshes([shape], [shape_index])
 
-        self._vertices = np.append(
-            self._vertices, shape.data_displayed, axis=0
-        )
-        index = np.repeat(shape_index, len(shape.data))
-        self._index = np.append(self._index, index, axis=0)
+    def add_many(self, shapes):
+        """Adds a sequence of Shape objects in a single pass.
 
-        # Add faces to mesh
-        m = len(self._mesh.vertices)
-        vertices = shape._face_vertices
-        self._mesh.vertices = np.append(self._mesh.vertices, vertices, axis=0)
-        vertices = shape._face_vertices
-        self._mesh.vertices_centers = np.append(
-            self._mesh.vertices_centers, vertices, axis=0
-        )
-        vertices = np.zeros(shape._face_vertices.shape)
-        self._mesh.vertices_offsets = np.append(
-            self._mesh.vertices_offsets, vertices, axis=0
-        )
-        index = np.repeat([[shape_index, 0]], len(vertices), axis=0)
-        self._mesh.vertices_index = np.append(
-            self._mesh.vertices_index, index, axis=0
-        )
+        The meshes of all the shapes are concatenated once and the z order
+        and displayed set are only updated once, which makes adding many
+        shapes linear rather than quadratic in the number of shapes.
 
-        triangles = shape._face_triangles + m
-        self._mesh.triangles = np.append(
-            self._mesh.triangles, triangles, axis=0
-        )
-        index = np.repeat([[shape_index, 0]], len(triangles), axis=0)
-        self._mesh.triangles_index = np.append(
-            self._mesh.triangles_index, index, axis=0
-        )
-        color = shape.face_color.rgba
-        color[3] = color[3] * shape.opacity
-        color_array = np.repeat([color], len(triangles), axis=0)
-        self._mesh.triangles_colors = np.append(
-            self._mesh.triangles_colors, color_array, axis=0
-        )
+        Parameters
+        ----------
+        shapes : iterable of subclass Shape
+            Each element must be a subclass of Shape, one of "{'Line',
+            'Rectangle', 'Ellipse', 'Path', 'Polygon'}"
+        """
+        shapes = list(shapes)
+        for shape in shapes:
+            if not issubclass(type(shape), Shape):
+                raise ValueError('shape must be subclass of Shape')
+        if len(shapes) == 0:
+            return
 
-        # Add edges to mesh
-        m = len(self._mesh.vertices)
-        vertices = (
-            shape._edge_vertices + shape.edge_width * shape._edge_offsets
-        )
-        self._mesh.vertices = np.append(self._mesh.vertices, vertices, axis=0)
-        vertices = shape._edge_vertices
-        self._mesh.vertices_centers = np.append(
-            self._mesh.vertices_centers, vertices, axis=0
+        indices = range(len(self.shapes), len(self.shapes) + len(shapes))
+        self.shapes.extend(shapes)
+        self._z_index = np.concatenate(
+            [self._z_index, [s.z_index for s in shapes]]
+        ).astype(int)
+        self._edge_width = np.concatenate(
+            [self._edge_width, [s.edge_width for s in shapes]]
         )
-        vertices = shape._edge_offsets
-        self._mesh.vertices_offsets = np.append(
-            self._mesh.vertices_offsets, vertices, axis=0
-        )
-        index = np.repeat([[shape_index, 1]], len(vertices), axis=0)
-        self._mesh.vertices_index = np.append(
-            self._mesh.vertices_index, index, axis=0
+        self._opacity = np.concatenate(
+            [self._opacity, [s.opacity for s in shapes]]
         )
+        self._append_meshes(shapes, indices)
+        self._update_z_order()
 
-        triangles = shape._edge_triangles + m
-        self._mesh.triangles = np.append(
-            self._mesh.triangles, triangles, axis=0
-        )
-        index = np.repeat([[shape_index, 1]], len(triangles), axis=0)
-        self._mesh.triangles_index = np.append(
-            self._mesh.triangles_index, index, axis=0
-        )
-        color = shape.edge_color.rgba
-        color[3] = color[3] * shape.opacity
-        color_array = np.repeat([color], len(triangles), axis=0)
-        self._mesh.triangles_colors = np.append(
-            self._mesh.triangles_colors, color_array, axis=0
-        )
+    def _append_meshes(self, shapes, indices):
+        """Appends the vertices and meshes of shapes to the end of the mesh.
 
-        if z_refresh:
-            # Set z_order
-            self._update_z_order()
+        For each shape the face mesh is appended followed by the edge mesh,
+        so that the triangles of a shape are always contiguous.
+
+        Parameters
+        ----------
+        shapes : list of subclass Shape
+            Shapes whose vertices and meshes are to be appended.
+        indices : sequence of int
+            Index of each shape in the shapes list.
+        """
+        ndisplay = self.ndisplay
+        vertices = [self._vertices]
+        index = [self._index]
+        mesh_vertices = [self._mesh.vertices]
+        centers = [self._mesh.vertices_centers]
+        offsets = [self._mesh.vertices_offsets]
+        vertices_index = [self._mesh.vertices_index]
+        triangles = [self._mesh.triangles]
+        triangles_index = [self._mesh.triangles_index]
+        colors = [self._mesh.triangles_colors]
+
+        m = len(self._mesh.vertices)
+        for shape, shape_index in zip(shapes, indices):
+            vertices.append(shape.data_displayed)
+            index.append(np.repeat(shape_index, len(shape.data)))
+
+            face_color = shape.face_color.rgba
+            face_color[3] = face_color[3] * shape.opacity
+            edge_color = shape.edge_color.rgba
+            edge_color[3] = edge_color[3] * shape.opacity
+
+            # Add faces and then edges to mesh
+            face_vertices = shape._face_vertices.reshape(-1, ndisplay)
+            edge_vertices = shape._edge_vertices.reshape(-1, ndisplay)
+            edge_offsets = shape._edge_offsets.reshape(-1, ndisplay)
+            meshes = [
+                (
+                    0,
+                    face_vertices,
+                    face_vertices,
+                    np.zeros(face_vertices.shape),
+                    shape._face_triangles,
+                    face_color,
+                ),
+                (
+                    1,
+                    edge_vertices + shape.edge_width * edge_offsets,
+                    edge_vertices,
+                    edge_offsets,
+                    shape._edge_triangles,
+                    edge_color,
+                ),
+            ]
+            for mesh_type, verts, cents, offs, tris, color in meshes:
+                mesh_vertices.append(verts)
+                centers.append(cents)
+                offsets.append(offs)
+                vertices_index.append(
+                    np.repeat([[shape_index, mesh_type]], len(verts), axis=0)
+                )
+                triangles.append(np.reshape(tris, (-1, 3)) + m)
+                triangles_index.append(
+                    np.repeat([[shape_index, mesh_type]], len(tris), axis=0)
+                )
+                colors.append(np.repeat([color], len(tris), axis=0))
+                m += len(verts)
+
+        self._vertices = np.concatenate(vertices, axis=0)
+        self._index = np.concatenate(index, axis=0).astype(int)
+        self._mesh.vertices = np.concatenate(mesh_vertices, axis=0)
+        self._mesh.vertices_centers = np.concatenate(centers, axis=0)
+        self._mesh.vertices_offsets = np.concatenate(offsets, axis=0)
+        self._mesh.vertices_index = np.concatenate(vertices_index, axis=0)
+        self._mesh.triangles = np.concatenate(triangles, axis=0)
+        self._mesh.triangles_index = np.concatenate(triangles_index, axis=0)
+        self._mesh.triangles_colors = np.concatenate(colors, axis=0)
 
     def remove_all(self):
         """Removes all shapes
@@ -291,8 +551,11 @@ class ShapeList:
         self._vertices = np.empty((0, self.ndisplay))
         self._index = np.empty((0), dtype=int)
         self._z_index = np.empty((0), dtype=int)
+        self._edge_width = np.empty((0))
+        self._opacity = np.empty((0))
         self._z_order = np.empty((0), dtype=int)
         self._mesh.clear()
+        self._reset_indices()
         self._update_displayed()
 
     def remove(self, index, renumber=True):
@@ -307,44 +570,78 @@ class ShapeList:
             expectation is that this shape is being immediately readded to the
             list using `add_shape`.
         """
-        indices = self._index != index
-        self._vertices = self._vertices[indices]
-        self._index = self._index[indices]
+        if renumber:
+            self.remove_many([index])
+        else:
+            self._remove_meshes([index])
+
+    def remove_many(self, indices):
+        """Removes several shapes in a single pass.
+
+        All the vertex and mesh arrays are compacted once and the remaining
+        shapes are renumbered with a single lookup table.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Locations in list of the shapes to be removed.
+        """
+        indices = np.unique(np.asarray(indices, dtype=int))
+        if len(indices) == 0:
+            return
 
-        # Remove triangles
-        indices = self._mesh.triangles_index[:, 0] != index
-        self._mesh.triangles = self._mesh.triangles[indices]
-        self._mesh.triangles_colors = self._mesh.triangles_colors[indices]
-        self._mesh.triangles_index = self._mesh.triangles_index[indices]
-
-        # Remove vertices
-        indices = self._mesh.vertices_index[:, 0] != index
-        self._mesh.vertices = self._mesh.vertices[indices]
-        self._mesh.vertices_centers = self._mesh.vertices_centers[indices]
-        self._mesh.vertices_offsets = self._mesh.vertices_offsets[indices]
-        self._mesh.vertices_index = self._mesh.vertices_index[indices]
-        indices = np.where(np.invert(indices))[0]
-        num_indices = len(indices)
-        if num_indices > 0:
-            indices = self._mesh.triangles > indices[0]
-            self._mesh.triangles[indices] = (
-                self._mesh.triangles[indices] - num_indices
-            )
+        self._remove_meshes(indices)
 
-        if renumber:
-            del self.shapes[index]
-            indices = self._index > index
-            self._index[indices] = self._index[indices] - 1
-            self._z_index = np.delete(self._z_index, index)
-            indices = self._mesh.triangles_index[:, 0] > index
-            self._mesh.triangles_index[indices, 0] = (
-                self._mesh.triangles_index[indices, 0] - 1
-            )
-            indices = self._mesh.vertices_index[:, 0] > index
-            self._mesh.vertices_index[indices, 0] = (
-                self._mesh.vertices_index[indices, 0] - 1
-            )
-            self._update_z_order()
+        keep = np.ones(len(self.shapes), dtype=bool)
+        keep[indices] = False
+        self.shapes = [s for s, k in zip(self.shapes, keep) if k]
+        self._z_index = self._z_index[keep]
+        self._edge_width = self._edge_width[keep]
+        self._opacity = self._opacity[keep]
+
+        # Map old shape indices onto the new contiguous numbering
+        renumber = np.cumsum(keep) - 1
+        self._index = renumber[self._index]
+        self._mesh.triangles_index[:, 0] = renumber[
+            self._mesh.triangles_index[:, 0]
+        ]
+        self._mesh.vertices_index[:, 0] = renumber[
+            self._mesh.vertices_index[:, 0]
+        ]
+        self._update_z_order()
+
+    def _remove_meshes(self, indices):
+        """Removes the vertices and meshes of shapes without renumbering.
+
+        Parameters
+        ----------
+        indices : sequence of int
+            Locations in list of the shapes whose meshes are to be removed.
+        """
+        removed = np.zeros(len(self.shapes), dtype=bool)
+        removed[indices] = True
+
+        keep = np.invert(removed[self._index])
+        self._vertices = self._vertices[keep]
+        self._index = self._index[keep]
+
+        # Remove triangles
+        keep = np.invert(removed[self._mesh.triangles_index[:, 0]])
+        self._mesh.triangles = self._mesh.triangles[keep]
+        self._mesh.triangles_colors = self._mesh.triangles_colors[keep]
+        self._mesh.triangles_index = self._mesh.triangles_index[keep]
+
+        # Remove vertices and point the remaining triangles at their new
+        # vertex positions
+        keep = np.invert(removed[self._mesh.vertices_index[:, 0]])
+        self._mesh.vertices = self._mesh.vertices[keep]
+        self._mesh.vertices_centers = self._mesh.vertices_centers[keep]
+        self._mesh.vertices_offsets = self._mesh.vertices_offsets[keep]
+        self._mesh.vertices_index = self._mesh.vertices_index[keep]
+        new_position = np.cumsum(keep) - 1
+        self._mesh.triangles = new_position[self._mesh.triangles].astype(
+            self._mesh.triangles.dtype
+        )
 
     def _update_mesh_vertices(self, index, edge=False, face=False):
         """Updates the mesh vertex data and vertex data for a single shape
@@ -362,39 +659,122 @@ class ShapeList:
             faces and to update the underlying shape vertices
         """
         shape = self.shapes[index]
+        ranges = self._get_ranges()
+        # The face mesh vertices of a shape are followed by its edge ones
+        start = ranges['mesh_vertices_start'][index]
+        middle = start + len(shape._face_vertices.reshape(-1, self.ndisplay))
+        stop = start + ranges['mesh_vertices_count'][index]
         if edge:
-            indices = np.all(self._mesh.vertices_index == [index, 1], axis=1)
-            self._mesh.vertices[indices] = (
+            self._mesh.vertices[middle:stop] = (
                 shape._edge_vertices + shape.edge_width * shape._edge_offsets
             )
-            self._mesh.vertices_centers[indices] = shape._edge_vertices
-            self._mesh.vertices_offsets[indices] = shape._edge_offsets
-            self._update_displayed()
+            self._mesh.vertices_centers[middle:stop] = shape._edge_vertices
+            self._mesh.vertices_offsets[middle:stop] = shape._edge_offsets
 
         if face:
-            indices = np.all(self._mesh.vertices_index == [index, 0], axis=1)
-            self._mesh.vertices[indices] = shape._face_vertices
-            self._mesh.vertices_centers[indices] = shape._face_vertices
-            indices = self._index == index
-            self._vertices[indices] = shape.data_displayed
+            self._mesh.vertices[start:middle] = shape._face_vertices
+            self._mesh.vertices_centers[start:middle] = shape._face_vertices
+            start = ranges['vertices_start'][index]
+            stop = start + ranges['vertices_count'][index]
+            self._vertices[start:stop] = shape.data_displayed
+
+        if edge or face:
+            self._outline = None
+            self._update_box(index)
             self._update_displayed()
 
-    def _update_z_order(self):
-        """Updates the z order of the triangles given the z_index list
+    def _update_meshes(self, indices):
+        """Rewrite the meshes of shapes after their vertices were changed.
+
+        Meshes keeping their numbers of vertices and triangles are written in
+        place in a single pass, otherwise the meshes of the shapes are
+        removed and appended again.
+
+        Parameters
+        ----------
+        indices : (N,) array
+            Locations in list of the shapes that changed.
         """
-        self._z_order = np.argsort(self._z_index)
-        if len(self._z_order) == 0:
-            self._mesh.triangles_z_order = np.empty((0), dtype=int)
-        else:
-            _, idx, counts = np.unique(
-                self._mesh.triangles_index[:, 0],
-                return_index=True,
-                return_counts=True,
+        ndisplay = self.ndisplay
+        shapes = [self.shapes[i] for i in indices]
+        faces = [s._face_vertices.reshape(-1, ndisplay) for s in shapes]
+        edges = [s._edge_vertices.reshape(-1, ndisplay) for s in shapes]
+        offsets = [s._edge_offsets.reshape(-1, ndisplay) for s in shapes]
+        face_triangles = [
+            np.reshape(s._face_triangles, (-1, 3)) for s in shapes
+        ]
+        edge_triangles = [
+            np.reshape(s._edge_triangles, (-1, 3)) for s in shapes
+        ]
+        vertices_count = [len(f) + len(e) for f, e in zip(faces, edges)]
+        triangles_count = [
+            len(f) + len(e) for f, e in zip(face_triangles, edge_triangles)
+        ]
+
+        ranges = self._get_ranges()
+        if not (
+            np.array_equal(
+                vertices_count, ranges['mesh_vertices_count'][indices]
             )
-            triangles_z_order = [
-                np.arange(idx[z], idx[z] + counts[z]) for z in self._z_order
+            and np.array_equal(
+                triangles_count, ranges['triangles_count'][indices]
+            )
+        ):
+            self._remove_meshes(indices)
+            self._append_meshes(shapes, indices)
+            self._update_z_order()
+            return
+
+        starts = ranges['mesh_vertices_start'][indices]
+        positions = ranges_to_indices(starts, vertices_count)
+        widths = self._edge_width[indices]
+        self._mesh.vertices[positions] = np.concatenate(
+            [
+                v
+                for f, e, o, w in zip(faces, edges, offsets, widths)
+                for v in (f, e + w * o)
             ]
-            self._mesh.triangles_z_order = np.concatenate(triangles_z_order)
+        )
+        self._mesh.vertices_centers[positions] = np.concatenate(
+            [v for f, e in zip(faces, edges) for v in (f, e)]
+        )
+        self._mesh.vertices_offsets[positions] = np.concatenate(
+            [v for f, o in zip(faces, offsets) for v in (np.zeros(f.shape), o)]
+        )
+
+        positions = ranges_to_indices(
+            ranges['triangles_start'][indices], triangles_count
+        )
+        self._mesh.triangles[positions] = np.concatenate(
+            [
+                t
+                for f, ft, et, m in zip(
+                    faces, face_triangles, edge_triangles, starts
+                )
+                for t in (ft + m, et + m + len(f))
+            ]
+        )
+
+        positions = ranges_to_indices(
+            ranges['vertices_start'][indices],
+            ranges['vertices_count'][indices],
+        )
+        self._vertices[positions] = np.concatenate(
+            [s.data_displayed for s in shapes]
+        )
+        self._outline = None
+        self._update_box(indices)
+        self._update_displayed()
+
+    def _update_z_order(self):
+        """Updates the z order of the shapes given the z_index list
+
+        Shapes with equal z_index keep the order of their indices. The
+        triangles are only put in z order for the displayed slice, when it
+        is next updated.
+        """
+        self._reset_indices()
+        self._z_order = np.argsort(self._z_index, kind='stable')
         self._update_displayed()
 
     def edit(self, index, data, new_type=None):
@@ -451,6 +831,7 @@ class ShapeList:
             thickness of lines and edges.
         """
         self.shapes[index].edge_width = edge_width
+        self._edge_width[index] = edge_width
         self._update_mesh_vertices(index, edge=True)
 
     def update_edge_color(self, index, edge_color):
@@ -502,6 +883,7 @@ class ShapeList:
             Opacity, must be between 0 and 1
         """
         self.shapes[index].opacity = opacity
+        self._opacity[index] = opacity
         indices = np.all(self._mesh.triangles_index == [index, 1], axis=1)
         color = self.shapes[index].edge_color.rgba
         self._mesh.triangles_colors[indices, 3] = color[3] * opacity
@@ -519,110 +901,174 @@ class ShapeList:
         dims_order : (D,) list
             Order that the dimensions are rendered in.
         """
-        for index in range(len(self.shapes)):
-            if not self.shapes[index].dims_order == dims_order:
-                shape = self.shapes[index]
-                shape.dims_order = dims_order
-                self.remove(index, renumber=False)
-                self.add(shape, shape_index=index)
+        indices = [
+            index
+            for index, shape in enumerate(self.shapes)
+            if not shape.dims_order == dims_order
+        ]
+        for index in indices:
+            self.shapes[index].dims_order = dims_order
+        self._remove_meshes(indices)
+        self._append_meshes([self.shapes[i] for i in indices], indices)
         self._update_z_order()
 
     def update_z_index(self, index, z_index):
-        """Updates the z order of a single shape located at index.
+        """Updates the z order of a single shape or of several shapes.
 
         Parameters
         ----------
-        index : int
-            Location in list of the shape to be changed.
+        index : int | list
+            Location in list of the shape to be changed. If list must be a
+            list of int, and all the shapes are given the same z_index.
         z_index : int
             Specifier of z order priority. Shapes with higher z order are
             displayed ontop of others.
         """
-        self.shapes[index].z_index = z_index
-        self._z_index[index] = z_index
-        self._update_z_order()
+        if isinstance(index, (list, np.ndarray)):
+            for i in index:
+                self.shapes[i].z_index = z_index
+            self._z_index[index] = z_index
+            self._z_order = np.argsort(self._z_index, kind='stable')
+        else:
+            self.shapes[index].z_index = z_index
+            self._z_index[index] = z_index
+            self._move_in_z_order(index)
 
-    def shift(self, index, shift):
-        """Perfroms a 2D shift on a single shape located at index
+        # The meshes are unchanged, only their drawing order is stale
+        self._displayed_cache = {}
+        self._update_displayed()
+
+    def _move_in_z_order(self, index):
+        """Move a single shape to its place in the z order after its z_index
+        changed, without sorting all the shapes again.
 
         Parameters
         ----------
         index : int
-            Location in list of the shape to be changed.
+            Location in list of the shape that changed.
+        """
+        z_order = self._z_order[self._z_order != index]
+        z_sorted = self._z_index[z_order]
+        z_index = self._z_index[index]
+        # Among shapes with equal z_index the order follows the indices
+        low = np.searchsorted(z_sorted, z_index, side='left')
+        high = np.searchsorted(z_sorted, z_index, side='right')
+        position = low + np.searchsorted(z_order[low:high], index)
+        self._z_order = np.insert(z_order, position, index)
+
+    def shift(self, index, shift):
+        """Perfroms a 2D shift on a single shape or on several shapes.
+
+        The packed vertex arrays of all the shapes are shifted at once, as
+        their triangulations do not change.
+
+        Parameters
+        ----------
+        index : int | list
+            Location in list of the shape to be changed. If list must be a
+            list of int.
         shift : np.ndarray
             length 2 array specifying shift of shapes.
         """
-        self.shapes[index].shift(shift)
-        self._update_mesh_vertices(index, edge=True, face=True)
+        indices = np.atleast_1d(np.asarray(index, dtype=int))
+        shift = np.array(shift)
+        for i in indices:
+            self.shapes[i].shift(shift)
+
+        ranges = self._get_ranges()
+        positions = ranges_to_indices(
+            ranges['mesh_vertices_start'][indices],
+            ranges['mesh_vertices_count'][indices],
+        )
+        self._mesh.vertices[positions] += shift
+        self._mesh.vertices_centers[positions] += shift
+        positions = ranges_to_indices(
+            ranges['vertices_start'][indices],
+            ranges['vertices_count'][indices],
+        )
+        self._vertices[positions] += shift
+        if self._boxes is not None:
+            self._boxes[indices] += shift
+        self._outline = None
+        self._update_displayed()
 
     def scale(self, index, scale, center=None):
-        """Perfroms a scaling on a single shape located at index
+        """Perfroms a scaling on a single shape or on several shapes.
 
         Parameters
         ----------
-        index : int
-            Location in list of the shape to be changed.
+        index : int | list
+            Location in list of the shape to be changed. If list must be a
+            list of int.
         scale : float, list
             scalar or list specifying rescaling of shape.
         center : list
             length 2 list specifying coordinate of center of scaling.
         """
-        self.shapes[index].scale(scale, center=center)
-        shape = self.shapes[index]
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
-        self._update_z_order()
+        indices = np.atleast_1d(np.asarray(index, dtype=int))
+        for i in indices:
+            self.shapes[i].scale(scale, center=center)
+        self._update_meshes(indices)
 
     def rotate(self, index, angle, center=None):
-        """Perfroms a rotation on a single shape located at index
+        """Perfroms a rotation on a single shape or on several shapes.
 
         Parameters
         ----------
-        index : int
-            Location in list of the shape to be changed.
+        index : int | list
+            Location in list of the shape to be changed. If list must be a
+            list of int.
         angle : float
             angle specifying rotation of shape in degrees.
         center : list
             length 2 list specifying coordinate of center of rotation.
         """
-        self.shapes[index].rotate(angle, center=center)
-        self._update_mesh_vertices(index, edge=True, face=True)
+        indices = np.atleast_1d(np.asarray(index, dtype=int))
+        for i in indices:
+            self.shapes[i].rotate(angle, center=center)
+        self._update_meshes(indices)
 
     def flip(self, index, axis, center=None):
-        """Perfroms an vertical flip on a single shape located at index
+        """Perfroms an vertical flip on a single shape or on several shapes.
 
         Parameters
         ----------
-        index : int
-            Location in list of the shape to be changed.
+        index : int | list
+            Location in list of the shape to be changed. If list must be a
+            list of int.
         axis : int
             integer specifying axis of flip. `0` flips horizontal, `1` flips
             vertical.
         center : list
             length 2 list specifying coordinate of center of flip axes.
         """
-        self.shapes[index].flip(axis, center=center)
-        self._update_mesh_vertices(index, edge=True, face=True)
+        indices = np.atleast_1d(np.asarray(index, dtype=int))
+        for i in indices:
+            self.shapes[i].flip(axis, center=center)
+        self._update_meshes(indices)
 
     def transform(self, index, transform):
-        """Perfroms a linear transform on a single shape located at index
+        """Perfroms a linear transform on a single shape or on several shapes.
 
         Parameters
         ----------
-        index : int
-            Location in list of the shape to be changed.
+        index : int | list
+            Location in list of the shape to be changed. If list must be a
+            list of int.
         transform : np.ndarray
             2x2 array specifying linear transform.
         """
-        self.shapes[index].transform(transform)
-        shape = self.shapes[index]
-        self.remove(index, renumber=False)
-        self.add(shape, shape_index=index)
-        self._update_z_order()
+        indices = np.atleast_1d(np.asarray(index, dtype=int))
+        for i in indices:
+            self.shapes[i].transform(transform)
+        self._update_meshes(indices)
 
     def outline(self, indices):
         """Finds outlines of shapes listed in indices
 
+        The outline of the last requested shapes is cached until their meshes
+        change, so repeated highlight updates reuse it.
+
         Parameters
         ----------
         indices : int | list
@@ -638,44 +1084,34 @@ class ShapeList:
         triangles : np.ndarray
             Mx3 array of any indices of vertices for triangles of outline
         """
-        if type(indices) is list:
-            meshes = self._mesh.triangles_index
-            triangle_indices = [
-                i
-                for i, x in enumerate(meshes)
-                if x[0] in indices and x[1] == 1
-            ]
-            meshes = self._mesh.vertices_index
-            vertices_indices = [
-                i
-                for i, x in enumerate(meshes)
-                if x[0] in indices and x[1] == 1
-            ]
-        else:
-            triangle_indices = np.all(
-                self._mesh.triangles_index == [indices, 1], axis=1
-            )
-            triangle_indices = np.where(triangle_indices)[0]
-            vertices_indices = np.all(
-                self._mesh.vertices_index == [indices, 1], axis=1
-            )
-            vertices_indices = np.where(vertices_indices)[0]
+        indices = np.atleast_1d(np.asarray(indices, dtype=int))
+        key = tuple(indices)
+        if self._outline is not None and self._outline[0] == key:
+            return self._outline[1]
+
+        # Gather the edge meshes, which follow the face meshes of each shape
+        ranges = self._get_ranges()
+        face_count = ranges['mesh_vertices_face_count'][indices]
+        vertices_start = ranges['mesh_vertices_start'][indices] + face_count
+        vertices_count = ranges['mesh_vertices_count'][indices] - face_count
+        vertices_indices = ranges_to_indices(vertices_start, vertices_count)
+        face_count = ranges['triangles_face_count'][indices]
+        triangles_count = ranges['triangles_count'][indices] - face_count
+        triangle_indices = ranges_to_indices(
+            ranges['triangles_start'][indices] + face_count, triangles_count
+        )
 
         offsets = self._mesh.vertices_offsets[vertices_indices]
         centers = self._mesh.vertices_centers[vertices_indices]
-        triangles = self._mesh.triangles[triangle_indices]
-
-        if type(indices) is list:
-            t_ind = self._mesh.triangles_index[triangle_indices][:, 0]
-            inds = self._mesh.vertices_index[vertices_indices][:, 0]
-            starts = np.unique(inds, return_index=True)[1]
-            for i, ind in enumerate(indices):
-                inds = t_ind == ind
-                adjust_index = starts[i] - vertices_indices[starts[i]]
-                triangles[inds] = triangles[inds] + adjust_index
-        else:
-            triangles = triangles - vertices_indices[0]
+        # Point the triangles of each shape at its gathered vertices
+        adjust_index = vertices_start - (
+            np.cumsum(vertices_count) - vertices_count
+        )
+        triangles = self._mesh.triangles[triangle_indices] - np.repeat(
+            adjust_index, triangles_count
+        )[:, np.newaxis].astype(self._mesh.triangles.dtype)
 
+        self._outline = (key, (centers, offsets, triangles))
         return centers, offsets, triangles
 
     def shapes_in_box(self, corners):
@@ -694,11 +1130,20 @@ class ShapeList:
         shapes : list
             List of shapes that are inside the box.
         """
-
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        candidates, inside = self._displayed_in_bounds(corners)
+        ranges = self._get_ranges()
+
+        # Shapes whose bounding box lies in the box intersect it, the others
+        # are checked triangle by triangle
+        contained = candidates[inside]
+        shapes = contained[ranges['triangles_count'][contained] > 0]
+        triangle_indices = self._shape_triangles(candidates[~inside])
+        triangles = self._mesh.vertices[self._mesh.triangles[triangle_indices]]
         intersects = triangles_intersect_box(triangles, corners)
-        shapes = self._mesh.displayed_triangles_index[intersects, 0]
-        shapes = np.unique(shapes).tolist()
+        intersecting = self._mesh.triangles_index[
+            triangle_indices[intersects], 0
+        ]
+        shapes = np.unique(np.concatenate([shapes, intersecting])).tolist()
 
         return shapes
 
@@ -717,18 +1162,52 @@ class ShapeList:
             Index of shape if any that is at the coordinates. Returns `None`
             if no shape is found.
         """
-        triangles = self._mesh.vertices[self._mesh.displayed_triangles]
+        candidates, _ = self._displayed_in_bounds([coord, coord])
+        triangle_indices = self._shape_triangles(candidates)
+        triangles = self._mesh.vertices[self._mesh.triangles[triangle_indices]]
         indices = inside_triangles(triangles - coord)
-        shapes = self._mesh.displayed_triangles_index[indices, 0]
+        shapes = self._mesh.triangles_index[triangle_indices[indices], 0]
 
         if len(shapes) > 0:
-            z_list = self._z_order.tolist()
-            order_indices = np.array([z_list.index(m) for m in shapes])
-            ordered_shapes = shapes[np.argsort(order_indices)]
-            return ordered_shapes[0]
+            return shapes[np.argmin(self._z_rank()[shapes])]
         else:
             return None
 
+    def _box_mask(self, index, shape_plane, zoom_factor, offset, cache=False):
+        """Rasterize a single shape into the part of a plane it covers.
+
+        Parameters
+        ----------
+        index : int
+            Location in list of the shape.
+        shape_plane : (2,) array
+            Shape of the plane being rasterized into.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+        cache : bool
+            If True reuse the mask of the shape from the last call with the
+            same arguments, unless the shape data changed since.
+
+        Returns
+        ----------
+        region : tuple of slice
+            Part of the plane covered by the shape mask.
+        mask : np.ndarray
+            Boolean array with `True` for points of the region inside the
+            shape.
+        """
+        bottom, mask = self.shapes[index]._to_box_mask(
+            shape_plane, zoom_factor=zoom_factor, offset=offset, cache=cache
+        )
+        region = tuple(
+            slice(start, start + size)
+            for start, size in zip(bottom, mask.shape)
+        )
+        return region, mask
+
     def to_masks(self, mask_shape=None, zoom_factor=1, offset=[0, 0]):
         """Returns N binary masks, one for each shape, embedded in an array of
         shape `mask_shape`.
@@ -754,12 +1233,22 @@ class ShapeList:
         if mask_shape is None:
             mask_shape = self.displayed_vertices.max(axis=0).astype('int')
 
-        masks = np.array(
-            [
-                s.to_mask(mask_shape, zoom_factor=zoom_factor, offset=offset)
-                for s in self.shapes
-            ]
-        )
+        if len(mask_shape) != 2:
+            return np.array(
+                [
+                    s.to_mask(
+                        mask_shape, zoom_factor=zoom_factor, offset=offset
+                    )
+                    for s in self.shapes
+                ]
+            )
+
+        masks = np.zeros((len(self.shapes),) + tuple(mask_shape), dtype=bool)
+        for ind in range(len(self.shapes)):
+            region, box_mask = self._box_mask(
+                ind, mask_shape, zoom_factor, offset
+            )
+            masks[ind][region] = box_mask
 
         return masks
 
@@ -793,10 +1282,16 @@ class ShapeList:
         labels = np.zeros(labels_shape, dtype=int)
 
         for ind in self._z_order[::-1]:
-            mask = self.shapes[ind].to_mask(
-                labels_shape, zoom_factor=zoom_factor, offset=offset
-            )
-            labels[mask] = ind + 1
+            if len(labels_shape) == 2:
+                region, box_mask = self._box_mask(
+                    ind, labels_shape, zoom_factor, offset
+                )
+                labels[region][box_mask] = ind + 1
+            else:
+                mask = self.shapes[ind].to_mask(
+                    labels_shape, zoom_factor=zoom_factor, offset=offset
+                )
+                labels[mask] = ind + 1
 
         return labels
 
@@ -805,7 +1300,9 @@ class ShapeList:
 
         Each shape is embedded in an array of shape `colors_shape` with the
         RGBA value of the shape, and 0 for background. For overlapping shapes
-        z-ordering will be respected.
+        z-ordering will be respected. The mask of each shape is cached, so
+        that only shapes whose data changed since the last call with the
+        same arguments are rasterized again.
 
         Parameters
         ----------
@@ -833,8 +1330,8 @@ class ShapeList:
 
         for ind in self._z_order[::-1]:
             if self._displayed[ind]:
-                mask = self.shapes[ind].to_mask(
-                    colors_shape, zoom_factor=zoom_factor, offset=offset
+                region, box_mask = self._box_mask(
+                    ind, colors_shape, zoom_factor, offset, cache=True
                 )
                 if type(self.shapes[ind]) in [Path, Line]:
                     col = self.shapes[ind].edge_color.rgba
@@ -842,7 +1339,7 @@ class ShapeList:
                 else:
                     col = self.shapes[ind].face_color.rgba
                     col[3] = col[3] * self.shapes[ind].opacity
-                colors[mask, :] = col
+                colors[region][box_mask] = col
 
         return colors
 
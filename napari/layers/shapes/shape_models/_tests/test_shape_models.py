@@ -148,3 +148,55 @@ def test_nD_ellipse():
 
     shape.ndisplay = 3
     assert shape.data_displayed.shape == (4, 3)
+
+
+def test_display_cache():
+    """Test meshes are reused when switching back to a previous display."""
+    np.random.seed(0)
+    data = 20 * np.random.random((6, 4))
+    data[:, :2] = [1, 2]
+    shape = Polygon(data)
+    face_vertices = shape._face_vertices
+
+    shape.ndisplay = 3
+    assert shape._face_vertices.shape[1] == 3
+    shape.ndisplay = 2
+    assert shape._face_vertices is face_vertices
+    np.testing.assert_equal(shape.slice_key, [[1, 2], [1, 2]])
+
+    # Reordering only non-displayed dimensions keeps the meshes
+    shape.dims_order = [1, 0, 2, 3]
+    assert shape._face_vertices is face_vertices
+    np.testing.assert_equal(shape.slice_key, [[2, 1], [2, 1]])
+
+    # Changing the data drops the meshes of other displays
+    shape.dims_order = [0, 1, 2, 3]
+    shape.shift([1, 1])
+    shape.ndisplay = 3
+    expected = Polygon(data[:, :] + [0, 0, 1, 1], ndisplay=3)
+    np.testing.assert_allclose(shape._face_vertices, expected._face_vertices)
+    np.testing.assert_allclose(shape._box, expected._box)
+
+
+def test_ellipse_retessellated_on_resize():
+    """Test resizing an ellipse adapts its number of segments."""
+    shape = Ellipse(np.array([[0, 0], [0, 2], [2, 2], [2, 0]]))
+    n_small = len(shape._face_triangles)
+    shape.transform(np.diag([100, 100]))
+    assert len(shape._face_triangles) > n_small
+    expected = Ellipse(shape.data)
+    np.testing.assert_allclose(shape._face_vertices, expected._face_vertices)
+    np.testing.assert_allclose(shape._edge_vertices, expected._edge_vertices)
+
+
+def test_rotating_keeps_edge_triangulation():
+    """Test rotating a shape matches triangulating the rotated data."""
+    np.random.seed(0)
+    shape = Path(20 * np.random.random((6, 2)))
+    shape.rotate(35, center=np.array([3, 4]))
+    expected = Path(shape.data)
+    np.testing.assert_allclose(shape._edge_vertices, expected._edge_vertices)
+    np.testing.assert_allclose(shape._edge_offsets, expected._edge_offsets)
+    np.testing.assert_array_equal(
+        shape._edge_triangles, expected._edge_triangles
+    )
@@ -2,8 +2,8 @@ import numpy as np
 from xml.etree.ElementTree import Element
 from .shape import Shape
 from ..shape_utils import (
-    triangulate_edge,
     triangulate_ellipse,
+    ellipse_segments,
     center_radii_to_corners,
     rectangle_to_box,
 )
@@ -37,6 +37,8 @@ class Ellipse(Shape):
         Order that the dimensions are to be rendered in.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         data,
@@ -89,11 +91,12 @@ class Ellipse(Shape):
             )
 
         self._data = data
+        self._reset_caches()
         self._update_displayed_data()
 
     def _update_displayed_data(self):
         """Update the data that is to be displayed."""
-        # Build boundary vertices with num_segments
+        # Build boundary vertices with a size dependent number of segments
         vertices, triangles = triangulate_ellipse(self.data_displayed)
         self._set_meshes(vertices[1:-1], face=False)
         self._face_vertices = vertices
@@ -116,20 +119,17 @@ class Ellipse(Shape):
         transform : np.ndarray
             2x2 array specifying linear transform.
         """
+        self._reset_caches()
         self._box = self._box @ transform.T
         self._data[:, self.dims_displayed] = (
             self._data[:, self.dims_displayed] @ transform.T
         )
+        if ellipse_segments(self.data_displayed) != len(self._face_triangles):
+            # Size changed enough to need a different tessellation
+            self._update_displayed_data()
+            return
         self._face_vertices = self._face_vertices @ transform.T
-
-        points = self._face_vertices[1:-1]
-
-        centers, offsets, triangles = triangulate_edge(
-            points, closed=self._closed
-        )
-        self._edge_vertices = centers
-        self._edge_offsets = offsets
-        self._edge_triangles = triangles
+        self._transform_edge(transform, self._face_vertices[1:-1])
 
     def to_xml(self):
         """Generates an xml element that defintes the shape according to the
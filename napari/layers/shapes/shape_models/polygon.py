@@ -30,6 +30,8 @@ class Polygon(Shape):
         Order that the dimensions are to be rendered in.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         data,
@@ -77,6 +79,7 @@ class Polygon(Shape):
             )
 
         self._data = data
+        self._reset_caches()
         self._update_displayed_data()
 
     def _update_displayed_data(self):
@@ -32,6 +32,8 @@ class Rectangle(Shape):
         Order that the dimensions are to be rendered in.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         data,
@@ -84,6 +86,7 @@ class Rectangle(Shape):
             )
 
         self._data = data
+        self._reset_caches()
         self._update_displayed_data()
 
     def _update_displayed_data(self):
@@ -6,8 +6,8 @@ from ..shape_utils import (
     triangulate_edge,
     triangulate_face,
     is_collinear,
-    poly_to_mask,
-    path_to_mask,
+    poly_to_box_mask,
+    path_to_indices,
 )
 
 
@@ -105,8 +105,52 @@ class Shape(ABC):
         Flag if array is filled or not.
     _use_face_vertices : bool
         Flag to use face vertices for mask generation.
+    _display_cache : dict
+        Meshes, interaction box and slice key of the shape for each
+        combination of dims order and number of displayed dimensions it has
+        been displayed with, so that switching back does not triangulate the
+        shape again. Cleared whenever the shape data changes.
     """
 
+    # Shapes are created in large numbers, so their attributes are stored in
+    # slots rather than a per instance dict
+    __slots__ = (
+        '_data',
+        '_dims_order',
+        '_ndisplay',
+        'slice_key',
+        'name',
+        '_face_vertices',
+        '_face_triangles',
+        '_edge_vertices',
+        '_edge_offsets',
+        '_edge_triangles',
+        '_box',
+        '_edge_color_name',
+        '_face_color_name',
+        '_closed',
+        '_filled',
+        '_use_face_vertices',
+        '_edge_width',
+        '_edge_color',
+        '_face_color',
+        '_opacity',
+        '_z_index',
+        '_display_cache',
+        '_mask_cache',
+    )
+
+    # Attributes that depend on which dimensions are displayed
+    _display_attributes = (
+        '_face_vertices',
+        '_face_triangles',
+        '_edge_vertices',
+        '_edge_offsets',
+        '_edge_triangles',
+        '_box',
+        'slice_key',
+    )
+
     def __init__(
         self,
         *,
@@ -122,6 +166,7 @@ class Shape(ABC):
 
         self._dims_order = dims_order or list(range(2))
         self._ndisplay = ndisplay
+        self._reset_caches()
         self.slice_key = None
 
         self._face_vertices = np.empty((0, self.ndisplay))
@@ -167,8 +212,7 @@ class Shape(ABC):
     def ndisplay(self, ndisplay):
         if self.ndisplay == ndisplay:
             return
-        self._ndisplay = ndisplay
-        self._update_displayed_data()
+        self._set_display(ndisplay, self.dims_order)
 
     @property
     def dims_order(self):
@@ -179,8 +223,50 @@ class Shape(ABC):
     def dims_order(self, dims_order):
         if self.dims_order == dims_order:
             return
+        self._set_display(self.ndisplay, dims_order)
+
+    def _reset_caches(self):
+        """Drop the meshes and mask cached for the previous data."""
+        self._display_cache = {}
+        self._mask_cache = None
+
+    def _set_display(self, ndisplay, dims_order):
+        """Change the displayed dimensions, reusing the meshes computed the
+        last time the shape was displayed the same way.
+
+        Parameters
+        ----------
+        ndisplay : int
+            Number of displayed dimensions.
+        dims_order : (D,) list
+            Order that the dimensions are rendered in.
+        """
+        key = (self.ndisplay,) + tuple(self.dims_order)
+        self._display_cache[key] = tuple(
+            getattr(self, name) for name in self._display_attributes
+        )
+        dims_displayed = self.dims_displayed
+
+        self._ndisplay = ndisplay
         self._dims_order = dims_order
-        self._update_displayed_data()
+        key = (self.ndisplay,) + tuple(self.dims_order)
+        if key in self._display_cache:
+            for name, value in zip(
+                self._display_attributes, self._display_cache[key]
+            ):
+                setattr(self, name, value)
+        elif list(self.dims_displayed) == list(dims_displayed):
+            # Only the order of the non-displayed dimensions changed, so the
+            # meshes are the same
+            data_not_displayed = self.data[:, self.dims_not_displayed]
+            self.slice_key = np.round(
+                [
+                    np.min(data_not_displayed, axis=0),
+                    np.max(data_not_displayed, axis=0),
+                ]
+            ).astype('int')
+        else:
+            self._update_displayed_data()
 
     @property
     def dims_displayed(self):
@@ -349,13 +435,34 @@ class Shape(ABC):
         transform : np.ndarray
             2x2 array specifying linear transform.
         """
+        self._reset_caches()
         self._box = self._box @ transform.T
         self._data[:, self.dims_displayed] = (
             self._data[:, self.dims_displayed] @ transform.T
         )
         self._face_vertices = self._face_vertices @ transform.T
+        self._transform_edge(transform, self.data_displayed)
+
+    def _transform_edge(self, transform, points):
+        """Update the edge mesh after a linear transform of the shape.
 
-        points = self.data_displayed
+        Rotations and reflections keep the edge triangulation, so its
+        centers and offsets are transformed directly. Other transforms
+        change the joins between segments and the edge is triangulated
+        again.
+
+        Parameters
+        ----------
+        transform : np.ndarray
+            2x2 array specifying linear transform.
+        points : np.ndarray
+            Nx2 array of the transformed points along the edge.
+        """
+        orthogonal = transform @ transform.T - np.eye(len(transform))
+        if abs(orthogonal).max() < 1e-8:
+            self._edge_vertices = self._edge_vertices @ transform.T
+            self._edge_offsets = self._edge_offsets @ transform.T
+            return
 
         centers, offsets, triangles = triangulate_edge(
             points, closed=self._closed
@@ -374,6 +481,7 @@ class Shape(ABC):
         """
         shift = np.array(shift)
 
+        self._reset_caches()
         self._face_vertices = self._face_vertices + shift
         self._edge_vertices = self._edge_vertices + shift
         self._box = self._box + shift
@@ -491,17 +599,12 @@ class Shape(ABC):
             got {len(mask_shape)}."""
             )
 
-        if self._use_face_vertices:
-            data = self._face_vertices
-        else:
-            data = self.data_displayed
-
-        data = data[:, -len(shape_plane) :]
-
-        if self._filled:
-            mask_p = poly_to_mask(shape_plane, (data - offset) * zoom_factor)
-        else:
-            mask_p = path_to_mask(shape_plane, (data - offset) * zoom_factor)
+        mask_p = np.zeros(shape_plane, dtype=bool)
+        bottom, box_mask = self._to_box_mask(
+            shape_plane, zoom_factor=zoom_factor, offset=offset
+        )
+        top = bottom + box_mask.shape
+        mask_p[bottom[0] : top[0], bottom[1] : top[1]] = box_mask
 
         # If the mask is to be embedded in a larger array, compute array
         # and embed as a slice.
@@ -527,6 +630,71 @@ class Shape(ABC):
 
         return mask
 
+    def _to_box_mask(
+        self, shape_plane, zoom_factor=1, offset=[0, 0], cache=False
+    ):
+        """Convert the shape vertices to a boolean mask of the part of a plane
+        that the shape covers.
+
+        Parameters
+        ----------
+        shape_plane : (2,) array
+            Shape of the displayed plane the mask lies in.
+        zoom_factor : float
+            Premultiplier applied to coordinates before generating mask.
+        offset : 2-tuple
+            Offset subtracted from coordinates before multiplying by the
+            zoom_factor.
+        cache : bool
+            If True the mask is kept until the shape data changes and reused
+            for the same plane, zoom_factor and offset. Meant for small planes
+            such as thumbnails that are rasterized repeatedly.
+
+        Returns
+        ----------
+        bottom : np.ndarray
+            Length 2 array of the position of the mask in the plane.
+        mask : np.ndarray
+            Boolean array with `True` for points of the plane inside the
+            shape, starting at `bottom`.
+        """
+        key = (
+            tuple(self.dims_displayed),
+            tuple(shape_plane),
+            zoom_factor,
+            tuple(offset),
+        )
+        if cache and self._mask_cache is not None:
+            if self._mask_cache[0] == key:
+                return self._mask_cache[1]
+
+        if self._use_face_vertices:
+            data = self._face_vertices
+        else:
+            data = self.data_displayed
+
+        data = data[:, -len(shape_plane) :]
+        vertices = (data - offset) * zoom_factor
+
+        if self._filled:
+            bottom, mask = poly_to_box_mask(shape_plane, vertices)
+        else:
+            rows, cols = path_to_indices(shape_plane, vertices)
+            if len(rows) == 0:
+                bottom = np.zeros(2, dtype=int)
+                mask = np.zeros((0, 0), dtype=bool)
+            else:
+                bottom = np.array([rows.min(), cols.min()])
+                mask = np.zeros(
+                    (rows.max() - bottom[0] + 1, cols.max() - bottom[1] + 1),
+                    dtype=bool,
+                )
+                mask[rows - bottom[0], cols - bottom[1]] = True
+
+        if cache:
+            self._mask_cache = (key, (bottom, mask))
+        return bottom, mask
+
     @abstractmethod
     def to_xml(self):
         # user writes own docstring
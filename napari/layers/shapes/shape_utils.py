@@ -459,7 +459,49 @@ def center_radii_to_corners(center, radii):
     return corners
 
 
-def triangulate_ellipse(corners, num_segments=100):
+# Segment counts an ellipse boundary can be tessellated with, the largest
+# matching the historical fixed count.
+_ELLIPSE_SEGMENTS = (16, 24, 32, 48, 64, 100)
+
+
+def ellipse_segments(corners, tolerance=0.1):
+    """Number of boundary segments needed to triangulate an ellipse.
+
+    The count is the smallest one for which the chords of a circle with the
+    largest radius of the ellipse deviate from the true boundary by less
+    than `tolerance`, rounded up to one of a few fixed levels so that small
+    edits of a shape do not change its tessellation.
+
+    Parameters
+    ----------
+    corners : np.ndarray
+        4xD array of four bounding corners of the ellipse.
+    tolerance : float
+        Maximum allowed distance in data units between the tessellated and
+        the true boundary.
+
+    Returns
+    -------
+    num_segments : int
+        Number of segments to use when triangulating the ellipse.
+    """
+    radius = (
+        max(
+            np.linalg.norm(corners[1] - corners[0]),
+            np.linalg.norm(corners[2] - corners[1]),
+        )
+        / 2
+    )
+    if radius <= tolerance:
+        return _ELLIPSE_SEGMENTS[0]
+    needed = 2 * np.pi / np.arccos(1 - tolerance / radius)
+    for num_segments in _ELLIPSE_SEGMENTS:
+        if num_segments >= needed:
+            return num_segments
+    return _ELLIPSE_SEGMENTS[-1]
+
+
+def triangulate_ellipse(corners, num_segments=None):
     """Determines the triangulation of a path. The resulting `offsets` can
     mulitplied by a `width` scalar and be added to the resulting `centers`
     to generate the vertices of the triangles for the triangulation, i.e.
@@ -473,9 +515,10 @@ def triangulate_ellipse(corners, num_segments=100):
         4xD array of four bounding corners of the ellipse. The ellipse will
         still be computed properly even if the rectangle determined by the
         corners is not axis aligned
-    num_segments : int
+    num_segments : int, optional
         Integer determining the number of segments to use when triangulating
-        the ellipse
+        the ellipse. If None it is chosen from the size of the ellipse with
+        `ellipse_segments`.
 
     Returns
     -------
@@ -493,6 +536,9 @@ def triangulate_ellipse(corners, num_segments=100):
                          shape specifying corners for the ellipse"""
         )
 
+    if num_segments is None:
+        num_segments = ellipse_segments(corners)
+
     center = corners.mean(axis=0)
     adjusted = corners - center
 
@@ -530,7 +576,9 @@ def triangulate_ellipse(corners, num_segments=100):
     # Shift back to center
     vertices = vertices + center
 
-    triangles = np.array([[0, i + 1, i + 2] for i in range(num_segments)])
+    triangles = np.zeros((num_segments, 3), dtype=int)
+    triangles[:, 1] = np.arange(1, num_segments + 1)
+    triangles[:, 2] = triangles[:, 1] + 1
     triangles[-1, 2] = 1
 
     return vertices, triangles
@@ -865,18 +913,47 @@ def path_to_mask(mask_shape, vertices):
         Boolean array with `True` for points along the path
     """
     mask = np.zeros(mask_shape, dtype=bool)
+    mask[path_to_indices(mask_shape, vertices)] = True
+    return mask
+
+
+def path_to_indices(mask_shape, vertices):
+    """Finds the indices of the points lying along each edge of a path.
+
+    Each edge is sampled at as many evenly spaced points as the length of its
+    longest axis in pixels, with all edges processed together.
+
+    Parameters
+    ----------
+    mask_shape : array (2,)
+        Shape of mask the path is drawn in.
+    vertices : array (N, 2)
+        Vertices of the path.
+
+    Returns
+    ----------
+    indices : tuple of np.ndarray
+        Row and column indices of the points along the path.
+    """
     vertices = np.round(
         np.clip(vertices, 0, np.subtract(mask_shape, 1))
     ).astype(int)
-    for i in range(len(vertices) - 1):
-        start = vertices[i]
-        stop = vertices[i + 1]
-        step = np.ceil(np.max(abs(stop - start))).astype(int)
-        x_vals = np.linspace(start[0], stop[0], step)
-        y_vals = np.linspace(start[1], stop[1], step)
-        for x, y in zip(x_vals, y_vals):
-            mask[int(x), int(y)] = 1
-    return mask
+    start = vertices[:-1]
+    stop = vertices[1:]
+    delta = stop - start
+    steps = np.max(abs(delta), axis=1, initial=0)
+
+    # Evaluate each edge at `steps` points the same way `np.linspace` does
+    edge = np.repeat(np.arange(len(steps)), steps)
+    first = np.cumsum(steps) - steps
+    k = np.arange(len(edge)) - first[edge]
+    div = np.maximum(steps - 1, 1)[edge, np.newaxis]
+    points = k[:, np.newaxis] * (delta[edge] / div) + start[edge]
+    last = k == steps[edge] - 1
+    points[last & (steps[edge] > 1)] = stop[edge][last & (steps[edge] > 1)]
+    points = points.astype(int)
+
+    return points[:, 0], points[:, 1]
 
 
 def poly_to_mask(mask_shape, vertices):
@@ -897,20 +974,50 @@ def poly_to_mask(mask_shape, vertices):
         Boolean array with `True` for points inside the polygon
     """
     mask = np.zeros(mask_shape, dtype=bool)
+    bottom, bb_mask = poly_to_box_mask(mask_shape, vertices)
+    top = bottom + bb_mask.shape
+    mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
+    return mask
+
+
+def poly_to_box_mask(mask_shape, vertices):
+    """Converts a polygon to a boolean mask of its bounding box inside a
+    larger mask.
+
+    Parameters
+    ----------
+    mask_shape : np.ndarray | tuple
+        1x2 array of shape of the larger mask.
+    vertices : np.ndarray
+        Nx2 array of the vertices of the polygon.
+
+    Returns
+    ----------
+    bottom : np.ndarray
+        Length 2 array of the position of the bounding box in the larger mask.
+    bb_mask : np.ndarray
+        Boolean array with `True` for points of the bounding box inside the
+        polygon. It is empty if the bounding box lies outside the mask.
+    """
     bottom = vertices.min(axis=0).astype('int')
     bottom = np.clip(bottom, 0, np.subtract(mask_shape, 1))
     top = np.ceil(vertices.max(axis=0)).astype('int')
-    # top = np.append([top], [mask_shape], axis=0).min(axis=0)
     top = np.clip(top, 0, np.subtract(mask_shape, 1))
     if np.all(top > bottom):
         bb_mask = grid_points_in_poly(top - bottom, vertices - bottom)
-        mask[bottom[0] : top[0], bottom[1] : top[1]] = bb_mask
-    return mask
+    else:
+        bb_mask = np.zeros((0, 0), dtype=bool)
+    return bottom, bb_mask
 
 
 def grid_points_in_poly(shape, vertices):
     """Converts a polygon to a boolean mask with `True` for points
-    lying inside the shape. Loops through all indices in the grid
+    lying inside the shape.
+
+    Uses a scanline fill along the first axis: for each column of the grid
+    the crossings of the polygon edges are found and sorted, and the points
+    between alternate crossings are filled. This gives the same result as
+    testing every point with `points_in_poly`.
 
     Parameters
     ----------
@@ -924,11 +1031,35 @@ def grid_points_in_poly(shape, vertices):
     mask : np.ndarray
         Boolean array with `True` for points inside the polygon
     """
-    points = np.array(
-        [(x, y) for x in range(shape[0]) for y in range(shape[1])], dtype=int
-    )
-    inside = points_in_poly(points, vertices)
-    mask = inside.reshape(shape)
+    shape = tuple(int(s) for s in shape)
+    vertices = np.asarray(vertices, dtype=float)
+    v_i = vertices
+    v_j = np.roll(vertices, 1, axis=0)
+    d = v_j - v_i
+
+    # Columns crossed by each edge, half open like the ray casting test
+    low = np.clip(np.ceil(np.minimum(v_i[:, 1], v_j[:, 1])), 0, shape[1])
+    high = np.clip(np.ceil(np.maximum(v_i[:, 1], v_j[:, 1])), 0, shape[1])
+    counts = np.where(d[:, 1] == 0, 0, high - low).astype(int)
+    edge = np.repeat(np.arange(len(vertices)), counts)
+    first = np.cumsum(counts) - counts
+    col = low[edge] + np.arange(len(edge)) - first[edge]
+    crossing = d[edge, 0] * (col - v_i[edge, 1]) / d[edge, 1] + v_i[edge, 0]
+
+    # Each column has an even number of crossings, pair them up in order
+    order = np.lexsort((crossing, col))
+    col = col[order].astype(int)
+    crossing = np.clip(np.ceil(crossing[order]), 0, shape[0]).astype(int)
+    start, stop, col = crossing[0::2], crossing[1::2], col[0::2]
+    keep = start < stop
+    start, stop, col = start[keep], stop[keep], col[keep]
+
+    # Mark the start and end of every filled run and integrate along rows.
+    # Non-empty runs in a column never share a start or a stop.
+    runs = np.zeros((shape[0] + 1, shape[1]), dtype=np.int8)
+    runs[start, col] += 1
+    runs[stop, col] -= 1
+    mask = np.cumsum(runs, axis=0, dtype=np.int8)[: shape[0]] > 0
     return mask
 
 
@@ -1,3 +1,4 @@
+import time
 import numpy as np
 from copy import copy, deepcopy
 
@@ -182,6 +183,12 @@ class Shapes(Layer):
         coordinates.
     _input_ndim : int
         Dimensions of shape data.
+    _triangulation_batch_size : int
+        Number of shapes created and triangulated together when an executor
+        is passed to `add`.
+    _min_thumbnail_interval : float
+        Minimum time in seconds between thumbnail updates while shapes are
+        being moved or drawn.
     """
 
     _colors = get_color_names()
@@ -189,6 +196,8 @@ class Shapes(Layer):
     _rotation_handle_length = 20
     _highlight_color = (0, 0.6, 1)
     _highlight_width = 1.5
+    _triangulation_batch_size = 1000
+    _min_thumbnail_interval = 0.25
 
     def __init__(
         self,
@@ -290,6 +299,7 @@ class Shapes(Layer):
         self._drag_box_stored = None
         self._is_creating = False
         self._clipboard = {}
+        self._last_thumbnail = 0
 
         self._mode = Mode.PAN_ZOOM
         self._mode_history = self._mode
@@ -612,6 +622,7 @@ class Shapes(Layer):
         face_color=None,
         opacity=None,
         z_index=None,
+        executor=None,
     ):
         """Add shapes to the current layer.
 
@@ -652,6 +663,11 @@ class Shapes(Layer):
             same length as the length of `data` and each element will be
             applied to each shape otherwise the same value will be used for all
             shapes.
+        executor : concurrent.futures.Executor, optional
+            Executor used to create and triangulate batches of shapes in
+            parallel. Triangulation is CPU bound, so a ProcessPoolExecutor is
+            needed for a speedup. Each batch is added to the layer, in order,
+            as soon as it is ready and the layer status reports progress.
         """
         if edge_width is None:
             edge_width = self.current_edge_width
@@ -672,34 +688,43 @@ class Shapes(Layer):
                 data = [data]
 
             # Turn input arguments into iterables
-            shape_inputs = zip(
-                data,
-                ensure_iterable(shape_type),
-                ensure_iterable(edge_width),
-                ensure_iterable(edge_color, color=True),
-                ensure_iterable(face_color, color=True),
-                ensure_iterable(opacity),
-                ensure_iterable(z_index),
+            shape_inputs = list(
+                zip(
+                    data,
+                    ensure_iterable(shape_type),
+                    ensure_iterable(edge_width),
+                    ensure_iterable(edge_color, color=True),
+                    ensure_iterable(face_color, color=True),
+                    ensure_iterable(opacity),
+                    ensure_iterable(z_index),
+                )
             )
 
-            for d, st, ew, ec, fc, o, z in shape_inputs:
-
-                # A False slice_key means the shape is invalid as it is not
-                # confined to a single plane
-                shape_cls = shape_classes[ShapeType(st)]
-                shape = shape_cls(
-                    d,
-                    edge_width=ew,
-                    edge_color=ec,
-                    face_color=fc,
-                    opacity=o,
-                    z_index=z,
-                    dims_order=self.dims.order,
-                    ndisplay=self.dims.ndisplay,
+            if executor is None:
+                shapes = _create_shapes(
+                    shape_inputs, self.dims.order, self.dims.ndisplay
                 )
-
-                # Add shape
-                self._data_view.add(shape)
+                # Add all the shapes to the mesh at once
+                self._data_view.add_many(shapes)
+            else:
+                size = self._triangulation_batch_size
+                batches = [
+                    shape_inputs[i : i + size]
+                    for i in range(0, len(shape_inputs), size)
+                ]
+                results = executor.map(
+                    _create_shapes,
+                    batches,
+                    [self.dims.order] * len(batches),
+                    [self.dims.ndisplay] * len(batches),
+                )
+                nadded = 0
+                for shapes in results:
+                    self._data_view.add_many(shapes)
+                    nadded += len(shapes)
+                    self.status = (
+                        f'added {nadded} of {len(shape_inputs)} shapes'
+                    )
 
         self._display_order_stored = copy(self.dims.order)
         self._ndisplay_stored = copy(self.dims.ndisplay)
@@ -955,7 +980,16 @@ class Shapes(Layer):
         self._update_dims()
 
     def _update_thumbnail(self, event=None):
-        """Update thumbnail with current points and colors."""
+        """Update thumbnail with current points and colors.
+
+        While shapes are being moved or drawn the thumbnail is updated at most
+        once every `_min_thumbnail_interval` seconds. It is always updated
+        when the interaction finishes.
+        """
+        if self._is_moving or self._is_creating:
+            elapsed = time.perf_counter() - self._last_thumbnail
+            if elapsed < self._min_thumbnail_interval:
+                return
         # calculate min vals for the vertices and pad with 0.5
         # the offset is needed to ensure that the top left corner of the shapes
         # corresponds to the top left corner of the thumbnail
@@ -981,12 +1015,11 @@ class Shapes(Layer):
         )
 
         self.thumbnail = colormapped
+        self._last_thumbnail = time.perf_counter()
 
     def remove_selected(self):
         """Remove any selected shapes."""
-        to_remove = sorted(self.selected_data, reverse=True)
-        for index in to_remove:
-            self._data_view.remove(index)
+        self._data_view.remove_many(self.selected_data)
         self.selected_data = []
         self._finish_drawing()
 
@@ -1145,8 +1178,7 @@ class Shapes(Layer):
         if len(self.selected_data) == 0:
             return
         new_z_index = max(self._data_view._z_index) + 1
-        for index in self.selected_data:
-            self._data_view.update_z_index(index, new_z_index)
+        self._data_view.update_z_index(self.selected_data, new_z_index)
         self.refresh()
 
     def move_to_back(self):
@@ -1154,8 +1186,7 @@ class Shapes(Layer):
         if len(self.selected_data) == 0:
             return
         new_z_index = min(self._data_view._z_index) - 1
-        for index in self.selected_data:
-            self._data_view.update_z_index(index, new_z_index)
+        self._data_view.update_z_index(self.selected_data, new_z_index)
         self.refresh()
 
     def _copy_data(self):
@@ -1182,6 +1213,7 @@ class Shapes(Layer):
             ]
 
             # Add new shape data
+            shapes = []
             for s in self._clipboard['data']:
                 shape = deepcopy(s)
                 data = copy(shape.data)
@@ -1189,7 +1221,8 @@ class Shapes(Layer):
                     :, self.dims.not_displayed
                 ] + np.array(offset)
                 shape.data = data
-                self._data_view.add(shape)
+                shapes.append(shape)
+            self._data_view.add_many(shapes)
 
             self.selected_data = list(
                 range(cur_shapes, cur_shapes + len(self._clipboard['data']))
@@ -1217,8 +1250,7 @@ class Shapes(Layer):
                         self._drag_start = coord - center
                     center = self._selected_box[Box.CENTER]
                     shift = coord - center - self._drag_start
-                    for index in self.selected_data:
-                        self._data_view.shift(index, shift)
+                    self._data_view.shift(self.selected_data, shift)
                     self._selected_box = self._selected_box + shift
                     self.refresh()
                 elif vertex < Box.LEN:
@@ -1281,20 +1313,21 @@ class Shapes(Layer):
                     angle = -np.arctan2(offset[0], -offset[1])
                     c, s = np.cos(angle), np.sin(angle)
                     if angle == 0:
-                        for index in self.selected_data:
-                            self._data_view.scale(
-                                index, scale, center=self._fixed_vertex
-                            )
+                        self._data_view.scale(
+                            self.selected_data,
+                            scale,
+                            center=self._fixed_vertex,
+                        )
                         self._scale_box(scale, center=self._fixed_vertex)
                     else:
                         rotation = np.array([[c, s], [-s, c]])
                         scale_mat = np.array([[scale[0], 0], [0, scale[1]]])
                         inv_rot = np.array([[c, -s], [s, c]])
                         transform = rotation @ scale_mat @ inv_rot
-                        for index in self.selected_data:
-                            self._data_view.shift(index, -self._fixed_vertex)
-                            self._data_view.transform(index, transform)
-                            self._data_view.shift(index, self._fixed_vertex)
+                        indices = self.selected_data
+                        self._data_view.shift(indices, -self._fixed_vertex)
+                        self._data_view.transform(indices, transform)
+                        self._data_view.shift(indices, self._fixed_vertex)
                         self._transform_box(
                             transform, center=self._fixed_vertex
                         )
@@ -1325,10 +1358,9 @@ class Shapes(Layer):
                     else:
                         angle = new_angle - fixed_angle
 
-                    for index in self.selected_data:
-                        self._data_view.rotate(
-                            index, angle, center=self._fixed_vertex
-                        )
+                    self._data_view.rotate(
+                        self.selected_data, angle, center=self._fixed_vertex
+                    )
                     self._rotate_box(angle, center=self._fixed_vertex)
                     self.refresh()
             else:
@@ -1768,3 +1800,44 @@ class Shapes(Layer):
             pass
         else:
             raise ValueError("Mode not recognized")
+
+
+def _create_shapes(shape_inputs, dims_order, ndisplay):
+    """Create and triangulate shapes.
+
+    Defined at module level so that batches of shapes can be created in
+    worker processes.
+
+    Parameters
+    ----------
+    shape_inputs : list of tuple
+        Data, shape type, edge width, edge color, face color, opacity and
+        z index of each shape.
+    dims_order : list
+        Order that the dimensions are rendered in.
+    ndisplay : int
+        Number of displayed dimensions.
+
+    Returns
+    -------
+    shapes : list of Shape
+        The created shapes.
+    """
+    shapes = []
+    for d, st, ew, ec, fc, o, z in shape_inputs:
+
+        # A False slice_key means the shape is invalid as it is not
+        # confined to a single plane
+        shape_cls = shape_classes[ShapeType(st)]
+        shape = shape_cls(
+            d,
+            edge_width=ew,
+            edge_color=ec,
+            face_color=fc,
+            opacity=o,
+            z_index=z,
+            dims_order=dims_order,
+            ndisplay=ndisplay,
+        )
+        shapes.append(shape)
+    return shapes
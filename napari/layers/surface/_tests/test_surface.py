@@ -1,7 +1,25 @@
+import dask.array as da
 import numpy as np
+import pytest
 from napari.layers import Surface
 
 
+class _IndexLoggingArray:
+    """Array-like that records the values read from it."""
+
+    def __init__(self, data):
+        self.data = data
+        self.shape = data.shape
+        self.dtype = data.dtype
+        self.ndim = data.ndim
+        self.reads = []
+
+    def __getitem__(self, key):
+        values = np.asarray(self.data[key])
+        self.reads.append(values.size)
+        return values
+
+
 def test_random_surface():
     """Test instantiating Surface layer with random 2D data."""
     np.random.seed(0)
@@ -55,6 +73,43 @@ def test_random_4D_surface():
     assert layer._view_vertex_values.ndim == 1
 
 
+def test_4D_surface_slices():
+    """Test the faces of each slice of a 4D surface."""
+    np.random.seed(0)
+    vertices = np.random.random((50, 4))
+    vertices[:, :2] = np.random.randint(3, size=(50, 2))
+    # Half of the faces are built from vertices lying in the same slice
+    slices = [
+        np.where(np.all(vertices[:, :2] == v, axis=1))[0]
+        for v in vertices[:, :2]
+    ]
+    faces = np.concatenate(
+        [
+            [np.random.choice(slices[v], 3) for v in range(50)],
+            np.random.randint(50, size=(50, 3)),
+        ]
+    )
+    values = np.random.random(50)
+    layer = Surface((vertices, faces, values))
+
+    for i in range(2):
+        for j in range(2):
+            layer.dims.set_point(0, i)
+            layer.dims.set_point(1, j)
+            indices = layer.dims.indices[:2]
+            coords = vertices[faces][..., :2].astype(int)
+            expected = faces[np.all(coords == indices, axis=(1, 2))]
+            assert indices == (i, j) and len(expected) > 0
+            np.testing.assert_array_equal(layer._view_faces, expected)
+
+    # The index follows changes of the vertices
+    layer.vertices = vertices[:, [1, 0, 2, 3]]
+    indices = layer.dims.indices[:2]
+    coords = layer.vertices[faces][..., :2].astype(int)
+    expected = faces[np.all(coords == indices, axis=(1, 2))]
+    np.testing.assert_array_equal(layer._view_faces, expected)
+
+
 def test_random_3D_timeseries_surface():
     """Test instantiating Surface layer with random 3D timeseries data."""
     np.random.seed(0)
@@ -99,6 +154,33 @@ def test_random_3D_multitimeseries_surface():
     assert layer._view_vertex_values.ndim == 1
 
 
+def test_lazy_timeseries_surface(tmp_path):
+    """Test only the viewed values of lazy vertex values are read."""
+    np.random.seed(0)
+    vertices = np.random.random((400, 3))
+    faces = np.random.randint(400, size=(100, 3))
+    values = np.random.random((3000, 400))
+
+    logged = _IndexLoggingArray(values)
+    layer = Surface((vertices, faces, logged))
+    assert max(logged.reads) == 400
+    assert layer.contrast_limits_range == [
+        min(values[i].min() for i in [0, 1500, 2999]),
+        max(values[i].max() for i in [0, 1500, 2999]),
+    ]
+    layer.dims.set_point(0, 7)
+    assert logged.reads[-1] == 400
+    np.testing.assert_array_equal(layer._view_vertex_values, values[7])
+
+    path = str(tmp_path / 'values.npy')
+    np.save(path, values)
+    for lazy in [np.load(path, mmap_mode='r'), da.from_array(values)]:
+        layer = Surface((vertices, faces, lazy))
+        layer.dims.set_point(0, 7)
+        assert isinstance(layer._view_vertex_values, np.ndarray)
+        np.testing.assert_array_equal(layer._view_vertex_values, values[7])
+
+
 def test_visiblity():
     """Test setting layer visiblity."""
     np.random.seed(0)
@@ -137,3 +219,69 @@ def test_surface_gamma():
     # Set gamma as keyword argument
     layer = Surface(data, gamma=gamma)
     assert layer.gamma == gamma
+
+
+def test_thumbnail():
+    """Test the thumbnail shows the faces colored by their values."""
+    vertices = np.array([[0, 0], [0, 20], [20, 0], [20, 20]])
+    faces = np.array([[0, 1, 2]])
+    values = np.array([1, 1, 1, 0])
+    layer = Surface((vertices, faces, values))
+    thumbnail = layer.thumbnail
+    assert thumbnail.shape == layer._thumbnail_shape
+    # The face is drawn in the top left corner with the top of the colormap
+    assert np.all(thumbnail[1, 1, :3] == 255)
+    assert np.all(thumbnail[-3, -3, :3] == 0)
+
+    # The drawn faces are reused when only the colormap changes
+    cached = layer._thumbnail_image
+    layer.colormap = 'red'
+    assert layer._thumbnail_image is cached
+    assert np.all(layer.thumbnail[1, 1, :3] == [255, 0, 0])
+
+    layer.faces = np.array([[1, 2, 3]])
+    assert np.all(layer.thumbnail[1, 1, :3] == 0)
+    assert layer.thumbnail[-3, -3, 0] > 0
+
+
+def test_lod_threshold():
+    """Test decimating surfaces with more faces than the lod threshold."""
+    np.random.seed(0)
+    vertices = 100 * np.random.random((2000, 2))
+    faces = np.random.randint(2000, size=(5000, 3))
+    values = np.random.random(2000)
+    layer = Surface((vertices, faces, values))
+    assert layer.lod_threshold is None
+    assert layer._lod_view is None
+
+    # Without a known zoom the finest mesh within the threshold is shown
+    layer.lod_threshold = 1000
+    new_vertices, new_faces, new_values = layer._lod_view
+    assert 0 < len(new_faces) <= 1000
+    assert len(new_values) == len(new_vertices)
+    assert new_values.min() >= values.min()
+    assert new_values.max() <= values.max()
+
+    # In 2D the mesh is decimated over canvas pixels
+    layer._set_lod(4)
+    assert layer._lod_level == 2
+    assert len(layer._lod_view[1]) > 1000
+    layer._set_lod(32)
+    assert len(layer._lod_view[1]) <= 1000
+
+    layer.lod_threshold = 5000
+    assert layer._lod_view is None
+
+
+@pytest.mark.parametrize('lod_threshold', [0, -5, 2.5, True, '100'])
+def test_invalid_lod_threshold(lod_threshold):
+    """Test that the lod threshold must be None or a positive integer."""
+    data = (np.random.random((10, 2)), np.zeros((1, 3), int), np.ones(10))
+    with pytest.raises(ValueError):
+        Surface(data, lod_threshold=lod_threshold)
+
+    layer = Surface(data, lod_threshold=np.int64(5))
+    assert layer.lod_threshold == 5
+    with pytest.raises(ValueError):
+        layer.lod_threshold = lod_threshold
+    assert layer.lod_threshold == 5
@@ -0,0 +1,47 @@
+import numpy as np
+
+from napari.layers.surface.surface_utils import decimate_mesh, decimate_values
+
+
+def _grid_mesh(n):
+    """Triangulated n x n grid of unit squares."""
+    rows, cols = np.meshgrid(np.arange(n + 1), np.arange(n + 1), indexing='ij')
+    vertices = np.stack([rows.ravel(), cols.ravel()], axis=1).astype(float)
+    corner = (rows[:-1, :-1] * (n + 1) + cols[:-1, :-1]).ravel()
+    faces = np.concatenate(
+        [
+            np.stack([corner, corner + 1, corner + n + 2], axis=1),
+            np.stack([corner, corner + n + 2, corner + n + 1], axis=1),
+        ]
+    )
+    return vertices, faces
+
+
+def test_decimate_mesh():
+    """Test clustering a grid mesh onto a coarser grid."""
+    vertices, faces = _grid_mesh(16)
+    new_vertices, new_faces, labels = decimate_mesh(vertices, faces, 2)
+    assert len(labels) == len(vertices)
+    assert len(new_vertices) == 9 ** 2
+    assert 0 < len(new_faces) < len(faces)
+    # No collapsed or repeated faces remain
+    assert np.all(new_faces[:, 0] != new_faces[:, 1])
+    assert np.all(new_faces[:, 1] != new_faces[:, 2])
+    assert np.all(new_faces[:, 0] != new_faces[:, 2])
+    assert len(np.unique(np.sort(new_faces, axis=1), axis=0)) == len(new_faces)
+    # Merged vertices are at the mean of the vertices of their cell
+    np.testing.assert_allclose(
+        new_vertices[labels[0]], vertices[labels == labels[0]].mean(axis=0)
+    )
+
+    # Cells smaller than the grid spacing keep the mesh unchanged
+    new_vertices, new_faces, labels = decimate_mesh(vertices, faces, 0.5)
+    np.testing.assert_allclose(new_vertices[labels], vertices)
+    assert len(new_faces) == len(faces)
+
+
+def test_decimate_values():
+    """Test vertex values are averaged over merged vertices."""
+    values = np.array([1.0, 3.0, 5.0, 7.0])
+    labels = np.array([0, 0, 1, 1])
+    np.testing.assert_allclose(decimate_values(values, labels), [2, 6])
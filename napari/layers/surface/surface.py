@@ -1,12 +1,14 @@
 import warnings
+from typing import Union
 
 import numpy as np
 
 from ...utils.colormaps import AVAILABLE_COLORMAPS
 from ...utils.event import Event
 from ..base import Layer
-from ..layer_utils import calc_data_range
+from ..layer_utils import calc_data_range, rasterize_triangles
 from ..intensity_mixin import IntensityVisualizationMixin
+from .surface_utils import decimate_mesh, decimate_values
 
 
 # Mixin must come before Layer
@@ -22,6 +24,8 @@ class Surface(IntensityVisualizationMixin, Layer):
         of the mesh triangles. The third element is the (K0, ..., KL, N)
         array of values used to color vertices where the additional L
         dimensions are used to color the same mesh with different values.
+        The values can be a lazy array such as a memory-mapped, zarr or dask
+        array, in which case only the values of the viewed slice are read.
     colormap : str, vispy.Color.Colormap, tuple, dict
         Colormap to use for luminance images. If a string must be the name
         of a supported colormap from vispy or matplotlib. If a tuple the
@@ -35,6 +39,12 @@ class Surface(IntensityVisualizationMixin, Layer):
         the image.
     gamma : float
         Gamma correction for determining colormap linearity. Defaults to 1.
+    lod_threshold : int, optional
+        Maximum number of faces in the current slice that are sent to the
+        canvas. If more faces are in the slice a decimated mesh is displayed,
+        with vertices merged over a screen pixel when the zoom is known and
+        otherwise as finely as fits in `lod_threshold` faces. If None, the
+        full mesh is displayed.
     name : str
         Name of the layer.
     metadata : dict
@@ -79,6 +89,9 @@ class Surface(IntensityVisualizationMixin, Layer):
         the image.
     gamma : float
         Gamma correction for determining colormap linearity.
+    lod_threshold : int or None
+        Maximum number of faces in the current slice that are sent to the
+        canvas before level-of-detail decimation is applied.
 
     Extended Summary
     ----------
@@ -87,12 +100,36 @@ class Surface(IntensityVisualizationMixin, Layer):
     _view_faces : (P, 3) array
         The integer indices of the vertices that form the triangles
         in the currently viewed slice.
+    _slice_index : tuple | None
+        Non-displayed vertex axes and a map from the integer coordinates of
+        a slice along them to the indices of the faces lying in that slice.
+        None if out of date.
+    _lod_level : int or None
+        Base 2 logarithm of the size of a canvas pixel in data coordinates,
+        used as the cell size when decimating the mesh in 2D. None until the
+        layer is drawn.
+    _lod_view : 3-tuple of array or None
+        Vertices, faces and vertex values of the decimated mesh sent to the
+        canvas, or None if the full mesh in view is displayed.
+    _lod_meshes : dict
+        Decimated meshes of the current slice by cell size.
+    _lod_key : tuple or None
+        Displayed axes and slice coordinates the decimated meshes were built
+        for.
+    _thumbnail_image : tuple or None
+        Key of the slice, and the mask and values of the faces drawn in the
+        thumbnail, so that the faces are only drawn again when the slice
+        changes. None if out of date.
     _colorbar : array
         Colorbar for current colormap.
     """
 
     _colormaps = AVAILABLE_COLORMAPS
 
+    # The max number of faces that will ever be used to render the thumbnail
+    # If more faces are present then an evenly spaced subsample is used
+    _max_faces_thumbnail = 4096
+
     def __init__(
         self,
         data,
@@ -100,6 +137,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         colormap='gray',
         contrast_limits=None,
         gamma=1,
+        lod_threshold=None,
         name=None,
         metadata=None,
         scale=None,
@@ -125,31 +163,54 @@ class Surface(IntensityVisualizationMixin, Layer):
 
         self.events.add(interpolation=Event, rendering=Event)
 
+        # assign mesh data and establish default behavior
+        self._vertices = data[0]
+        self._faces = data[1]
+        self._vertex_values = data[2]
+        self._slice_index = None
+
+        # Level of detail of the displayed mesh
+        self._lod_threshold = self._validate_lod_threshold(lod_threshold)
+        self._lod_level = None
+        self._lod_view = None
+        self._lod_meshes = {}
+        self._lod_key = None
+
+        # Data containing vectors in the currently viewed slice
+        self._data_view = np.zeros((0, self.dims.ndisplay))
+        self._view_faces = np.zeros((0, 3))
+        self._view_vertex_values = []
+        self._thumbnail_image = None
+
         # Set contrast_limits and colormaps
         self._gamma = gamma
         if contrast_limits is None:
-            self._contrast_limits_range = calc_data_range(data[2])
+            self._contrast_limits_range = self._calc_data_range()
         else:
             self._contrast_limits_range = contrast_limits
         self._contrast_limits = tuple(self._contrast_limits_range)
         self.colormap = colormap
         self.contrast_limits = self._contrast_limits
 
-        # Data containing vectors in the currently viewed slice
-        self._data_view = np.zeros((0, self.dims.ndisplay))
-        self._view_faces = np.zeros((0, 3))
-        self._view_vertex_values = []
-
-        # assign mesh data and establish default behavior
-        self._vertices = data[0]
-        self._faces = data[1]
-        self._vertex_values = data[2]
-
         # Trigger generation of view slice and thumbnail
         self._update_dims()
 
     def _calc_data_range(self):
-        return calc_data_range(self.vertex_values)
+        """Calculate the range of the vertex values.
+
+        Large series of vertex values are sampled at their first, middle and
+        last index, so that only three sets of vertex values are read.
+        """
+        values = self.vertex_values
+        if values.ndim > 1 and np.prod(values.shape) > 1e6:
+            shape = values.shape[:-1]
+            idxs = [
+                (0,) * len(shape),
+                tuple(s // 2 for s in shape),
+                tuple(s - 1 for s in shape),
+            ]
+            values = np.stack([np.asarray(values[idx]) for idx in idxs])
+        return calc_data_range(np.asarray(values))
 
     @property
     def dtype(self):
@@ -168,6 +229,9 @@ class Surface(IntensityVisualizationMixin, Layer):
         """Array of vertices of mesh triangles."""
 
         self._vertices = vertices
+        self._slice_index = None
+        self._lod_key = None
+        self._thumbnail_image = None
 
         self._update_dims()
         self.refresh()
@@ -182,6 +246,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         """Array of values used to color vertices.."""
 
         self._vertex_values = vertex_values
+        self._thumbnail_image = None
 
         self.refresh()
         self.events.data()
@@ -194,11 +259,117 @@ class Surface(IntensityVisualizationMixin, Layer):
     def faces(self, faces: np.ndarray):
         """Array of indices of mesh triangles.."""
 
-        self.faces = faces
+        self._faces = faces
+        self._slice_index = None
+        self._lod_key = None
+        self._thumbnail_image = None
 
         self.refresh()
         self.events.data()
 
+    @property
+    def lod_threshold(self) -> Union[None, int]:
+        """int or None: max number of faces displayed before decimating."""
+        return self._lod_threshold
+
+    @lod_threshold.setter
+    def lod_threshold(self, lod_threshold: Union[None, int]) -> None:
+        self._lod_threshold = self._validate_lod_threshold(lod_threshold)
+        self.refresh()
+
+    def _validate_lod_threshold(self, lod_threshold):
+        """Validates that the LOD threshold is None or a positive integer"""
+        if lod_threshold is None:
+            return None
+        if (
+            isinstance(lod_threshold, (bool, np.bool_))
+            or not isinstance(lod_threshold, (int, np.integer))
+            or lod_threshold < 1
+        ):
+            raise ValueError(
+                'lod_threshold must be None or an integer of at least 1, '
+                f'got {lod_threshold!r}'
+            )
+        return int(lod_threshold)
+
+    def _set_lod(self, scale_factor):
+        """Update the level of detail for the current zoom.
+
+        The displayed mesh is only recomputed when the layer is being
+        decimated and the zoom level crosses a power of two.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Size of a canvas pixel in data coordinates.
+        """
+        level = int(np.floor(np.log2(scale_factor)))
+        if level == self._lod_level:
+            return
+
+        self._lod_level = level
+        if self._lod_view is not None:
+            self._set_lod_view()
+            self.events.set_data()
+
+    def _set_lod_view(self):
+        """Decimate the mesh in view that is sent to the canvas.
+
+        In 2D, once the zoom is known, vertices are merged over cells the
+        size of a canvas pixel. Otherwise the cell size is doubled until the
+        decimated mesh has at most `lod_threshold` faces. Decimated meshes
+        are kept for the current slice and only their vertex values are
+        recomputed when the values change.
+        """
+        if (
+            self._lod_threshold is None
+            or len(self._view_faces) <= self._lod_threshold
+        ):
+            self._lod_view = None
+            return
+
+        vertices = self._data_view
+        if self._lod_level is not None and self.dims.ndisplay == 2:
+            cell_size = 2.0 ** self._lod_level
+            mesh = self._decimated_mesh(cell_size)
+        else:
+            # Start from cells holding about one face each of a mesh with
+            # lod_threshold faces spread uniformly over the extent
+            extent = np.ptp(vertices[np.unique(self._view_faces)], axis=0)
+            cell_size = 2.0 ** np.floor(
+                np.log2(
+                    max(extent.max(), 1e-12)
+                    / self._lod_threshold ** (1 / vertices.shape[1])
+                )
+            )
+            mesh = self._decimated_mesh(cell_size)
+            while len(mesh[1]) > self._lod_threshold:
+                cell_size = 2 * cell_size
+                mesh = self._decimated_mesh(cell_size)
+
+        new_vertices, new_faces, labels = mesh
+        values = decimate_values(self._view_vertex_values, labels)
+        self._lod_view = (new_vertices, new_faces, values)
+
+    def _decimated_mesh(self, cell_size):
+        """Decimated mesh of the current slice for a cell size.
+
+        Parameters
+        ----------
+        cell_size : float
+            Spacing of the grid the vertices are clustered on.
+
+        Returns
+        -------
+        mesh : 3-tuple of array
+            Vertices, faces and vertex labels from `decimate_mesh`.
+        """
+        if cell_size not in self._lod_meshes:
+            self._lod_meshes[cell_size] = decimate_mesh(
+                self._data_view, self._view_faces, cell_size
+            )
+        return self._lod_meshes[cell_size]
+
     def _get_ndim(self):
         """Determine number of dimensions of the layer."""
         return self.vertices.shape[1] + (self.vertex_values.ndim - 1)
@@ -235,6 +406,7 @@ class Surface(IntensityVisualizationMixin, Layer):
                 'colormap': self.colormap[0],
                 'contrast_limits': self.contrast_limits,
                 'gamma': self.gamma,
+                'lod_threshold': self.lod_threshold,
                 'data': self.data,
             }
         )
@@ -250,6 +422,7 @@ class Surface(IntensityVisualizationMixin, Layer):
         if values_ndim > 0:
             # Get indices for axes corresponding to values dimensions
             values_indices = self.dims.indices[:-vertex_ndim]
+            # Only the values of the slice are read from lazy arrays
             values = self.vertex_values[values_indices]
             if values.ndim > 1:
                 warnings.warn(
@@ -261,9 +434,10 @@ class Surface(IntensityVisualizationMixin, Layer):
                 self._data_view = np.zeros((0, self.dims.ndisplay))
                 self._view_faces = np.zeros((0, 3))
                 self._view_vertex_values = []
+                self._lod_view = None
                 return
 
-            self._view_vertex_values = values
+            self._view_vertex_values = np.asarray(values)
             # Determine which axes of the vertices data are being displayed
             # and not displayed, ignoring the additional dimensions
             # corresponding to the vertex_values.
@@ -279,19 +453,19 @@ class Surface(IntensityVisualizationMixin, Layer):
                 if d >= 0
             ]
         else:
-            self._view_vertex_values = self.vertex_values
+            self._view_vertex_values = np.asarray(self.vertex_values)
             indices = np.array(self.dims.indices)
             not_disp = list(self.dims.not_displayed)
             disp = list(self.dims.displayed)
 
         self._data_view = self.vertices[:, disp]
+        key = None
         if len(self.vertices) == 0:
             self._view_faces = np.zeros((0, 3))
         elif vertex_ndim > self.dims.ndisplay:
-            vertices = self.vertices[:, not_disp].astype('int')
-            triangles = vertices[self.faces]
-            matches = np.all(triangles == indices[not_disp], axis=(1, 2))
-            matches = np.where(matches)[0]
+            slice_index = self._get_slice_index(not_disp)
+            key = tuple(int(i) for i in indices[not_disp])
+            matches = slice_index.get(key, [])
             if len(matches) == 0:
                 self._view_faces = np.zeros((0, 3))
             else:
@@ -299,9 +473,98 @@ class Surface(IntensityVisualizationMixin, Layer):
         else:
             self._view_faces = self.faces
 
+        # Decimated meshes only depend on the mesh in view, not its values
+        if self._lod_key != (disp, key):
+            self._lod_key = (disp, key)
+            self._lod_meshes = {}
+        self._set_lod_view()
+
+    def _get_slice_index(self, not_disp):
+        """Map from slice coordinates to the faces lying in that slice.
+
+        A face lies in a slice when all three of its vertices, cast to int,
+        have the coordinates of the slice along the non-displayed axes. The
+        map is built in a single pass over the faces and kept until the
+        vertices, faces or non-displayed axes change.
+
+        Parameters
+        ----------
+        not_disp : list of int
+            Non-displayed axes of the vertices.
+
+        Returns
+        -------
+        slice_index : dict
+            Map from a tuple of integer coordinates along `not_disp` to the
+            sorted indices of the faces in that slice.
+        """
+        if self._slice_index is None or self._slice_index[0] != not_disp:
+            coords = self.vertices[:, not_disp].astype('int')
+            # Label each vertex by its slice so faces compare single ints
+            keys, vertex_keys = np.unique(coords, axis=0, return_inverse=True)
+            face_keys = vertex_keys.reshape(-1)[self.faces]
+            in_slice = np.all(face_keys == face_keys[:, :1], axis=1)
+            face_ids = np.where(in_slice)[0]
+            face_keys = face_keys[face_ids, 0]
+            order = np.argsort(face_keys, kind='stable')
+            face_ids = face_ids[order]
+            bounds = np.searchsorted(
+                face_keys[order], np.arange(len(keys) + 1)
+            )
+            slice_index = {
+                tuple(key): face_ids[start:stop]
+                for key, start, stop in zip(
+                    keys.tolist(), bounds[:-1], bounds[1:]
+                )
+                if stop > start
+            }
+            self._slice_index = (list(not_disp), slice_index)
+        return self._slice_index[1]
+
     def _update_thumbnail(self):
-        """Update thumbnail with current surface."""
-        pass
+        """Update thumbnail with current surface and colormap."""
+        disp = list(self.dims.displayed)[-2:]
+        offset = np.array([self.dims.range[d][0] for d in disp])
+        shape = np.ceil(
+            [self.dims.range[d][1] - self.dims.range[d][0] + 1 for d in disp]
+        )
+        zoom_factor = np.divide(self._thumbnail_shape[:2], shape).min()
+
+        # The drawn faces only change with the slice
+        not_disp = list(self.dims.not_displayed)
+        key = (
+            tuple(self.dims.displayed),
+            tuple(int(i) for i in np.array(self.dims.indices)[not_disp]),
+            tuple(offset),
+            zoom_factor,
+        )
+        if self._thumbnail_image is None or self._thumbnail_image[0] != key:
+            if len(self._view_faces) == 0:
+                mask = np.zeros(self._thumbnail_shape[:2], dtype=bool)
+                image = np.zeros(self._thumbnail_shape[:2])
+            else:
+                mask, image = rasterize_triangles(
+                    self._data_view[:, -2:],
+                    self._view_faces,
+                    self._thumbnail_shape[:2],
+                    values=self._view_vertex_values,
+                    offset=offset,
+                    scale=zoom_factor,
+                    max_triangles=self._max_faces_thumbnail,
+                )
+            self._thumbnail_image = (key, mask, image)
+
+        _, mask, image = self._thumbnail_image
+        low, high = self.contrast_limits
+        image = np.clip(image, low, high)
+        color_range = high - low
+        if color_range != 0:
+            image = (image - low) / color_range
+        image = image ** self.gamma
+        color_array = self.colormap[1][image.ravel()]
+        colormapped = color_array.rgba.reshape(image.shape + (4,))
+        colormapped[..., 3] *= mask * self.opacity
+        self.thumbnail = colormapped
 
     def to_xml_list(self):
         """Convert surface to a list of svg xml elements.
@@ -0,0 +1,66 @@
+import numpy as np
+
+
+def decimate_mesh(vertices, faces, cell_size):
+    """Simplify a mesh by clustering its vertices on a regular grid.
+
+    All the vertices falling in the same cell of a grid with spacing
+    `cell_size` are merged into one vertex at their mean position. Faces
+    that collapse to a line or a point are dropped, as are repeated faces.
+
+    Parameters
+    ----------
+    vertices : (N, D) array
+        Coordinates of the mesh vertices.
+    faces : (M, 3) array of int
+        Indices of the vertices of the mesh triangles.
+    cell_size : float
+        Spacing of the grid the vertices are clustered on.
+
+    Returns
+    -------
+    vertices : (K, D) array
+        Coordinates of the vertices of the decimated mesh.
+    faces : (P, 3) array of int
+        Indices of the vertices of the decimated mesh triangles.
+    labels : (N,) array of int
+        Index of the decimated vertex that each vertex was merged into.
+    """
+    cells = np.floor(vertices / cell_size).astype(np.int64)
+    _, labels = np.unique(cells, axis=0, return_inverse=True)
+    labels = labels.reshape(-1)
+    new_vertices = (
+        np.stack([np.bincount(labels, weights=v) for v in vertices.T], axis=1)
+        / np.bincount(labels)[:, np.newaxis]
+    )
+
+    new_faces = labels[faces]
+    collapsed = (
+        (new_faces[:, 0] == new_faces[:, 1])
+        | (new_faces[:, 1] == new_faces[:, 2])
+        | (new_faces[:, 0] == new_faces[:, 2])
+    )
+    new_faces = new_faces[~collapsed]
+    # Keep the first of any faces joining the same three vertices
+    _, first = np.unique(np.sort(new_faces, axis=1), axis=0, return_index=True)
+    new_faces = new_faces[np.sort(first)]
+
+    return new_vertices, new_faces, labels
+
+
+def decimate_values(values, labels):
+    """Average vertex values over the vertices merged by `decimate_mesh`.
+
+    Parameters
+    ----------
+    values : (N,) array
+        Value of each vertex of the full mesh.
+    labels : (N,) array of int
+        Index of the decimated vertex that each vertex was merged into.
+
+    Returns
+    -------
+    values : (K,) array
+        Mean value of the vertices merged into each decimated vertex.
+    """
+    return np.bincount(labels, weights=values) / np.bincount(labels)
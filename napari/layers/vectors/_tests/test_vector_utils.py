@@ -0,0 +1,63 @@
+import numpy as np
+
+from napari.layers.vectors.vector_utils import (
+    generate_vector_meshes,
+    generate_vector_offsets,
+    generate_vector_triangles,
+    offset_vector_meshes,
+)
+
+
+def test_generate_vector_triangles():
+    nvectors = 5
+    expected = np.array(
+        [
+            [2 * i, 2 * i + 1, 2 * i + 2]
+            if i % 2 == 0
+            else [2 * i - 1, 2 * i, 2 * i + 1]
+            for i in range(2 * nvectors)
+        ]
+    )
+    triangles = generate_vector_triangles(nvectors)
+    assert triangles.dtype == np.uint32
+    np.testing.assert_equal(triangles, expected)
+
+    assert generate_vector_triangles(0).shape == (0, 3)
+
+
+def test_generate_vector_meshes():
+    np.random.seed(0)
+    vectors = np.random.random((6, 2, 2))
+    vertices, triangles = generate_vector_meshes(vectors, 1, 1)
+    assert vertices.shape == (4 * 6, 2)
+    assert triangles.shape == (2 * 6, 3)
+
+    vectors = np.random.random((6, 2, 3))
+    vertices, triangles = generate_vector_meshes(vectors, 1, 1)
+    assert vertices.shape == (8 * 6, 3)
+    assert triangles.shape == (4 * 6, 3)
+    # The two rectangles of each vector share its start and end points
+    starts = vertices.reshape(6, 8, 3)[:, [0, 1, 4, 5]].mean(axis=1)
+    np.testing.assert_allclose(starts, vectors[:, 0])
+
+
+def test_offset_vector_meshes():
+    np.random.seed(0)
+    vectors = np.random.random((6, 2, 2))
+    offsets = generate_vector_offsets(vectors)
+    assert offsets.shape == (4 * 6, 2)
+    np.testing.assert_allclose(np.linalg.norm(offsets, axis=1), 1)
+
+    # Vertices are the start and end points moved along the offsets
+    vertices = offset_vector_meshes(vectors, offsets, 2, 3)
+    vertices = vertices.reshape(6, 4, 2)
+    ends = vectors[:, 0] + 3 * vectors[:, 1]
+    np.testing.assert_allclose(vertices[:, :2].mean(axis=1), vectors[:, 0])
+    np.testing.assert_allclose(vertices[:, 2:].mean(axis=1), ends)
+    widths = np.linalg.norm(vertices[:, 1] - vertices[:, 0], axis=1)
+    np.testing.assert_allclose(widths, 2)
+
+    out = np.empty((4 * 6, 2))
+    result = offset_vector_meshes(vectors, offsets, 1, 1, out=out)
+    assert np.shares_memory(result, out)
+    np.testing.assert_allclose(out, generate_vector_meshes(vectors, 1, 1)[0])
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 from xml.etree.ElementTree import Element
 from napari.layers import Vectors
 
@@ -94,6 +95,64 @@ def test_changing_data():
     assert layer._data_view.shape[2] == 2
 
 
+@pytest.mark.parametrize('ndisplay', [2, 3])
+def test_extend(ndisplay):
+    """Test appending vectors matches setting the data directly."""
+    np.random.seed(0)
+    data = np.random.random((10, 2, 3))
+    data[:, 0, :] = np.random.randint(0, 3, (10, 3))
+    new_data = np.random.random((7, 2, 3))
+    new_data[:, 0, :] = np.random.randint(0, 3, (7, 3))
+    layer = Vectors(data)
+    layer.dims.ndisplay = ndisplay
+    layer.extend(new_data[:4])
+    layer.extend(new_data[4:6])
+    layer.append(new_data[6])
+    layer.refresh()
+
+    expected = Vectors(np.concatenate((data, new_data), axis=0))
+    expected.dims.ndisplay = ndisplay
+    np.testing.assert_equal(layer.data, expected.data)
+    np.testing.assert_allclose(layer._mesh_vertices, expected._mesh_vertices)
+    np.testing.assert_equal(layer._mesh_triangles, expected._mesh_triangles)
+    np.testing.assert_equal(layer._view_faces, expected._view_faces)
+    np.testing.assert_equal(layer._data_view, expected._data_view)
+
+
+def test_extend_then_set_data():
+    """Test setting data after appending vectors releases the buffers."""
+    layer = Vectors(np.random.random((4, 2, 2)))
+    layer.extend(np.random.random((3, 2, 2)))
+    assert len(layer._buffers) > 0
+
+    layer.data = np.random.random((2, 2, 2))
+    assert len(layer._buffers) == 0
+
+
+@pytest.mark.parametrize('ndisplay', [2, 3])
+def test_extend_capacity(ndisplay):
+    """Test dropping the oldest vectors when appending beyond capacity."""
+    np.random.seed(0)
+    data = np.random.random((10, 2, 3))
+    data[:, 0, :] = np.random.randint(0, 3, (10, 3))
+    new_data = np.random.random((4, 2, 3))
+    new_data[:, 0, :] = np.random.randint(0, 3, (4, 3))
+    layer = Vectors(data)
+    layer.dims.ndisplay = ndisplay
+    layer.extend(new_data, capacity=8)
+    layer.refresh()
+
+    expected = Vectors(np.concatenate((data, new_data), axis=0)[-8:])
+    expected.dims.ndisplay = ndisplay
+    np.testing.assert_equal(layer.data, expected.data)
+    np.testing.assert_allclose(layer._mesh_vertices, expected._mesh_vertices)
+    np.testing.assert_equal(layer._mesh_triangles, expected._mesh_triangles)
+    np.testing.assert_equal(layer._view_faces, expected._view_faces)
+
+    with pytest.raises(ValueError):
+        layer.extend(new_data, capacity=0)
+
+
 def test_name():
     """Test setting layer name."""
     np.random.seed(0)
@@ -208,6 +267,59 @@ def test_length():
     assert layer.length == 3
 
 
+@pytest.mark.parametrize('ndisplay', [2, 3])
+def test_width_and_length_update_vertices(ndisplay):
+    """Test changing width and length moves the vertices in place."""
+    np.random.seed(0)
+    data = np.random.random((10, 2, 3))
+    data[:, 0, :] = 20 * data[:, 0, :]
+    layer = Vectors(data)
+    layer.dims.ndisplay = ndisplay
+    layer.refresh()
+    vertices = layer._mesh_vertices
+    offsets = layer._mesh_offsets
+    triangles = layer._mesh_triangles
+
+    layer.edge_width = 3
+    layer.length = 2
+    assert layer._mesh_vertices is vertices
+    assert layer._mesh_offsets is offsets
+    assert layer._mesh_triangles is triangles
+
+    expected = Vectors(data, edge_width=3, length=2)
+    expected.dims.ndisplay = ndisplay
+    expected.refresh()
+    np.testing.assert_allclose(layer._mesh_vertices, expected._mesh_vertices)
+    np.testing.assert_equal(layer._view_faces, expected._view_faces)
+
+
+def test_slice_index():
+    """Test the cached map from slices to vectors when changing slices."""
+    np.random.seed(0)
+    data = np.random.random((50, 2, 3))
+    data[:, 0, 0] = np.random.randint(0, 5, 50)
+    data[:, 0, 1:] = 20 * data[:, 0, 1:]
+    layer = Vectors(data)
+    for z in range(5):
+        layer.dims.set_point(0, z)
+        expected = np.where(data[:, 0, 0] == layer.dims.indices[0])[0]
+        np.testing.assert_equal(layer._indices_view, expected)
+        np.testing.assert_equal(layer._data_view, data[expected][:, :, 1:])
+        vertices = layer._mesh_vertices.reshape(50, 4, 2)[expected]
+        np.testing.assert_allclose(
+            layer._view_vertices, vertices.reshape(-1, 2)
+        )
+        assert len(layer._view_faces) == 2 * len(expected)
+    slice_index = layer._slice_index
+    assert slice_index is not None
+
+    # The map is rebuilt when the data changes
+    layer.data = data[:10]
+    assert layer._slice_index is not slice_index
+    expected = np.where(data[:10, 0, 0] == layer.dims.indices[0])[0]
+    np.testing.assert_equal(layer._indices_view, expected)
+
+
 def test_thumbnail():
     """Test the image thumbnail for square data."""
     np.random.seed(0)
@@ -219,6 +331,31 @@ def test_thumbnail():
     layer = Vectors(data)
     layer._update_thumbnail()
     assert layer.thumbnail.shape == layer._thumbnail_shape
+    assert layer.thumbnail[0, 0, 0] > 0
+    assert np.all(layer.thumbnail[0, 0, 1:3] == 0)
+
+    # The drawn vectors are reused when only the color changes
+    cached = layer._thumbnail_mask
+    layer.edge_color = 'blue'
+    assert layer._thumbnail_mask is cached
+    assert layer.thumbnail[0, 0, 2] > 0
+    assert np.all(layer.thumbnail[0, 0, :2] == 0)
+
+    layer.data = data[1:]
+    assert layer._thumbnail_mask is not cached
+    assert np.all(layer.thumbnail[0, 0, :3] == 0)
+
+
+def test_thumbnail_subsampling():
+    """Test thumbnails of many vectors are deterministic."""
+    np.random.seed(0)
+    data = np.random.random((10000, 2, 2))
+    data[:, 0, :] = 100 * data[:, 0, :]
+    layer = Vectors(data)
+    thumbnail = layer.thumbnail
+    layer._thumbnail_mask = None
+    layer._update_thumbnail()
+    np.testing.assert_equal(layer.thumbnail, thumbnail)
 
 
 def test_value():
@@ -252,3 +389,72 @@ def test_xml_list():
     assert type(xml) == list
     assert len(xml) == 10
     assert np.all([type(x) == Element for x in xml])
+
+
+def test_image_vectors_are_lazy():
+    """Test image-like data is sliced without converting it to coordinates."""
+    np.random.seed(0)
+    data = np.random.random((6, 20, 10, 3))
+    layer = Vectors(data)
+    assert layer._data is None
+    assert layer.ndim == 3
+    layer.dims.set_point(0, 4)
+    assert layer._data_view.shape == (20 * 10, 2, 2)
+    assert layer._data is None
+
+    # The view matches slicing the converted coordinates
+    coords = layer.data
+    assert coords.shape == (6 * 20 * 10, 2, 3)
+    np.testing.assert_allclose(
+        layer._data_view, coords[layer._indices_view][:, :, 1:]
+    )
+    np.testing.assert_equal(coords[layer._indices_view, 0, 0], 4)
+
+    # Each start point has the projection of its own pixel
+    np.testing.assert_allclose(coords[:, 1], data.reshape(-1, 3))
+    np.testing.assert_equal(coords[43, 0], [0, 4, 3])
+
+
+def test_image_vectors_extent():
+    """Test the extent of image-like data includes the vector end points."""
+    data = np.zeros((5, 4, 2))
+    data[0, 0] = [-2, 0]
+    data[4, 3] = [0, 3]
+    layer = Vectors(data, length=2)
+    assert layer.dims.range[0][:2] == (-4, 4)
+    assert layer.dims.range[1][:2] == (0, 9)
+
+
+def test_image_vectors_stride():
+    """Test image-like data is subsampled when zoomed out."""
+    np.random.seed(0)
+    data = np.random.random((64, 32, 2))
+    layer = Vectors(data)
+    assert layer._grid_stride == 1
+    assert len(layer._data_view) == 64 * 32
+
+    # Zooming out so that vectors would be 1/2 pixel apart
+    layer._set_grid_stride(2)
+    assert layer._grid_stride == 8
+    assert len(layer._data_view) == 8 * 4
+    np.testing.assert_equal(layer._data_view[:, 0, 0] % 8, 0)
+    np.testing.assert_allclose(layer._data_view[1, 1], data[0, 8])
+    assert len(layer._view_faces) == 2 * 8 * 4
+
+    layer._set_grid_stride(0.1)
+    assert layer._grid_stride == 1
+    assert len(layer._data_view) == 64 * 32
+
+    # Large images start subsampled before being drawn
+    layer = Vectors(np.zeros((4096, 16, 2)))
+    assert layer._grid_stride == 16
+
+
+def test_image_vectors_extend():
+    """Test appending to image-like data converts it to coordinates."""
+    data = np.random.random((4, 3, 2))
+    layer = Vectors(data)
+    layer.extend(np.random.random((2, 2, 2)))
+    assert layer._grid is None
+    assert layer.data.shape == (14, 2, 2)
+    np.testing.assert_allclose(layer.data[:12, 1], data.reshape(-1, 2))
@@ -1,5 +1,4 @@
 import numpy as np
-from copy import copy
 from ..layer_utils import segment_normal
 
 
@@ -21,19 +20,42 @@ def vectors_to_coordinates(vectors):
         A list of N vectors with start point and projections of the vector
         in D dimensions.
     """
+    if is_image_like(vectors):
+        coords = convert_image_to_coordinates(vectors)
+    else:
+        coords = vectors
+
+    return coords
+
+
+def is_image_like(vectors):
+    """Determine whether vector data is image-like or coordinate-like
+
+    Parameters
+    ----------
+    vectors : (N, 2, D) or (N1, N2, ..., ND, D) array
+        A (N, 2, D) array is interpreted as "coordinate-like" data and a list
+        of N vectors with start point and projections of the vector in D
+        dimensions. A (N1, N2, ..., ND, D) array is interpreted as
+        "image-like" data where there is a length D vector of the
+        projections at each pixel.
+
+    Returns
+    ----------
+    image_like : bool
+        True if the data is image-like.
+    """
     if vectors.shape[-2] == 2 and vectors.ndim == 3:
         # an (N, 2, D) array that is coordinate-like
-        coords = vectors
+        return False
     elif vectors.shape[-1] == vectors.ndim - 1:
         # an (N1, N2, ..., ND, D) array that is image-like
-        coords = convert_image_to_coordinates(vectors)
+        return True
     else:
         raise TypeError(
             "Vector data of shape %s is not supported" % str(vectors.shape)
         )
 
-    return coords
-
 
 def convert_image_to_coordinates(vectors):
     """To convert an image-like array with elements (y-proj, x-proj) into a
@@ -54,7 +76,7 @@ def convert_image_to_coordinates(vectors):
     """
     # create coordinate spacing for image
     spacing = [list(range(r)) for r in vectors.shape[:-1]]
-    grid = np.meshgrid(*spacing)
+    grid = np.meshgrid(*spacing, indexing='ij')
 
     # create empty vector of necessary shape
     nvect = np.prod(vectors.shape[:-1])
@@ -68,6 +90,69 @@ def convert_image_to_coordinates(vectors):
     return coords
 
 
+def slice_image_vectors(vectors, indices, displayed, stride=1):
+    """Slice image-like vector data without converting it to coordinates
+
+    Parameters
+    ----------
+    vectors : (N1, N2, ..., ND, D) array
+        "image-like" data where there is a length D vector of the
+        projections at each pixel.
+    indices : sequence of int or slice
+        Indices of the current slice, used for the axes not displayed.
+    displayed : sequence of int
+        Displayed axes, in display order.
+    stride : int
+        Only every stride-th pixel along each displayed axis is kept.
+
+    Returns
+    ----------
+    coords : (M, 2, len(displayed)) array
+        Start point and projections of the vectors in the slice, in the
+        displayed dimensions.
+    slice_indices : (M,) array
+        Indices of the vectors in the slice among all the pixels of the
+        image, in C order.
+    """
+    shape = vectors.shape[:-1]
+    displayed = list(displayed)
+    ndisplay = len(displayed)
+    key = []
+    for axis, n in enumerate(shape):
+        if axis in displayed:
+            key.append(slice(None, None, stride))
+        elif int(indices[axis]) == indices[axis] and 0 <= indices[axis] < n:
+            key.append(int(indices[axis]))
+        else:
+            return np.empty((0, 2, ndisplay)), np.empty(0, dtype=int)
+
+    # Remaining axes are in increasing order, so move them to display order
+    sliced = np.asarray(vectors[tuple(key)])
+    order = [sorted(displayed).index(axis) for axis in displayed]
+    sliced = np.transpose(sliced, order + [ndisplay])
+
+    pixels = np.meshgrid(
+        *[np.arange(0, shape[axis], stride) for axis in displayed],
+        indexing='ij',
+    )
+    coords = np.empty((sliced[..., 0].size, 2, ndisplay), dtype=np.float32)
+    for i, p in enumerate(pixels):
+        coords[:, 0, i] = p.ravel()
+    coords[:, 1, :] = np.reshape(sliced[..., displayed], (-1, ndisplay))
+
+    # Find the indices of the pixels in the image, in C order
+    axes_pixels = [
+        pixels[displayed.index(axis)].ravel()
+        if axis in displayed
+        else key[axis]
+        for axis in range(len(shape))
+    ]
+    slice_indices = np.ravel_multi_index(
+        tuple(np.broadcast_arrays(*axes_pixels)), shape
+    )
+    return coords, slice_indices
+
+
 def generate_vector_meshes(vectors, width, length):
     """Generates list of mesh vertices and triangles from a list of vectors
 
@@ -83,68 +168,118 @@ def generate_vector_meshes(vectors, width, length):
 
     Returns
     ----------
-    vertices : (4N, D) array
-        Vertices of all triangles for the lines
-    triangles : (2N, 3) array
-        Vertex indices that form the mesh triangles
+    vertices : (4N, D) or (8N, D) array
+        Vertices of all triangles for the lines. In 3D each vector is made of
+        two orthogonal rectangles whose eight vertices are stored together.
+    triangles : (2N, 3) or (4N, 3) array
+        Vertex indices that form the mesh triangles, with the triangles of
+        each vector stored together.
+    """
+    offsets = generate_vector_offsets(vectors)
+    vertices = offset_vector_meshes(vectors, offsets, width, length)
+    triangles = generate_vector_triangles(len(offsets) // 4)
+
+    return vertices, triangles
+
+
+def generate_vector_offsets(vectors):
+    """Generates the unit offsets of the mesh vertices of a list of vectors
+
+    The offsets only depend on the directions of the vectors, so the meshes
+    can be rebuilt for any width and length with `offset_vector_meshes`.
+
+    Parameters
+    ----------
+    vectors : (N, 2, D) array
+        A list of N vectors with start point and projections of the vector
+        in D dimensions, where D is 2 or 3.
+
+    Returns
+    ----------
+    offsets : (4N, D) or (8N, D) array
+        Unit offsets of the mesh vertices from the vector lines. Each
+        rectangle has four vertices, two at the start and two at the end of
+        its vector. In 3D each vector is made of two orthogonal rectangles
+        whose eight vertices are stored together.
     """
     ndim = vectors.shape[2]
+    projections = vectors[:, 1, :]
     if ndim == 2:
-        vertices, triangles = generate_vector_meshes_2D(vectors, width, length)
+        normals = [segment_normal(np.zeros_like(projections), projections)]
     else:
-        v_a, t_a = generate_vector_meshes_2D(
-            vectors, width, length, p=(0, 0, 1)
-        )
-        v_b, t_b = generate_vector_meshes_2D(
-            vectors, width, length, p=(1, 0, 0)
-        )
-        vertices = np.concatenate([v_a, v_b], axis=0)
-        triangles = np.concatenate([t_a, len(v_a) + t_b], axis=0)
+        normals = [
+            segment_normal(np.zeros_like(projections), projections, p=p)
+            for p in [(0, 0, 1), (1, 0, 0)]
+        ]
 
-    return vertices, triangles
+    offsets = np.empty((len(vectors), 4 * len(normals), ndim))
+    for i, normal in enumerate(normals):
+        offsets[:, 4 * i : 4 * i + 4 : 2] = -normal[:, np.newaxis]
+        offsets[:, 4 * i + 1 : 4 * i + 4 : 2] = normal[:, np.newaxis]
 
+    return np.reshape(offsets, (-1, ndim))
 
-def generate_vector_meshes_2D(vectors, width, length, p=(0, 0, 1)):
-    """Generates list of mesh vertices and triangles from a list of vectors
+
+def offset_vector_meshes(vectors, offsets, width, length, out=None):
+    """Generates the mesh vertices of a list of vectors from their offsets
 
     Parameters
     ----------
     vectors : (N, 2, D) array
         A list of N vectors with start point and projections of the vector
         in D dimensions, where D is 2 or 3.
+    offsets : (4N, D) or (8N, D) array
+        Unit offsets of the mesh vertices from `generate_vector_offsets`.
     width : float
         width of the line to be drawn
     length : float
         length multiplier of the line to be drawn
-    p : 3-tuple, optional
-        orthogonal vector for segment calculation in 3D.
+    out : (4N, D) or (8N, D) array, optional
+        Contiguous array the vertices are written to.
+
+    Returns
+    ----------
+    vertices : (4N, D) or (8N, D) array
+        Vertices of all triangles for the lines.
+    """
+    nvectors, _, ndim = vectors.shape
+    nvertices = len(offsets) // max(nvectors, 1)
+    # The last two vertices of each rectangle are at the end of the vector
+    ends = np.tile([0, 0, length, length], nvertices // 4)
+
+    shape = (nvectors, nvertices, ndim)
+    # Reshaping a contiguous array gives a view of it
+    vertices = np.multiply(
+        np.reshape(offsets, shape),
+        width / 2,
+        out=None if out is None else np.reshape(out, shape),
+    )
+    vertices += ends[:, np.newaxis] * vectors[:, np.newaxis, 1, :]
+    vertices += vectors[:, np.newaxis, 0, :]
+
+    return np.reshape(vertices, (-1, ndim)) if out is None else out
+
+
+def generate_vector_triangles(nvectors):
+    """Generates the triangles of the rectangle meshes of a list of vectors
+
+    Each rectangle is represented by four consecutive vertices that form two
+    triangles, so the triangles only depend on the number of rectangles.
+
+    Parameters
+    ----------
+    nvectors : int
+        Number of rectangles, which is the number of vectors in 2D and twice
+        the number of vectors in 3D.
 
     Returns
     ----------
-    vertices : (4N, D) array
-        Vertices of all triangles for the lines
     triangles : (2N, 3) array
         Vertex indices that form the mesh triangles
     """
-    ndim = vectors.shape[2]
-    vectors = np.reshape(copy(vectors), (-1, ndim))
-    vectors[1::2] = vectors[::2] + length * vectors[1::2]
-
-    centers = np.repeat(vectors, 2, axis=0)
-    offsets = segment_normal(vectors[::2, :], vectors[1::2, :], p=p)
-    offsets = np.repeat(offsets, 4, axis=0)
-    signs = np.ones((len(offsets), ndim))
-    signs[::2] = -1
-    offsets = offsets * signs
-
-    vertices = centers + width * offsets / 2
-    triangles = np.array(
-        [
-            [2 * i, 2 * i + 1, 2 * i + 2]
-            if i % 2 == 0
-            else [2 * i - 1, 2 * i, 2 * i + 1]
-            for i in range(len(vectors))
-        ]
-    ).astype(np.uint32)
+    corners = 4 * np.arange(nvectors, dtype=np.uint32)
+    triangles = np.empty((2 * nvectors, 3), dtype=np.uint32)
+    triangles[::2] = corners[:, np.newaxis] + [0, 1, 2]
+    triangles[1::2] = corners[:, np.newaxis] + [1, 2, 3]
 
-    return vertices, triangles
+    return triangles
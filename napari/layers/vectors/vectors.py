@@ -5,7 +5,17 @@ from copy import copy
 from ..base import Layer
 from ...utils.event import Event
 from ...utils.status_messages import format_float
-from .vector_utils import vectors_to_coordinates, generate_vector_meshes
+from ..layer_utils import rasterize_segments, subsample_indices
+from .vector_utils import (
+    convert_image_to_coordinates,
+    vectors_to_coordinates,
+    generate_vector_meshes,
+    generate_vector_offsets,
+    generate_vector_triangles,
+    offset_vector_meshes,
+    is_image_like,
+    slice_image_vectors,
+)
 from vispy.color import get_color_names, Color
 
 
@@ -60,22 +70,53 @@ class Vectors(Layer):
     _data_view : (M, 2, 2) array
         The start point and projections of N vectors in 2D for vectors whose
         start point is in the currently viewed slice.
+    _indices_view : (M,) array
+        Integer indices of the vectors whose start point is in the currently
+        viewed slice.
+    _slice_index : tuple | None
+        Non-displayed axes and map from slice coordinates along them to the
+        indices of the vectors starting in that slice, built on the first
+        slice of coordinate-like data. None when it has to be rebuilt.
     _mesh_vertices : (4N, 2) array
         The four corner points for the mesh representation of each vector as as
         rectangle in the slice that it starts in.
+    _mesh_offsets : (4N, 2) array
+        Unit offsets of the `_mesh_vertices` from the start and end points of
+        the vectors, so that the vertices can be recomputed for a new width
+        or length without generating the meshes again.
     _mesh_triangles : (2N, 3) array
         The integer indices of the `_mesh_vertices` that form the two triangles
         for the mesh representation of the vectors.
     _max_vectors_thumbnail : int
         The maximum number of vectors that will ever be used to render the
-        thumbnail. If more vectors are present then they are randomly
-        subsampled.
+        thumbnail. If more vectors are present then an evenly spaced subsample
+        of them is used.
+    _thumbnail_mask : tuple | None
+        Key of the slice and the mask of the pixels covered by its vectors in
+        the thumbnail, so that the vectors are only drawn again when the
+        slice changes. None when it has to be drawn again.
+    _grid : (N1, N2, ..., ND, D) array or None
+        Image-like data kept in its native form. Only the vectors in the
+        current slice are converted to coordinates and meshed, and `data` is
+        only computed when first accessed. None for coordinate-like data.
+    _grid_stride : int
+        Only every `_grid_stride`-th vector of image-like data is displayed
+        along each displayed axis, updated with the zoom level.
     """
 
     # The max number of vectors that will ever be used to render the thumbnail
-    # If more vectors are present then they are randomly subsampled
+    # If more vectors are present then an evenly spaced subsample is used
     _max_vectors_thumbnail = 1024
 
+    # Minimum spacing in canvas pixels between displayed vectors of image-like
+    # data. Vectors are subsampled by powers of two to respect it when zoomed
+    # out. If None all vectors are displayed.
+    _min_grid_spacing = 4
+
+    # Canvas size in pixels assumed for subsampling image-like data before
+    # the layer is first drawn
+    _grid_canvas_size = 1024
+
     def __init__(
         self,
         data,
@@ -112,11 +153,19 @@ class Vectors(Layer):
         self._edge_color = edge_color
         self._colors = get_color_names()
 
+        self._grid = None
+        self._grid_stride = 1
         self._mesh_vertices = np.empty((0, 2))
+        self._mesh_offsets = np.empty((0, 2))
         self._mesh_triangles = np.empty((0, 3), dtype=np.uint32)
+        self._triangles_cache = np.empty((0, 3), dtype=np.uint32)
+        self._view_faces_stale = False
 
         # Data containing vectors in the currently viewed slice
         self._data_view = np.empty((0, 2, 2))
+        self._indices_view = np.empty(0, dtype=int)
+        self._slice_index = None
+        self._thumbnail_mask = None
         self._displayed_stored = []
         self._view_vertices = []
         self._view_faces = []
@@ -129,25 +178,259 @@ class Vectors(Layer):
 
     @property
     def data(self) -> np.ndarray:
+        if self._data is None:
+            # Image-like data is only converted to coordinates on request
+            self._data = convert_image_to_coordinates(self._grid)
         return self._data
 
     @data.setter
     def data(self, vectors: np.ndarray):
         """(N, 2, D) array: start point and projections of vectors."""
-
+        # Release any buffers used for streaming the replaced data
+        self._buffers.clear()
+        self._slice_index = None
+        self._thumbnail_mask = None
+
+        if is_image_like(vectors):
+            self._grid = vectors
+            self._data = None
+            self._mesh_vertices = np.empty((0, self.dims.ndisplay))
+            self._mesh_offsets = np.empty((0, self.dims.ndisplay))
+            self._mesh_triangles = np.empty((0, 3), dtype=np.uint32)
+            self._grid_stride = self._initial_grid_stride()
+            self._update_dims()
+            self.events.data()
+            return
+
+        self._grid = None
         self._data = vectors_to_coordinates(vectors)
+        self._set_meshes()
+
+        self._update_dims()
+        self.events.data()
+
+    def extend(self, data, capacity=None):
+        """Append vectors to the layer, for example from a live acquisition.
+
+        Unlike setting `data`, the layer arrays grow in amortized constant
+        time per vector, meshes are only generated and sliced for the new
+        vectors, and the view is refreshed at most once every
+        `_min_refresh_interval` seconds, so that vectors can be streamed into
+        the layer at a high rate. A deferred refresh is sent on the next draw
+        of the canvas, or on the next call to `refresh` when no canvas is
+        attached.
+
+        The range of the dims is grown to include the new vectors but is not
+        shrunk when old vectors are dropped.
+
+        Parameters
+        ----------
+        data : (M, 2, D) array
+            Start point and projections of M new vectors in D dimensions.
+        capacity : int, optional
+            Maximum number of vectors to keep. If exceeded, the oldest vectors
+            are removed so that the layer acts as a ring buffer.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError('capacity must be at least 1')
+        data = np.asarray(data)
+        if data.ndim == 2:
+            data = np.expand_dims(data, axis=0)
+        if len(data) == 0:
+            return
+
+        if self._grid is not None:
+            # Image-like data has to be converted to coordinates to be grown
+            self.data = self.data
+        self._slice_index = None
+        self._thumbnail_mask = None
+
+        if self.dims.displayed != self._displayed_stored:
+            # Meshes are out of date so regenerate them with the new vectors
+            self._data = np.concatenate((self._data, data), axis=0)
+            if capacity is not None:
+                self._data = self._data[-capacity:]
+            self._set_meshes()
+            self._set_view_slice()
+            self._update_dims()
+            self.events.data()
+            return
+
+        cur_nvectors = len(self._data)
+        self._data = self._extend_buffer('data', self._data, data)
+        vectors = data[:, :, list(self.dims.displayed)]
+        offsets = generate_vector_offsets(vectors)
+        vertices = offset_vector_meshes(
+            vectors, offsets, self.edge_width, self.length
+        )
+        self._mesh_offsets = self._extend_buffer(
+            'mesh_offsets', self._mesh_offsets, offsets
+        )
+        self._mesh_vertices = self._extend_buffer(
+            'mesh_vertices', self._mesh_vertices, vertices
+        )
+
+        if capacity is not None and len(self._data) > capacity:
+            n_drop = len(self._data) - capacity
+            nvertices = 4 if self.dims.ndisplay == 2 else 8
+            self._data = self._drop_buffer('data', self._data, n_drop)
+            self._mesh_offsets = self._drop_buffer(
+                'mesh_offsets', self._mesh_offsets, n_drop * nvertices
+            )
+            self._mesh_vertices = self._drop_buffer(
+                'mesh_vertices', self._mesh_vertices, n_drop * nvertices
+            )
+        else:
+            n_drop = 0
+        start = max(cur_nvectors - n_drop, 0)
+        self._mesh_triangles = self._vector_triangles(len(self._data))
+
+        # Only slice the new vectors and shift the old ones. Slice indices
+        # are sorted, so dropped vectors are at the start
+        old_indices = np.asarray(self._indices_view, dtype=int)
+        n_removed = np.searchsorted(old_indices, n_drop)
+        indices = self._drop_buffer('indices_view', old_indices, n_removed)
+        if n_drop > 0:
+            indices -= n_drop
+        self._indices_view = self._extend_buffer(
+            'indices_view', indices, self._slice_indices(start)
+        )
+        self._view_faces_stale = True
+
+        # Update the range from the endpoints of the new vectors
+        new_data = self._data[start:]
+        ends = new_data[:, 0, :] + self.length * new_data[:, 1, :]
+        extent = [
+            (min, max, 1)
+            for min, max in zip(
+                np.minimum(new_data[:, 0, :], ends).min(axis=0),
+                np.maximum(new_data[:, 0, :], ends).max(axis=0),
+            )
+        ]
+        self._extend_range(extent, reset=start == 0)
+        self._schedule_refresh()
+        self.events.data()
 
-        vertices, triangles = generate_vector_meshes(
-            self._data[:, :, list(self.dims.displayed)],
+    def _set_meshes(self):
+        """Generate the meshes of all the vectors in the displayed axes."""
+        vectors = self._data[:, :, list(self.dims.displayed)]
+        self._mesh_offsets = generate_vector_offsets(vectors)
+        self._mesh_vertices = offset_vector_meshes(
+            vectors, self._mesh_offsets, self.edge_width, self.length
+        )
+        self._mesh_triangles = generate_vector_triangles(
+            len(self._mesh_offsets) // 4
+        )
+        self._displayed_stored = copy(self.dims.displayed)
+
+    def _update_mesh_vertices(self):
+        """Move the mesh vertices to the current width and length.
+
+        Only the vertices are recomputed from the stored offsets, in place
+        when possible, so the meshes are not generated again.
+        """
+        if self._grid is not None:
+            # Image-like data is only meshed in the current slice
+            return
+        if self.dims.displayed != self._displayed_stored:
+            self._set_meshes()
+            return
+        vectors = self._data[:, :, list(self.dims.displayed)]
+        vertices = self._mesh_vertices
+        if (
+            vertices.shape != self._mesh_offsets.shape
+            or not vertices.flags.c_contiguous
+            or not vertices.flags.writeable
+        ):
+            vertices = None
+        self._mesh_vertices = offset_vector_meshes(
+            vectors,
+            self._mesh_offsets,
             self.edge_width,
             self.length,
+            out=vertices,
         )
-        self._mesh_vertices = vertices
-        self._mesh_triangles = triangles
-        self._displayed_stored = copy(self.dims.displayed)
 
-        self._update_dims()
-        self.events.data()
+    def _vector_triangles(self, nvectors):
+        """Get the mesh triangles of the first vectors of the layer.
+
+        The triangles only depend on the number of vectors, so a cached array
+        is grown geometrically and a view of its start is returned.
+
+        Parameters
+        ----------
+        nvectors : int
+            Number of vectors.
+
+        Returns
+        ----------
+        triangles : (2N, 3) or (4N, 3) array
+            Vertex indices that form the mesh triangles.
+        """
+        nrectangles = nvectors * (1 if self.dims.ndisplay == 2 else 2)
+        if len(self._triangles_cache) < 2 * nrectangles:
+            self._triangles_cache = generate_vector_triangles(2 * nrectangles)
+        return self._triangles_cache[: 2 * nrectangles]
+
+    def append(self, vector):
+        """Append a single vector to the layer.
+
+        Parameters
+        ----------
+        vector : (2, D) array
+            Start point and projection of the new vector in D dimensions.
+        """
+        self.extend(np.expand_dims(vector, axis=0))
+
+    def _initial_grid_stride(self):
+        """Estimate the subsampling of image-like data before it is drawn.
+
+        Returns
+        ----------
+        stride : int
+            Power of two such that the displayed vectors are at least
+            `_min_grid_spacing` pixels apart on a canvas of
+            `_grid_canvas_size` pixels showing the whole image.
+        """
+        if self._min_grid_spacing is None:
+            return 1
+        shape = self._grid.shape[:-1]
+        npixels = max(shape[axis] for axis in self.dims.displayed)
+        return self._stride_for_spacing(npixels / self._grid_canvas_size)
+
+    def _stride_for_spacing(self, scale_factor):
+        """Get the subsampling of image-like data at a zoom level.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Size of a canvas pixel in data coordinates.
+
+        Returns
+        ----------
+        stride : int
+            Smallest power of two keeping the displayed vectors at least
+            `_min_grid_spacing` pixels apart.
+        """
+        if self._min_grid_spacing is None:
+            return 1
+        spacing = self._min_grid_spacing * scale_factor
+        return 2 ** max(int(np.ceil(np.log2(max(spacing, 1)))), 0)
+
+    def _set_grid_stride(self, scale_factor):
+        """Update the subsampling of image-like data for the zoom level.
+
+        Parameters
+        ----------
+        scale_factor : float
+            Size of a canvas pixel in data coordinates.
+        """
+        if self._grid is None:
+            return
+        stride = self._stride_for_spacing(scale_factor)
+        if stride != self._grid_stride:
+            self._grid_stride = stride
+            self.refresh()
 
     def _get_state(self):
         """Get dictionary of layer state.
@@ -163,17 +446,39 @@ class Vectors(Layer):
                 'length': self.length,
                 'edge_width': self.edge_width,
                 'edge_color': self.edge_color,
-                'data': self.data,
+                'data': self.data if self._grid is None else self._grid,
             }
         )
         return state
 
     def _get_ndim(self):
         """Determine number of dimensions of the layer."""
+        if self._grid is not None:
+            return self._grid.ndim - 1
         return self.data.shape[2]
 
     def _get_extent(self):
         """Determine ranges for slicing given by (min, max, step)."""
+        if self._grid is not None:
+            # Combine the pixel positions with the end points of the vectors
+            # one axis at a time, so no coordinate array is created
+            shape = self._grid.shape[:-1]
+            mins = np.zeros(len(shape))
+            maxs = np.subtract(shape, 1).astype(float)
+            if self._grid[..., 0].size > 0:
+                for axis, n in enumerate(shape):
+                    pixels = np.reshape(
+                        np.arange(n), (n,) + (1,) * (len(shape) - axis - 1)
+                    )
+                    ends = pixels + self.length * np.asarray(
+                        self._grid[..., axis]
+                    )
+                    mins[axis] = min(mins[axis], ends.min())
+                    maxs[axis] = max(maxs[axis], ends.max())
+            else:
+                maxs = np.ones(len(shape), dtype=int)
+            return [(min, max, 1) for min, max in zip(mins, maxs)]
+
         if len(self.data) == 0:
             maxs = np.ones(self.data.shape[2], dtype=int)
             mins = np.zeros(self.data.shape[2], dtype=int)
@@ -194,15 +499,7 @@ class Vectors(Layer):
     def edge_width(self, edge_width: Union[int, float]):
         """float: Width for all vectors in pixels."""
         self._edge_width = edge_width
-
-        vertices, triangles = generate_vector_meshes(
-            self.data[:, :, list(self.dims.displayed)],
-            self._edge_width,
-            self.length,
-        )
-        self._mesh_vertices = vertices
-        self._mesh_triangles = triangles
-        self._displayed_stored = copy(self.dims.displayed)
+        self._update_mesh_vertices()
 
         self.events.edge_width()
         self.refresh()
@@ -216,15 +513,7 @@ class Vectors(Layer):
     def length(self, length: Union[int, float]):
         """float: Multiplicative factor for length of all vectors."""
         self._length = length
-
-        vertices, triangles = generate_vector_meshes(
-            self.data[:, :, list(self.dims.displayed)],
-            self.edge_width,
-            self._length,
-        )
-        self._mesh_vertices = vertices
-        self._mesh_triangles = triangles
-        self._displayed_stored = copy(self.dims.displayed)
+        self._update_mesh_vertices()
 
         self.events.length()
         self.refresh()
@@ -243,45 +532,133 @@ class Vectors(Layer):
 
     def _set_view_slice(self):
         """Sets the view given the indices to slice with."""
+        if self._grid is not None:
+            self._set_grid_view()
+            return
 
         if not self.dims.displayed == self._displayed_stored:
+            self._set_meshes()
+
+        if len(self.data) == 0:
+            self._indices_view = np.empty(0, dtype=int)
+        else:
+            self._indices_view = self._slice_indices()
+        self._set_view_faces()
+
+    def _set_grid_view(self):
+        """Sets the view of image-like data, only meshing the vectors in
+        the current slice, subsampled according to the zoom level.
+        """
+        self._view_faces_stale = False
+        data_view, self._indices_view = slice_image_vectors(
+            self._grid,
+            self.dims.indices,
+            self.dims.displayed,
+            stride=self._grid_stride,
+        )
+        self._data_view = data_view
+        if len(data_view) == 0:
+            self._view_vertices = []
+            self._view_faces = []
+        else:
             vertices, triangles = generate_vector_meshes(
-                self.data[:, :, list(self.dims.displayed)],
-                self.edge_width,
-                self.length,
+                data_view, self.edge_width, self.length
             )
-            self._mesh_vertices = vertices
-            self._mesh_triangles = triangles
-            self._displayed_stored = copy(self.dims.displayed)
+            self._view_vertices = vertices
+            self._view_faces = triangles
 
-        vertices = self._mesh_vertices
-        not_disp = list(self.dims.not_displayed)
+    def _slice_indices(self, start=0):
+        """Determines the vectors whose start point is in the current slice.
+
+        Parameters
+        ----------
+        start : int
+            Index of the first vector to consider. Vectors before it are
+            ignored, which allows only newly added vectors to be sliced.
+
+        Returns
+        ----------
+        slice_indices : (M,) array
+            Sorted indices of vectors in the currently viewed slice.
+        """
+        if self.ndim > 2:
+            not_disp = list(self.dims.not_displayed)
+            indices = np.array(self.dims.indices)
+            if start == 0:
+                key = tuple(int(i) for i in indices[not_disp])
+                slice_index = self._get_slice_index(not_disp)
+                return slice_index.get(key, np.empty(0, dtype=int))
+            data = self.data[start:, 0, not_disp].astype('int')
+            matches = np.all(data == indices[not_disp], axis=1)
+            return start + np.where(matches)[0]
+        else:
+            return np.arange(start, len(self.data))
+
+    def _get_slice_index(self, not_disp):
+        """Map from slice coordinates to the vectors starting in that slice.
+
+        The map is built in a single pass over the vectors and kept until the
+        data or the non-displayed axes change, so that moving through the
+        slices only costs the number of vectors in view.
+
+        Parameters
+        ----------
+        not_disp : list of int
+            Non-displayed axes of the vectors.
+
+        Returns
+        -------
+        slice_index : dict
+            Map from a tuple of integer coordinates along `not_disp` to the
+            sorted indices of the vectors starting in that slice.
+        """
+        if self._slice_index is None or self._slice_index[0] != not_disp:
+            coords = self.data[:, 0, not_disp].astype('int')
+            keys, labels = np.unique(coords, axis=0, return_inverse=True)
+            labels = labels.reshape(-1)
+            order = np.argsort(labels, kind='stable')
+            bounds = np.searchsorted(labels[order], np.arange(len(keys) + 1))
+            slice_index = {
+                tuple(key): order[start:stop]
+                for key, start, stop in zip(
+                    keys.tolist(), bounds[:-1], bounds[1:]
+                )
+            }
+            self._slice_index = (list(not_disp), slice_index)
+        return self._slice_index[1]
+
+    def _refresh_view(self):
+        """Send the current view slice to the visual, first updating the
+        faces in view if vectors have been streamed in since the last slice.
+        """
+        if self._view_faces_stale:
+            self._set_view_faces()
+        super()._refresh_view()
+
+    def _set_view_faces(self):
+        """Sets the data, vertices and faces in view from `_indices_view`."""
+        self._view_faces_stale = False
+        matches = self._indices_view
         disp = list(self.dims.displayed)
-        indices = np.array(self.dims.indices)
 
         if len(self.data) == 0:
             faces = []
             self._data_view = np.empty((0, 2, 2))
         elif self.ndim > 2:
-            data = self.data[:, 0, not_disp].astype('int')
-            matches = np.all(data == indices[not_disp], axis=1)
-            matches = np.where(matches)[0]
             self._data_view = self.data[np.ix_(matches, [0, 1], disp)]
             if len(matches) == 0:
                 faces = []
             else:
-                keep_inds = np.repeat(2 * matches, 2)
-                keep_inds[1::2] = keep_inds[1::2] + 1
-                if self.dims.ndisplay == 3:
-                    keep_inds = np.concatenate(
-                        [
-                            keep_inds,
-                            len(self._mesh_triangles) // 2 + keep_inds,
-                        ],
-                        axis=0,
-                    )
-                faces = self._mesh_triangles[keep_inds]
+                # The vertices of each vector are stored together and its
+                # triangles only depend on its position in the view
+                nvertices = 4 if self.dims.ndisplay == 2 else 8
+                vertices = np.reshape(
+                    self._mesh_vertices, (-1, nvertices, len(disp))
+                )[matches]
+                vertices = np.reshape(vertices, (-1, len(disp)))
+                faces = self._vector_triangles(len(matches))
         else:
+            vertices = self._mesh_vertices
             faces = self._mesh_triangles
             self._data_view = self.data[:, :, disp]
 
@@ -293,7 +670,7 @@ class Vectors(Layer):
             self._view_faces = faces
 
     def _update_thumbnail(self):
-        """Update thumbnail with current points and colors."""
+        """Update thumbnail with current vectors and colors."""
         # calculate min vals for the vertices and pad with 0.5
         # the offset is needed to ensure that the top left corner of the
         # vectors corresponds to the top left corner of the thumbnail
@@ -312,28 +689,29 @@ class Vectors(Layer):
         ).astype(int)[-2:]
         zoom_factor = np.divide(self._thumbnail_shape[:2], shape).min()
 
-        vectors = copy(self._data_view[:, :, -2:])
-        if len(vectors) > self._max_vectors_thumbnail:
-            inds = np.random.randint(
-                0, len(vectors), self._max_vectors_thumbnail
-            )
-            vectors = vectors[inds]
-        vectors[:, 1, :] = vectors[:, 0, :] + vectors[:, 1, :] * self.length
-        downsampled = (vectors - offset) * zoom_factor
-        downsampled = np.clip(
-            downsampled, 0, np.subtract(self._thumbnail_shape[:2], 1)
+        # The drawn vectors only change with the slice and the length
+        not_disp = list(self.dims.not_displayed)
+        key = (
+            tuple(self.dims.displayed),
+            tuple(int(i) for i in np.array(self.dims.indices)[not_disp]),
+            self._grid_stride,
+            self.length,
+            tuple(offset),
+            zoom_factor,
         )
+        if self._thumbnail_mask is None or self._thumbnail_mask[0] != key:
+            keep = subsample_indices(
+                len(self._data_view), self._max_vectors_thumbnail
+            )
+            vectors = self._data_view[keep][:, :, -2:]
+            starts = (vectors[:, 0] - offset) * zoom_factor
+            ends = starts + vectors[:, 1] * self.length * zoom_factor
+            mask = rasterize_segments(starts, ends, self._thumbnail_shape[:2])
+            self._thumbnail_mask = (key, mask)
+
         colormapped = np.zeros(self._thumbnail_shape)
         colormapped[..., 3] = 1
-        col = Color(self.edge_color).rgba
-        for v in downsampled:
-            start = v[0]
-            stop = v[1]
-            step = int(np.ceil(np.max(abs(stop - start))))
-            x_vals = np.linspace(start[0], stop[0], step)
-            y_vals = np.linspace(start[1], stop[1], step)
-            for x, y in zip(x_vals, y_vals):
-                colormapped[int(x), int(y), :] = col
+        colormapped[self._thumbnail_mask[1]] = Color(self.edge_color).rgba
         colormapped[..., 3] *= self.opacity
         self.thumbnail = colormapped
 
@@ -162,6 +162,7 @@ def view_points(
     face_colormap='viridis',
     face_contrast_limits=None,
     n_dimensional=False,
+    lod_threshold=None,
     name=None,
     metadata=None,
     scale=None,
@@ -223,6 +224,12 @@ def view_points(
     n_dimensional : bool
         If True, renders points not just in central plane but also in all
         n-dimensions according to specified point marker size.
+    lod_threshold : int, optional
+        Maximum number of points in the current slice that are sent to the
+        canvas. If more points are in the slice they are deterministically
+        decimated according to the current zoom level and field of view, and
+        full detail is restored as the view narrows. If None, all points in
+        the slice are displayed.
     name : str
         Name of the layer.
     metadata : dict
@@ -284,6 +291,7 @@ def view_points(
         face_colormap=face_colormap,
         face_contrast_limits=face_contrast_limits,
         n_dimensional=n_dimensional,
+        lod_threshold=lod_threshold,
         name=name,
         metadata=metadata,
         scale=scale,
@@ -518,6 +526,7 @@ def view_surface(
     colormap='gray',
     contrast_limits=None,
     gamma=1,
+    lod_threshold=None,
     name=None,
     metadata=None,
     scale=None,
@@ -554,6 +563,10 @@ def view_surface(
         the image.
     gamma : float
         Gamma correction for determining colormap linearity. Defaults to 1.
+    lod_threshold : int, optional
+        Maximum number of faces in the current slice that are sent to the
+        canvas. If more faces are in the slice a decimated mesh is
+        displayed. If None, the full mesh is displayed.
     name : str
         Name of the layer.
     metadata : dict
@@ -600,6 +613,7 @@ def view_surface(
         colormap=colormap,
         contrast_limits=contrast_limits,
         gamma=gamma,
+        lod_threshold=lod_threshold,
         name=name,
         metadata=metadata,
         scale=scale,